@@ -6,7 +6,9 @@ This example demonstrates how to set up Selenium WebDriver and open a browser.
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_cache import get_driver_path
+from driver_factory import create_driver, select_profile_from_argv
+from waits import wait_for_page_load
 
 def basic_setup_example():
     """
@@ -17,18 +19,20 @@ def basic_setup_example():
     4. Close the browser
     """
     
-    # Method 1: Using webdriver-manager (Recommended - handles driver automatically)
+    # Method 1: Using the driver factory (Recommended - cached driver binary plus a named profile)
+    # Pick the profile with --profile or SELENIUM_PROFILE: fast-headless, debug or visual
     print("Setting up Chrome WebDriver...")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
+    print(f"Profile: {driver.profile}, cold start: {driver.cold_start:.2f}s")
     
     # Method 2: Manual setup (if you have driver in PATH)
     # driver = webdriver.Chrome()
     
-    # Method 3: With custom options
+    # Method 3: With custom options (driver_factory.PROFILES holds tuned sets of these)
     # chrome_options = Options()
     # chrome_options.add_argument("--headless")  # Run without opening browser
     # chrome_options.add_argument("--start-maximized")  # Maximize window
-    # driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    # driver = webdriver.Chrome(service=Service(get_driver_path()), options=chrome_options)
     
     try:
         # Navigate to a webpage
@@ -43,9 +47,8 @@ def basic_setup_example():
         current_url = driver.current_url
         print(f"Current URL: {current_url}")
         
-        # Wait a bit to see the page (for learning purposes)
-        import time
-        time.sleep(3)
+        # Wait until the page has fully loaded (event-driven, no fixed sleep)
+        wait_for_page_load(driver)
         
     finally:
         # Always close the browser
@@ -53,5 +56,6 @@ def basic_setup_example():
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     basic_setup_example()
 
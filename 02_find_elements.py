@@ -3,11 +3,13 @@ Selenium Learning - Level 1: Finding Elements
 This example demonstrates different ways to locate elements on a webpage.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from element_collection import ElementCollection
+from fixture_server import base_url
+from waits import wait_for_element
+
+BASE_URL = base_url()
 
 def find_elements_example():
     """
@@ -21,12 +23,12 @@ def find_elements_example():
     - By XPath
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
     
     try:
         # Navigate to a test page
-        driver.get("https://the-internet.herokuapp.com/login")
-        time.sleep(2)
+        driver.get(f"{BASE_URL}/login")
+        wait_for_element(driver, (By.ID, "username"))
         
         # Method 1: Find by ID
         username_field = driver.find_element(By.ID, "username")
@@ -61,15 +63,20 @@ def find_elements_example():
         print(f"Found element by XPath: {xpath_element.text}")
         
         # Find multiple elements
-        all_links = driver.find_elements(By.TAG_NAME, "a")
+        # ElementCollection reads a value for every element in one script call,
+        # instead of one .text / get_attribute() command per link
+        all_links = ElementCollection.find(driver, By.TAG_NAME, "a")
         print(f"\nTotal links on page: {len(all_links)}")
-        for i, link in enumerate(all_links[:5], 1):  # Show first 5
-            print(f"  Link {i}: {link.text}")
+        texts = all_links.texts()
+        hrefs = [link["href"] for link in all_links.props(["href"])]  # resolved, like get_attribute
+        for i, (text, href) in enumerate(zip(texts[:5], hrefs[:5]), 1):  # Show first 5
+            print(f"  Link {i}: {text} -> {href}")
+        print(f"  ({all_links.round_trips} script calls for {len(all_links)} links)")
         
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     find_elements_example()
 
@@ -3,12 +3,13 @@ Selenium Learning - Level 1: Basic Interactions
 This example demonstrates how to interact with web elements.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from waits import wait_for_element
+
+BASE_URL = base_url()
 
 def interactions_example():
     """
@@ -20,12 +21,12 @@ def interactions_example():
     - Getting element attributes and text
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
     
     try:
         # Navigate to a test page
-        driver.get("https://the-internet.herokuapp.com/login")
-        time.sleep(2)
+        driver.get(f"{BASE_URL}/login")
+        wait_for_element(driver, (By.ID, "username"))
         
         # Find elements
         username_field = driver.find_element(By.ID, "username")
@@ -48,10 +49,8 @@ def interactions_example():
         print("Clicking login button...")
         login_button.click()
         
-        time.sleep(2)
-        
         # Check if login was successful
-        success_message = driver.find_element(By.ID, "flash")
+        success_message = wait_for_element(driver, (By.ID, "flash"))
         print(f"\nLogin result: {success_message.text}")
         
         # Interaction 5: Keyboard actions
@@ -61,17 +60,15 @@ def interactions_example():
         search_box.send_keys("Selenium WebDriver")
         search_box.send_keys(Keys.RETURN)  # Press Enter
         
-        time.sleep(2)
-        
         # Interaction 6: Get element attributes
-        first_result = driver.find_element(By.CSS_SELECTOR, "h3")
+        first_result = wait_for_element(driver, (By.CSS_SELECTOR, "h3"))
         print(f"\nFirst result text: {first_result.text}")
         print(f"First result tag: {first_result.tag_name}")
         
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     interactions_example()
 
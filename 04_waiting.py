@@ -3,13 +3,14 @@ Selenium Learning - Level 2: Waiting Strategies
 This example demonstrates different waiting strategies in Selenium.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from waits import wait_for_text
+
+BASE_URL = base_url()
 
 def waiting_example():
     """
@@ -19,7 +20,7 @@ def waiting_example():
     - Expected conditions
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
     
     try:
         # Method 1: Implicit Wait
@@ -27,7 +28,7 @@ def waiting_example():
         print("Setting implicit wait to 10 seconds...")
         driver.implicitly_wait(10)
         
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/1")
+        driver.get(f"{BASE_URL}/dynamic_loading/1")
         
         # Method 2: Explicit Wait with WebDriverWait
         # More precise - waits for specific conditions
@@ -44,7 +45,7 @@ def waiting_example():
         print(f"Dynamic content loaded: {finish_text.text}")
         
         # Method 3: Different Expected Conditions
-        driver.get("https://the-internet.herokuapp.com/dynamic_loading/2")
+        driver.get(f"{BASE_URL}/dynamic_loading/2")
         
         start_button = driver.find_element(By.CSS_SELECTOR, "button")
         start_button.click()
@@ -61,6 +62,12 @@ def waiting_example():
         )
         print(f"Element is visible: {element.text}")
         
+        # Method 4: Event-driven wait (see waits.py)
+        # Re-checks the condition inside the page on every DOM change and
+        # returns in one round trip instead of polling every 0.5 seconds
+        element = wait_for_text(driver, (By.ID, "finish"), "Hello World!")
+        print(f"Event-driven wait resolved: {element.text}")
+        
         # Common Expected Conditions:
         # - presence_of_element_located: Element exists in DOM
         # - visibility_of_element_located: Element is visible
@@ -70,9 +77,9 @@ def waiting_example():
         # - alert_is_present: Alert is present
         
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     waiting_example()
 
@@ -3,12 +3,14 @@ Selenium Learning - Level 2: Working with Forms
 This example demonstrates how to interact with various form elements.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from page_objects import fill_form
+from waits import wait_for_url_contains
+
+BASE_URL = base_url()
 
 def forms_example():
     """
@@ -18,14 +20,15 @@ def forms_example():
     - Radio buttons
     - Dropdowns/Select elements
     - File uploads
+    - Filling a whole form in one call
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
     
     try:
         # Example 1: Text inputs and checkboxes
         print("Example 1: Text inputs and checkboxes")
-        driver.get("https://the-internet.herokuapp.com/login")
+        driver.get(f"{BASE_URL}/login")
         
         username = driver.find_element(By.ID, "username")
         password = driver.find_element(By.ID, "password")
@@ -36,11 +39,11 @@ def forms_example():
         login_button = driver.find_element(By.CSS_SELECTOR, "button.radius")
         login_button.click()
         
-        time.sleep(2)
+        wait_for_url_contains(driver, "/secure")
         
         # Example 2: Checkboxes
         print("\nExample 2: Working with checkboxes")
-        driver.get("https://the-internet.herokuapp.com/checkboxes")
+        driver.get(f"{BASE_URL}/checkboxes")
         
         checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
         
@@ -58,11 +61,9 @@ def forms_example():
             checkboxes[1].click()
             print("Unchecked checkbox 2")
         
-        time.sleep(2)
-        
         # Example 3: Dropdown/Select elements
         print("\nExample 3: Working with dropdowns")
-        driver.get("https://the-internet.herokuapp.com/dropdown")
+        driver.get(f"{BASE_URL}/dropdown")
         
         dropdown = Select(driver.find_element(By.ID, "dropdown"))
         
@@ -84,11 +85,9 @@ def forms_example():
         dropdown.select_by_index(2)
         print(f"Selected: {dropdown.first_selected_option.text}")
         
-        time.sleep(2)
-        
         # Example 4: Radio buttons
         print("\nExample 4: Working with radio buttons")
-        driver.get("https://the-internet.herokuapp.com/radio_buttons")
+        driver.get(f"{BASE_URL}/radio_buttons")
         
         radio_buttons = driver.find_elements(By.NAME, "radio")
         
@@ -100,10 +99,27 @@ def forms_example():
             radio_buttons[1].click()
             print(f"\nSelected radio button: {radio_buttons[1].get_attribute('value')}")
         
+        # Example 5: Filling a whole form in one call
+        # fill_form sets every field, fires input/change events and submits
+        # with a single script call instead of one command per field.
+        # Pass faithful=True if the page needs real key events.
+        print("\nExample 5: Bulk form fill")
+        driver.get(f"{BASE_URL}/login")
+        
+        fill_form(
+            driver,
+            {
+                (By.ID, "username"): "tomsmith",
+                (By.ID, "password"): "SuperSecretPassword!",
+            },
+            submit=(By.CSS_SELECTOR, "button.radius"),
+        )
+        print(f"Logged in via bulk fill: {wait_for_url_contains(driver, '/secure')}")
+        
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     forms_example()
 
@@ -3,10 +3,9 @@ Selenium Learning - Level 2: Browser Navigation
 This example demonstrates browser navigation and controls.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from dom_snapshot import DomSnapshotter, document_length
+from driver_factory import create_driver, select_profile_from_argv
+from waits import wait_for_page_load
 
 def navigation_example():
     """
@@ -18,7 +17,9 @@ def navigation_example():
     - Getting page information
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
+    # Records the DOM after each step: full once per document, then only diffs
+    dom = DomSnapshotter(driver, "navigation_dom.jsonl.gz")
     
     try:
         # Navigation 1: Get (navigate to URL)
@@ -26,39 +27,35 @@ def navigation_example():
         driver.get("https://www.google.com")
         print(f"Current URL: {driver.current_url}")
         print(f"Page title: {driver.title}")
-        
-        time.sleep(2)
+        dom.snapshot("google")
         
         # Navigation 2: Navigate to another page
         print("\nNavigating to GitHub...")
         driver.get("https://github.com")
         print(f"Current URL: {driver.current_url}")
         print(f"Page title: {driver.title}")
-        
-        time.sleep(2)
+        dom.snapshot("github")
         
         # Navigation 3: Browser back
         print("\nGoing back...")
         driver.back()
+        wait_for_page_load(driver)
         print(f"Current URL: {driver.current_url}")
         print(f"Page title: {driver.title}")
         
-        time.sleep(2)
-        
         # Navigation 4: Browser forward
         print("\nGoing forward...")
         driver.forward()
+        wait_for_page_load(driver)
         print(f"Current URL: {driver.current_url}")
         print(f"Page title: {driver.title}")
         
-        time.sleep(2)
-        
         # Navigation 5: Refresh page
         print("\nRefreshing page...")
         driver.refresh()
+        wait_for_page_load(driver)
         print("Page refreshed")
-        
-        time.sleep(2)
+        dom.snapshot("refreshed")
         
         # Window Management
         print("\nWindow Management:")
@@ -73,18 +70,24 @@ def navigation_example():
         driver.set_window_size(1024, 768)
         print(f"Window size set to: {driver.get_window_size()}")
         
-        # Get page source (HTML)
-        page_source_length = len(driver.page_source)
+        # Get page source length (measured in the page, without transferring the HTML)
+        page_source_length = document_length(driver)
         print(f"\nPage source length: {page_source_length} characters")
         
+        # Only the changes since the last snapshot of this document are sent
+        step = dom.snapshot("after window changes")
+        print(f"DOM snapshot: {step['type']}, {step['ops']} changes, {step['chars']} characters")
+        
         # Get current window handle
         current_window = driver.current_window_handle
         print(f"Current window handle: {current_window}")
         
     finally:
-        time.sleep(2)
+        dom.close()
         driver.quit()
+        print(f"DOM snapshots written to navigation_dom.jsonl.gz: {dom.stats()}")
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     navigation_example()
 
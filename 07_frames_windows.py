@@ -3,13 +3,13 @@ Selenium Learning - Level 3: Frames and Multiple Windows
 This example demonstrates handling frames and multiple browser windows.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from frames import FrameNavigator
+from windows import WindowRegistry
+
+BASE_URL = base_url()
 
 def frames_windows_example():
     """
@@ -19,96 +19,82 @@ def frames_windows_example():
     - Window handles
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
+    # Tracks the current frame so redundant switches are never sent
+    frames = FrameNavigator(driver)
+    # Follows windows and tabs through browser events instead of polling window_handles
+    windows = WindowRegistry(driver)
     
     try:
         # Example 1: Working with frames
         print("Example 1: Working with frames")
-        driver.get("https://the-internet.herokuapp.com/iframe")
-        
-        # Switch to frame by name or ID
-        iframe = driver.find_element(By.ID, "mce_0_ifr")
-        driver.switch_to.frame(iframe)
-        
-        # Now we're inside the frame, interact with elements
-        editor = driver.find_element(By.ID, "tinymce")
-        print(f"Editor text before: {editor.text}")
-        
-        # Clear and type new text
-        editor.clear()
-        editor.send_keys("Hello from Selenium! This text is inside an iframe.")
-        print(f"Editor text after: {editor.text}")
-        
-        # Switch back to default content (main page)
-        driver.switch_to.default_content()
+        driver.get(f"{BASE_URL}/iframe")
+        
+        # Work inside the frame (by name or ID); the main page is restored afterwards
+        with frames.frame("mce_0_ifr"):
+            editor = driver.find_element(By.ID, "tinymce")
+            print(f"Editor text before: {editor.text}")
+            
+            # Clear and type new text
+            editor.clear()
+            editor.send_keys("Hello from Selenium! This text is inside an iframe.")
         print("Switched back to main page")
         
-        time.sleep(2)
+        # Entering the frame again reuses the cached frame element (no find command)
+        with frames.frame("mce_0_ifr"):
+            print(f"Editor text after: {editor.text}")
+            
+            # Already inside this frame: the nested block sends no switch at all
+            with frames.at("mce_0_ifr"):
+                print("Still in the editor frame")
+        print(f"Frame switching: {frames.stats()}")
         
         # Example 2: Multiple windows/tabs
         print("\nExample 2: Handling multiple windows")
-        driver.get("https://the-internet.herokuapp.com/windows")
+        driver.get(f"{BASE_URL}/windows")
         
         # Get current window handle
         main_window = driver.current_window_handle
         print(f"Main window handle: {main_window}")
         
-        # Click link that opens new window
-        link = driver.find_element(By.LINK_TEXT, "Click Here")
-        link.click()
-        
-        # Wait for new window to open
-        WebDriverWait(driver, 10).until(EC.number_of_windows_to_be(2))
+        # The registry hears about the new window from the browser: no polling,
+        # and no comparing handle lists to find it
+        with windows.expect_new() as new_window:
+            link = driver.find_element(By.LINK_TEXT, "Click Here")
+            link.click()
+        print(f"Total windows: {len(windows.handles())}")
         
-        # Get all window handles
-        all_windows = driver.window_handles
-        print(f"Total windows: {len(all_windows)}")
+        # Title and URL are tracked from browser events, without switching or commands
+        info = windows.wait_for(new_window.handle, lambda w: w["title"] == "New Window")
+        print(f"New window title: {info['title']}")
+        print(f"New window URL: {info['url']}")
         
         # Switch to new window
-        for window in all_windows:
-            if window != main_window:
-                driver.switch_to.window(window)
-                print(f"Switched to new window: {window}")
-                print(f"New window title: {driver.title}")
-                print(f"New window URL: {driver.current_url}")
-                
-                # Interact with new window
-                new_window_text = driver.find_element(By.TAG_NAME, "h3")
-                print(f"New window content: {new_window_text.text}")
-                
-                # Close new window
-                driver.close()
-                break
+        driver.switch_to.window(new_window.handle)
+        print(f"Switched to new window: {new_window.handle}")
         
-        # Switch back to main window
-        driver.switch_to.window(main_window)
-        print(f"\nSwitched back to main window: {driver.title}")
+        # Interact with new window
+        new_window_text = driver.find_element(By.TAG_NAME, "h3")
+        print(f"New window content: {new_window_text.text}")
         
-        time.sleep(2)
+        # Close new window and switch back to main window
+        windows.close(new_window.handle, switch_to=main_window)
+        print(f"\nSwitched back to main window: {windows.title(main_window)}")
         
-        # Example 3: Opening new tab with JavaScript
+        # Example 3: Opening a new tab (one command, returns its handle)
         print("\nExample 3: Opening new tab")
-        driver.execute_script("window.open('https://www.google.com', '_blank');")
-        
-        # Wait for new tab
-        WebDriverWait(driver, 10).until(EC.number_of_windows_to_be(2))
-        
-        # Switch to new tab
-        all_windows = driver.window_handles
-        for window in all_windows:
-            if window != main_window:
-                driver.switch_to.window(window)
-                print(f"Switched to new tab: {driver.title}")
-                driver.close()
-                break
+        tab = windows.open_tab("https://www.google.com")
+        info = windows.wait_for(tab, lambda w: "Google" in w["title"])
+        print(f"Switched to new tab: {info['title']}")
         
-        # Back to main window
-        driver.switch_to.window(main_window)
+        # Close it and go back to the main window
+        windows.close(tab, switch_to=main_window)
+        print(f"Window events: {windows.stats()}")
         
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     frames_windows_example()
 
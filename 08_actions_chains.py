@@ -3,13 +3,16 @@ Selenium Learning - Level 3: Advanced Actions
 This example demonstrates ActionChains for complex interactions.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from action_macros import ActionMacros
+from dialogs import DialogPolicy
+from element_cache import ElementCache
+from waits import wait_for_element
+
+BASE_URL = base_url()
 
 def actions_chains_example():
     """
@@ -22,66 +25,72 @@ def actions_chains_example():
     - Click and hold
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    actions = ActionChains(driver)
+    driver = create_driver()
+    
+    # Each interaction is compiled once into a W3C actions payload;
+    # playing it fills in the elements/text and sends a single command
+    macros = ActionMacros(driver)
+    macros.define("hover", lambda chain, p: chain.move_to_element(p.target))
+    macros.define("drag_and_drop", lambda chain, p: chain.drag_and_drop(p.source, p.target))
+    macros.define("context_click", lambda chain, p: chain.context_click(p.target))
+    macros.define("double_click", lambda chain, p: chain.double_click(p.target))
+    macros.define("select_all_and_type", lambda chain, p: (
+        chain.click(p.field).key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).send_keys(p.text("text"))))
+    macros.define("hold_and_move", lambda chain, p: (
+        chain.click_and_hold(p.source).move_to_element(p.target).release()))
+    
+    # Answers dialogs as they open (see Example 3)
+    dialogs = DialogPolicy(driver)
+    
+    # Cache element handles; navigations and switches invalidate it automatically
+    cache = ElementCache(driver)
     
     try:
         # Example 1: Mouse hover
         print("Example 1: Mouse hover")
-        driver.get("https://the-internet.herokuapp.com/hovers")
+        driver.get(f"{BASE_URL}/hovers")
         
         # Find avatar elements
         avatars = driver.find_elements(By.CSS_SELECTOR, ".figure")
         
         # Hover over first avatar
-        actions.move_to_element(avatars[0]).perform()
-        time.sleep(1)
+        macros.play("hover", target=avatars[0])
         
         # Check if user info appears
-        user_info = driver.find_element(By.CSS_SELECTOR, ".figcaption h5")
+        user_info = wait_for_element(driver, (By.CSS_SELECTOR, ".figcaption h5"), visible=True)
         print(f"User info on hover: {user_info.text}")
         
-        time.sleep(2)
-        
         # Example 2: Drag and drop
         print("\nExample 2: Drag and drop")
-        driver.get("https://the-internet.herokuapp.com/drag_and_drop")
+        driver.get(f"{BASE_URL}/drag_and_drop")
         
-        box_a = driver.find_element(By.ID, "column-a")
-        box_b = driver.find_element(By.ID, "column-b")
+        box_a = cache.find(By.ID, "column-a")
+        box_b = cache.find(By.ID, "column-b")
         
         print(f"Box A text before: {box_a.text}")
         print(f"Box B text before: {box_b.text}")
         
         # Perform drag and drop
-        actions.drag_and_drop(box_a, box_b).perform()
-        
-        time.sleep(1)
+        macros.play("drag_and_drop", source=box_a, target=box_b)
         
-        # Verify swap
-        box_a = driver.find_element(By.ID, "column-a")
-        box_b = driver.find_element(By.ID, "column-b")
+        # Verify swap (same document, so both lookups are cache hits)
+        box_a = cache.find(By.ID, "column-a")
+        box_b = cache.find(By.ID, "column-b")
         print(f"Box A text after: {box_a.text}")
         print(f"Box B text after: {box_b.text}")
         
-        time.sleep(2)
-        
         # Example 3: Right-click (context click)
         print("\nExample 3: Right-click")
-        driver.get("https://the-internet.herokuapp.com/context_menu")
+        driver.get(f"{BASE_URL}/context_menu")
         
         hot_spot = driver.find_element(By.ID, "hot-spot")
         
-        # Right-click on element
-        actions.context_click(hot_spot).perform()
-        time.sleep(1)
-        
-        # Handle alert
-        alert = driver.switch_to.alert
-        print(f"Alert text: {alert.text}")
-        alert.accept()
+        # Right-click on element; the alert it opens is accepted as soon as it appears
+        dialogs.expect("You selected a context menu", "accept")
+        macros.play("context_click", target=hot_spot)
         
-        time.sleep(2)
+        alert = dialogs.wait_handled()
+        print(f"Alert text: {alert['message']}")
         
         # Example 4: Double-click
         print("\nExample 4: Double-click")
@@ -90,45 +99,37 @@ def actions_chains_example():
         search_box.send_keys("selenium")
         
         # Double-click to select all text
-        actions.double_click(search_box).perform()
-        time.sleep(1)
+        macros.play("double_click", target=search_box)
         
         # Type new text (replaces selected text)
         search_box.send_keys("python")
         search_box.send_keys(Keys.RETURN)
         
-        time.sleep(2)
-        
         # Example 5: Keyboard combinations
         print("\nExample 5: Keyboard combinations")
         driver.get("https://www.google.com")
         search_box = driver.find_element(By.NAME, "q")
         
-        # Ctrl+A (select all)
-        actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
-        time.sleep(1)
-        
-        # Type new search
-        search_box.send_keys("webdriver")
-        search_box.send_keys(Keys.RETURN)
-        
-        time.sleep(2)
+        # Focus the box, Ctrl+A (select all), then type the new search, in one command
+        macros.play("select_all_and_type", field=search_box, text="webdriver" + Keys.RETURN)
         
         # Example 6: Click and hold
         print("\nExample 6: Click and hold")
-        driver.get("https://the-internet.herokuapp.com/drag_and_drop")
+        driver.get(f"{BASE_URL}/drag_and_drop")
         
-        box_a = driver.find_element(By.ID, "column-a")
-        box_b = driver.find_element(By.ID, "column-b")
+        box_a = cache.find(By.ID, "column-a")
+        box_b = cache.find(By.ID, "column-b")
         
         # Click and hold, then move
-        actions.click_and_hold(box_a).move_to_element(box_b).release().perform()
+        macros.play("hold_and_move", source=box_a, target=box_b)
         
-        time.sleep(2)
+        print(f"\nElement cache: {cache.stats()}")
+        print(f"Action macros: {macros.stats()}")
         
     finally:
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     actions_chains_example()
 
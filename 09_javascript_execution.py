@@ -3,11 +3,14 @@ Selenium Learning - Level 3: JavaScript Execution
 This example demonstrates executing JavaScript in Selenium.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from scripts import ScriptRegistry
+from table_extract import extract_table, iter_table_chunks
+from waits import wait_for_element
+
+BASE_URL = base_url()
 
 def javascript_execution_example():
     """
@@ -17,37 +20,51 @@ def javascript_execution_example():
     - Getting element values
     - Executing custom JavaScript
     - Highlighting elements
+    - Reading a whole table in a few calls
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver()
+    
+    # Helpers are installed in each new document once and called by name,
+    # so their source is not sent with every call
+    scripts = ScriptRegistry(driver)
     
     try:
         # Example 1: Scroll to element
         print("Example 1: Scrolling to element")
-        driver.get("https://the-internet.herokuapp.com/large")
+        driver.get(f"{BASE_URL}/large")
         
         # Find element at bottom
         element = driver.find_element(By.ID, "large-table")
         
         # Scroll element into view
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        scripts.call("scrollIntoView", element)
         print("Scrolled to element")
         
-        time.sleep(2)
-        
         # Example 2: Scroll to bottom of page
         print("\nExample 2: Scroll to bottom")
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        scripts.call("scrollToBottom")
         print("Scrolled to bottom")
         
-        time.sleep(2)
-        
         # Example 3: Scroll to top
         print("\nExample 3: Scroll to top")
-        driver.execute_script("window.scrollTo(0, 0);")
+        scripts.call("scrollToTop")
         print("Scrolled to top")
         
-        time.sleep(2)
+        # Example 3b: Read the whole table in-page, chunk by chunk
+        # (find_elements + .text would be one command per cell: 2,500 here)
+        print("\nExample 3b: Extracting the large table")
+        table = extract_table(driver, (By.ID, "large-table"), chunk_rows=20)
+        print(f"Table shape: {table.shape} in {table.round_trips} script calls")
+        print(f"First row: {table.row(0)[:5]}...")
+        assert (table["1"] == [f"{row}.1" for row in range(1, len(table) + 1)]).all()
+        print("Column 1 verified with one vectorized comparison")
+        
+        # Streaming: check each chunk as it arrives instead of building the table
+        empty_cells = 0
+        for chunk in iter_table_chunks(driver, (By.ID, "large-table"), chunk_rows=20):
+            empty_cells += sum(value == "" for column in chunk["columns"] for value in column)
+        print(f"Empty cells: {empty_cells}")
         
         # Example 4: Get page title with JavaScript
         print("\nExample 4: Getting values with JavaScript")
@@ -60,65 +77,46 @@ def javascript_execution_example():
         
         # Example 5: Change element style (highlight)
         print("\nExample 5: Highlighting element")
-        driver.get("https://the-internet.herokuapp.com/login")
+        driver.get(f"{BASE_URL}/login")
         
         username_field = driver.find_element(By.ID, "username")
         
         # Highlight element with yellow background
-        driver.execute_script(
-            "arguments[0].style.backgroundColor = 'yellow';",
-            username_field
-        )
+        scripts.call("highlight", username_field, "yellow")
         print("Element highlighted")
         
-        time.sleep(2)
-        
         # Remove highlight
-        driver.execute_script(
-            "arguments[0].style.backgroundColor = '';",
-            username_field
-        )
+        scripts.call("highlight", username_field, "")
         
         # Example 6: Set element value
         print("\nExample 6: Setting value with JavaScript")
-        driver.execute_script(
-            "arguments[0].value = 'test_user';",
-            username_field
-        )
+        scripts.call("setValue", username_field, "test_user")
         print(f"Username field value: {username_field.get_attribute('value')}")
         
         # Example 7: Click element with JavaScript
         print("\nExample 7: Clicking with JavaScript")
         password_field = driver.find_element(By.ID, "password")
-        driver.execute_script("arguments[0].value = 'test_password';", password_field)
+        scripts.call("setValue", password_field, "test_password")
         
         login_button = driver.find_element(By.CSS_SELECTOR, "button.radius")
-        driver.execute_script("arguments[0].click();", login_button)
-        
-        time.sleep(2)
+        scripts.call("click", login_button)
         
         # Example 8: Get element text with JavaScript
         print("\nExample 8: Getting element text")
-        flash_message = driver.find_element(By.ID, "flash")
-        text = driver.execute_script("return arguments[0].textContent;", flash_message)
+        flash_message = wait_for_element(driver, (By.ID, "flash"))
+        text = scripts.call("text", flash_message)
         print(f"Flash message text: {text.strip()}")
         
         # Example 9: Execute complex JavaScript
         print("\nExample 9: Complex JavaScript")
-        result = driver.execute_script("""
-            return {
-                title: document.title,
-                url: window.location.href,
-                width: window.innerWidth,
-                height: window.innerHeight
-            };
-        """)
+        result = scripts.call("pageInfo")
         print(f"Page info: {result}")
+        print(f"Script helpers: {scripts.stats()}")
         
     finally:
-        time.sleep(2)
         driver.quit()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     javascript_execution_example()
 
@@ -3,14 +3,16 @@ Selenium Learning - Level 3: Screenshots and Alerts
 This example demonstrates taking screenshots and handling alerts.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import os
+from artifact_store import ArtifactStore
+from dialogs import DialogPolicy
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from screenshots import ScreenshotService
+from visual_diff import compare_directories
+from waits import wait_for_url_contains
+
+BASE_URL = base_url()
 
 def screenshots_alerts_example():
     """
@@ -22,95 +24,90 @@ def screenshots_alerts_example():
     - Handling prompt dialogs
     """
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    # Dialogs the policy misses are dismissed by the driver, like the policy's default
+    driver = create_driver(prompt_behavior="dismiss")
+    
+    # Dialogs are answered the moment they open, from the expectations declared below
+    dialogs = DialogPolicy(driver, default="dismiss")
+    
+    # Screenshots are decoded on background threads and stored by content hash,
+    # so identical captures from earlier runs are not written again
+    screenshots_dir = "screenshots"
+    store = ArtifactStore("artifacts")
+    shots = ScreenshotService(store=store, test="screenshots_alerts_example")
     
     try:
-        # Create screenshots directory if it doesn't exist
-        screenshots_dir = "screenshots"
-        if not os.path.exists(screenshots_dir):
-            os.makedirs(screenshots_dir)
-        
         # Example 1: Full page screenshot
         print("Example 1: Taking full page screenshot")
-        driver.get("https://the-internet.herokuapp.com/login")
+        driver.get(f"{BASE_URL}/login")
         driver.maximize_window()
         
-        screenshot_path = os.path.join(screenshots_dir, "full_page.png")
-        driver.save_screenshot(screenshot_path)
-        print(f"Screenshot saved to: {screenshot_path}")
-        
-        time.sleep(2)
+        screenshot = shots.capture(driver, "full_page.png")
+        print("Screenshot queued: full_page.png")
         
         # Example 2: Element screenshot
         print("\nExample 2: Taking element screenshot")
         login_form = driver.find_element(By.CSS_SELECTOR, "form")
         
-        element_screenshot_path = os.path.join(screenshots_dir, "login_form.png")
-        login_form.screenshot(element_screenshot_path)
-        print(f"Element screenshot saved to: {element_screenshot_path}")
+        shots.capture(login_form, "login_form.png")
+        print("Element screenshot queued: login_form.png")
         
-        time.sleep(2)
+        # A capture's future resolves once that file is on disk
+        print(f"Screenshot saved to: {screenshot.result()}")
         
         # Example 3: Handling JavaScript Alert
         print("\nExample 3: Handling JavaScript Alert")
-        driver.get("https://the-internet.herokuapp.com/javascript_alerts")
+        driver.get(f"{BASE_URL}/javascript_alerts")
         
-        # Click button that triggers alert
+        # Declare the alert and its answer (click OK), then trigger it
+        dialogs.expect("I am a JS Alert", "accept")
         alert_button = driver.find_element(By.CSS_SELECTOR, "button[onclick='jsAlert()']")
         alert_button.click()
         
-        # Wait for alert and switch to it
-        alert = WebDriverWait(driver, 10).until(EC.alert_is_present())
-        print(f"Alert text: {alert.text}")
-        
-        # Accept alert (click OK)
-        alert.accept()
+        # Already answered by the time it is logged; no alert_is_present polling
+        alert = dialogs.wait_handled()
+        print(f"Alert text: {alert['message']}")
         print("Alert accepted")
         
         # Verify result
         result = driver.find_element(By.ID, "result")
         print(f"Result: {result.text}")
         
-        time.sleep(2)
-        
         # Example 4: Handling Confirm Dialog
         print("\nExample 4: Handling Confirm Dialog")
+        # Dismiss confirm (click Cancel)
+        dialogs.expect("I am a JS Confirm", "dismiss")
         confirm_button = driver.find_element(By.CSS_SELECTOR, "button[onclick='jsConfirm()']")
         confirm_button.click()
         
-        confirm = WebDriverWait(driver, 10).until(EC.alert_is_present())
-        print(f"Confirm text: {confirm.text}")
-        
-        # Dismiss confirm (click Cancel)
-        confirm.dismiss()
+        confirm = dialogs.wait_handled()
+        print(f"Confirm text: {confirm['message']}")
         print("Confirm dismissed")
         
         result = driver.find_element(By.ID, "result")
         print(f"Result: {result.text}")
         
-        time.sleep(2)
-        
         # Example 5: Handling Prompt Dialog
         print("\nExample 5: Handling Prompt Dialog")
+        # Send text to prompt (and accept it)
+        dialogs.expect("I am a JS prompt", text="Hello from Selenium!")
         prompt_button = driver.find_element(By.CSS_SELECTOR, "button[onclick='jsPrompt()']")
         prompt_button.click()
         
-        prompt = WebDriverWait(driver, 10).until(EC.alert_is_present())
-        print(f"Prompt text: {prompt.text}")
-        
-        # Send text to prompt
-        prompt.send_keys("Hello from Selenium!")
-        prompt.accept()
+        prompt = dialogs.wait_handled()
+        print(f"Prompt text: {prompt['message']}")
         print("Prompt accepted with text")
         
+        # Every dialog was expected and answered as declared
+        dialogs.verify()
+        print(f"Dialogs: {dialogs.stats()}")
+        
         result = driver.find_element(By.ID, "result")
         print(f"Result: {result.text}")
         
-        time.sleep(2)
-        
         # Example 6: Screenshot after interaction
         print("\nExample 6: Screenshot after interaction")
-        driver.get("https://the-internet.herokuapp.com/login")
+        driver.get(f"{BASE_URL}/login")
         
         username = driver.find_element(By.ID, "username")
         password = driver.find_element(By.ID, "password")
@@ -120,23 +117,39 @@ def screenshots_alerts_example():
         password.send_keys("SuperSecretPassword!")
         
         # Screenshot before login
-        before_login_path = os.path.join(screenshots_dir, "before_login.png")
-        driver.save_screenshot(before_login_path)
-        print(f"Screenshot before login: {before_login_path}")
+        shots.capture(driver, "before_login.png")
+        print("Screenshot before login queued")
         
         login_button.click()
-        time.sleep(2)
+        wait_for_url_contains(driver, "/secure")
         
         # Screenshot after login
-        after_login_path = os.path.join(screenshots_dir, "after_login.png")
-        driver.save_screenshot(after_login_path)
-        print(f"Screenshot after login: {after_login_path}")
+        shots.capture(driver, "after_login.png")
+        print("Screenshot after login queued")
         
     finally:
-        time.sleep(2)
         driver.quit()
-        print(f"\nAll screenshots saved in '{screenshots_dir}' directory")
+        try:
+            # Flush at teardown so no queued screenshot is lost
+            failures = shots.close()
+            stats = shots.stats()
+            
+            # Named copies of this run for browsing (hard links into the store)
+            store.export(store.run_id, screenshots_dir)
+            print(f"\n{stats['written']} screenshots of run {store.run_id} in '{screenshots_dir}' directory"
+                  f" ({len(failures)} failed, {store.deduplicated} already stored)")
+            print(f"Test thread spent {stats['capture_s']:.2f}s capturing; "
+                  f"workers spent {stats['encode_s']:.2f}s decoding and writing")
+            
+            # Visual regression check against stored baselines (first run adopts them)
+            baselines_dir = "baselines"
+            print(f"\nComparing with '{baselines_dir}':")
+            for name, result in compare_directories(screenshots_dir, baselines_dir, diff_dir="diffs", update_missing=True):
+                print(f"  {'✓' if result['match'] else '✗'} {name}: {result['reason'] or 'matches'}")
+        finally:
+            store.close()
 
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     screenshots_alerts_example()
 
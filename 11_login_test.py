@@ -3,13 +3,22 @@ Selenium Learning - Level 4: Real-world Test Example
 Complete login flow test with assertions and error handling.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+import sys
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from async_runner import print_summary, run_scenarios
+from auth_cache import STATE_PATH, AuthCache
+from command_trace import CommandTracer
+from driver_factory import create_driver, select_profile_from_argv
+from fixture_server import base_url
+from page_objects import LoginPage
+
+BASE_URL = base_url()
+
+# tomsmith's session, shared between tests (and runs, until it expires)
+AUTH = AuthCache(BASE_URL, "tomsmith", "SuperSecretPassword!", path=STATE_PATH)
 
 class LoginTest:
     """Example test class for login functionality"""
@@ -17,12 +26,13 @@ class LoginTest:
     def __init__(self):
         self.driver = None
         self.wait = None
+        self.tracer = CommandTracer()
     
     def setup(self):
         """Setup WebDriver and wait object"""
         print("Setting up test...")
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-        self.driver.maximize_window()
+        self.driver = create_driver()
+        self.tracer.attach(self.driver)  # record every WebDriver command
         self.wait = WebDriverWait(self.driver, 10)
     
     def teardown(self):
@@ -37,21 +47,10 @@ class LoginTest:
         
         try:
             # Navigate to login page
-            self.driver.get("https://the-internet.herokuapp.com/login")
-            
-            # Find elements
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            password_field = self.driver.find_element(By.ID, "password")
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
+            self.driver.get(f"{BASE_URL}/login")
             
-            # Enter credentials
-            username_field.send_keys("tomsmith")
-            password_field.send_keys("SuperSecretPassword!")
-            
-            # Click login
-            login_button.click()
+            # Enter credentials and submit in a single script call
+            LoginPage(self.driver).login("tomsmith", "SuperSecretPassword!")
             
             # Wait for success message
             success_message = self.wait.until(
@@ -65,6 +64,9 @@ class LoginTest:
             assert "/secure" in self.driver.current_url, \
                 "Not redirected to secure area"
             
+            # Keep this session so later tests can skip the login form
+            AUTH.capture(self.driver)
+            
             print("✓ Login successful!")
             print(f"  Success message: {success_message.text}")
             print(f"  Current URL: {self.driver.current_url}")
@@ -81,21 +83,10 @@ class LoginTest:
         
         try:
             # Navigate to login page
-            self.driver.get("https://the-internet.herokuapp.com/login")
-            
-            # Find elements
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            password_field = self.driver.find_element(By.ID, "password")
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
-            
-            # Enter wrong credentials
-            username_field.send_keys("wrong_user")
-            password_field.send_keys("wrong_password")
+            self.driver.get(f"{BASE_URL}/login")
             
-            # Click login
-            login_button.click()
+            # Enter wrong credentials and submit in a single script call
+            LoginPage(self.driver).login("wrong_user", "wrong_password")
             
             # Wait for error message
             error_message = self.wait.until(
@@ -123,27 +114,16 @@ class LoginTest:
         print("\n=== Test: Logout ===")
         
         try:
-            # First login
-            self.driver.get("https://the-internet.herokuapp.com/login")
-            
-            username_field = self.wait.until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            password_field = self.driver.find_element(By.ID, "password")
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
-            
-            username_field.send_keys("tomsmith")
-            password_field.send_keys("SuperSecretPassword!")
-            login_button.click()
-            
-            # Wait for secure area
-            self.wait.until(EC.url_contains("/secure"))
+            # Restore the cached session (falls back to a UI login if it is stale)
+            how = AUTH.login(self.driver)
+            print(f"  Logged in via {how}")
             
             # Find and click logout button
             logout_button = self.wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "a.button.secondary"))
             )
             logout_button.click()
+            AUTH.invalidate()  # logging out ends the cached session on the server
             
             # Verify logout
             logout_message = self.wait.until(
@@ -171,13 +151,10 @@ class LoginTest:
         
         try:
             results = []
-            results.append(self.test_successful_login())
-            time.sleep(2)
-            
-            results.append(self.test_failed_login())
-            time.sleep(2)
-            
-            results.append(self.test_logout())
+            for test in (self.test_successful_login, self.test_failed_login, self.test_logout):
+                # Commands sent inside a section are attributed to that test
+                with self.tracer.section(test.__name__):
+                    results.append(test())
             
             # Summary
             print("\n" + "="*50)
@@ -192,10 +169,42 @@ class LoginTest:
             else:
                 print("✗ Some tests failed")
             
+            # Where the time went, per test
+            for name in self.tracer.profile_by_section():
+                if name:
+                    print(f"\nWebDriver commands in {name}:")
+                    print(self.tracer.table(name))
+            trace_path = self.tracer.write_chrome_trace("login_test_trace.json")
+            print(f"\nChrome trace written to {trace_path}")
+            
         finally:
             self.teardown()
 
+    def run_concurrently(self, timeout=60):
+        """Run each test in its own browser session, all at the same time"""
+        def scenario(method):
+            def run(driver):
+                test = LoginTest()
+                test.driver = driver
+                test.wait = WebDriverWait(driver, 10)
+                self.tracer.attach(driver)
+                with self.tracer.section(method.__name__):
+                    return method(test)
+            return run
+
+        tests = (LoginTest.test_successful_login, LoginTest.test_failed_login, LoginTest.test_logout)
+        run = run_scenarios({test.__name__: scenario(test) for test in tests}, timeout=timeout)
+        passed = print_summary(run)
+        # One row per session thread: the flame view shows the tests overlapping
+        trace_path = self.tracer.write_chrome_trace("login_test_trace.json")
+        print(f"\nChrome trace written to {trace_path}")
+        return passed
+
 if __name__ == "__main__":
+    select_profile_from_argv()  # --profile fast-headless|debug|visual
     test = LoginTest()
-    test.run_all_tests()
+    if "--concurrent" in sys.argv:
+        test.run_concurrently()  # one session per test, overlapping from one event loop
+    else:
+        test.run_all_tests()
 
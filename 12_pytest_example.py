@@ -4,42 +4,39 @@ This example shows how to structure Selenium tests with pytest framework.
 """
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from page_objects import LoginPage
 
 class TestLoginPage:
     """Test class for login page functionality"""
     
     @pytest.fixture(autouse=True)
-    def setup_teardown(self):
+    def setup_teardown(self, pooled_driver, base_url):
         """Setup and teardown for each test"""
-        # Setup
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-        self.driver.maximize_window()
+        # Setup: borrow a warm, freshly reset browser from the session pool
+        # (see conftest.py) instead of launching a new Chrome per test
+        self.driver = pooled_driver
+        self.base_url = base_url  # local fixture server unless --site-url is given
         self.wait = WebDriverWait(self.driver, 10)
         
         yield  # Test runs here
         
-        # Teardown
-        self.driver.quit()
+        # Teardown: the pooled_driver fixture resets the browser and returns it
     
     def test_page_loads(self):
         """Test that login page loads correctly"""
-        self.driver.get("https://the-internet.herokuapp.com/login")
+        self.driver.get(f"{self.base_url}/login")
         
         # Verify page title
         assert "The Internet" in self.driver.title
         
-        # Verify login form elements are present
-        username_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = self.driver.find_element(By.ID, "password")
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
+        # Verify login form elements are present (resolved in a single round trip)
+        form = LoginPage(self.driver).resolve(timeout=10)
+        username_field = form.username
+        password_field = form.password
+        login_button = form.login_button
         
         assert username_field.is_displayed()
         assert password_field.is_displayed()
@@ -47,17 +44,10 @@ class TestLoginPage:
     
     def test_successful_login(self):
         """Test successful login"""
-        self.driver.get("https://the-internet.herokuapp.com/login")
-        
-        username_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = self.driver.find_element(By.ID, "password")
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
+        self.driver.get(f"{self.base_url}/login")
         
-        username_field.send_keys("tomsmith")
-        password_field.send_keys("SuperSecretPassword!")
-        login_button.click()
+        # Enter credentials and submit in a single script call
+        LoginPage(self.driver).login("tomsmith", "SuperSecretPassword!")
         
         # Verify success
         success_message = self.wait.until(
@@ -69,17 +59,10 @@ class TestLoginPage:
     
     def test_invalid_username(self):
         """Test login with invalid username"""
-        self.driver.get("https://the-internet.herokuapp.com/login")
-        
-        username_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = self.driver.find_element(By.ID, "password")
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
+        self.driver.get(f"{self.base_url}/login")
         
-        username_field.send_keys("invalid_user")
-        password_field.send_keys("SuperSecretPassword!")
-        login_button.click()
+        # Enter credentials and submit in a single script call
+        LoginPage(self.driver).login("invalid_user", "SuperSecretPassword!")
         
         error_message = self.wait.until(
             EC.presence_of_element_located((By.ID, "flash"))
@@ -89,17 +72,10 @@ class TestLoginPage:
     
     def test_invalid_password(self):
         """Test login with invalid password"""
-        self.driver.get("https://the-internet.herokuapp.com/login")
+        self.driver.get(f"{self.base_url}/login")
         
-        username_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = self.driver.find_element(By.ID, "password")
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
-        
-        username_field.send_keys("tomsmith")
-        password_field.send_keys("wrong_password")
-        login_button.click()
+        # Enter credentials and submit in a single script call
+        LoginPage(self.driver).login("tomsmith", "wrong_password")
         
         error_message = self.wait.until(
             EC.presence_of_element_located((By.ID, "flash"))
@@ -107,6 +83,39 @@ class TestLoginPage:
         
         assert "Your password is invalid!" in error_message.text
     
+    def test_secure_area(self, authenticated_driver):
+        """The secure area shows its content (restored session, no UI login)"""
+        # authenticated_driver is the same pooled browser, already on /secure;
+        # only the first test that needs it logs in through the form
+        heading = authenticated_driver.find_element(By.CSS_SELECTOR, ".example h2")
+        
+        assert "Secure Area" in heading.text
+        assert "/secure" in authenticated_driver.current_url
+    
+    def test_secure_area_has_logout(self, authenticated_driver):
+        """The secure area offers a logout button (restored session, no UI login)"""
+        logout_button = authenticated_driver.find_element(By.CSS_SELECTOR, "a.button.secondary")
+        
+        assert logout_button.is_displayed()
+        assert logout_button.get_attribute("href").endswith("/logout")
+    
+    def test_logout(self):
+        """Test logout"""
+        # Logging out ends the server session, so this test logs in on its own
+        # instead of using (and ending) the shared authenticated session
+        self.driver.get(f"{self.base_url}/login")
+        LoginPage(self.driver).login("tomsmith", "SuperSecretPassword!")
+        self.wait.until(EC.url_contains("/secure"))
+        
+        self.driver.find_element(By.CSS_SELECTOR, "a.button.secondary").click()
+        
+        logout_message = self.wait.until(
+            EC.presence_of_element_located((By.ID, "flash"))
+        )
+        
+        assert "You logged out of the secure area!" in logout_message.text
+        assert "/login" in self.driver.current_url
+    
     @pytest.mark.parametrize("username,password,expected_message", [
         ("tomsmith", "SuperSecretPassword!", "You logged into a secure area!"),
         ("wrong_user", "SuperSecretPassword!", "Your username is invalid!"),
@@ -114,17 +123,10 @@ class TestLoginPage:
     ])
     def test_login_scenarios(self, username, password, expected_message):
         """Parameterized test for multiple login scenarios"""
-        self.driver.get("https://the-internet.herokuapp.com/login")
-        
-        username_field = self.wait.until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password_field = self.driver.find_element(By.ID, "password")
-        login_button = self.driver.find_element(By.CSS_SELECTOR, "button.radius")
+        self.driver.get(f"{self.base_url}/login")
         
-        username_field.send_keys(username)
-        password_field.send_keys(password)
-        login_button.click()
+        # Enter credentials and submit in a single script call
+        LoginPage(self.driver).login(username, password)
         
         message = self.wait.until(
             EC.presence_of_element_located((By.ID, "flash"))
@@ -136,4 +138,7 @@ class TestLoginPage:
 # pytest 12_pytest_example.py -v
 # pytest 12_pytest_example.py::TestLoginPage::test_successful_login -v
 # pytest 12_pytest_example.py -k "login" -v
+# pytest 12_pytest_example.py --pool-size 2 -v
+# pytest 12_pytest_example.py --latency-ms 50 --jitter-ms 10 -v
+# pytest 12_pytest_example.py --site-url https://the-internet.herokuapp.com -v
 
@@ -0,0 +1,160 @@
+"""
+Selenium Helpers: Action Macros
+Compiles an ActionChains sequence once and replays it as a single command.
+
+Every ActionChains(...).perform() builds the W3C actions payload again, step
+by step, before sending it. A macro is recorded once with placeholders for
+the elements and text it works on, compiled into the finished payload, and
+replayed by filling the placeholders in:
+
+- define(name, build) records build(chain, p); p.<name> stands for an
+  element (hover, click, drag, moves with offsets relative to it) and
+  p.text(<name>) for text typed with send_keys
+- play(name, **params) sends the payload with the parameters filled in:
+  one W3C actions command, nothing rebuilt
+- payload(name, **params) returns that payload without sending it
+
+Element parameters are WebElements (cached elements work) or (By, value)
+locators, which are looked up at play time.
+
+Usage:
+    macros = ActionMacros(driver)
+    macros.define("drag", lambda chain, p: chain.drag_and_drop(p.source, p.target))
+    macros.define("retype", lambda chain, p: chain.double_click(p.field).send_keys(p.text("text")))
+    macros.play("drag", source=box_a, target=box_b)
+    macros.play("retype", field=search_box, text="python" + Keys.RETURN)
+"""
+
+import time
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+_SLOT_PREFIX = "macro-slot:"
+_TEXT_SLOT_BASE = 0xF0000  # private use plane: never a real key
+
+
+class ElementSlot(WebElement):
+    """Stands for an element parameter while a macro is recorded"""
+
+    def __init__(self, name):
+        super().__init__(None, _SLOT_PREFIX + name)
+        self.name = name
+
+
+class MacroParams:
+    """The `p` passed to a macro's build function"""
+
+    def __init__(self):
+        self.texts = {}  # placeholder character -> parameter name
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return ElementSlot(name)
+
+    def text(self, name):
+        for char, existing in self.texts.items():
+            if existing == name:
+                return char
+        char = chr(_TEXT_SLOT_BASE + len(self.texts))
+        self.texts[char] = name
+        return char
+
+
+class Macro:
+    """A compiled actions payload and where its parameters go"""
+
+    def __init__(self, name, devices, elements, texts):
+        self.name = name
+        self.devices = devices    # encoded input sources, as sent
+        self.elements = elements  # (device, action index, parameter)
+        self.texts = texts        # (tick, parameter), highest tick first
+        self.params = sorted({p for _, _, p in elements} | {p for _, p in texts})
+
+    def fill(self, driver, params):
+        missing = [name for name in self.params if name not in params]
+        if missing:
+            raise ValueError(f"Macro {self.name!r} needs parameters: {', '.join(missing)}")
+        devices = [dict(device, actions=list(device["actions"])) for device in self.devices]
+        for d, i, name in self.elements:
+            element = params[name]
+            if not isinstance(element, WebElement):
+                element = driver.find_element(*element)
+            actions = devices[d]["actions"]
+            actions[i] = dict(actions[i], origin={ELEMENT_KEY: element.id})
+        for tick, name in self.texts:
+            # One keyDown/keyUp tick pair becomes a pair per character;
+            # the other devices pause for the same number of ticks
+            for device in devices:
+                actions = device["actions"]
+                if len(actions) <= tick:
+                    continue
+                if device["type"] == "key":
+                    typed = []
+                    for char in params[name]:
+                        typed += [{"type": "keyDown", "value": char}, {"type": "keyUp", "value": char}]
+                else:
+                    typed = [{"type": "pause", "duration": 0}] * (2 * len(params[name]))
+                actions[tick:tick + 2] = typed
+        return {"actions": devices}
+
+
+def compile_macro(driver, name, build, duration=250):
+    """Record build(chain, p) and turn it into a Macro (no command is sent)"""
+    chain = ActionChains(driver, duration=duration)
+    p = MacroParams()
+    build(chain, p)
+    devices = []
+    for device in chain.w3c_actions.devices:
+        encoded = device.encode()
+        if encoded["actions"]:
+            devices.append(encoded)
+    elements = []
+    texts = set()
+    for d, device in enumerate(devices):
+        for i, action in enumerate(device["actions"]):
+            origin = action.get("origin")
+            if isinstance(origin, dict) and str(origin.get(ELEMENT_KEY, "")).startswith(_SLOT_PREFIX):
+                elements.append((d, i, origin[ELEMENT_KEY][len(_SLOT_PREFIX):]))
+            value = action.get("value")
+            if action["type"] == "keyDown" and value in p.texts:
+                following = device["actions"][i + 1] if i + 1 < len(device["actions"]) else {}
+                if following.get("type") != "keyUp" or following.get("value") != value:
+                    raise ValueError(f"Macro {name!r}: text parameters can only be typed with send_keys()")
+                texts.add((i, p.texts[value]))
+    return Macro(name, devices, elements, sorted(texts, reverse=True))
+
+
+class ActionMacros:
+    """Named, precompiled action sequences for one driver"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.macros = {}
+        self._counts = {"compiled": 0, "played": 0, "compile_ms": 0.0, "play_ms": 0.0}
+
+    def define(self, name, build, duration=250):
+        start = time.perf_counter()
+        self.macros[name] = compile_macro(self.driver, name, build, duration)
+        self._counts["compiled"] += 1
+        self._counts["compile_ms"] += (time.perf_counter() - start) * 1000
+        return self.macros[name]
+
+    def payload(self, name, **params):
+        return self.macros[name].fill(self.driver, params)
+
+    def play(self, name, **params):
+        """Replay a macro as one W3C actions command"""
+        start = time.perf_counter()
+        self.driver.execute(Command.W3C_ACTIONS, self.payload(name, **params))
+        self._counts["played"] += 1
+        self._counts["play_ms"] += (time.perf_counter() - start) * 1000
+
+    def stats(self):
+        counts = dict(self._counts)
+        counts["compile_ms"] = round(counts["compile_ms"], 1)
+        counts["play_ms"] = round(counts["play_ms"], 1)
+        return counts
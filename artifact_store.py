@@ -0,0 +1,231 @@
+"""
+Selenium Helpers: Artifact Store
+Content-addressed storage for screenshots and other test artifacts.
+
+Every artifact is stored once as a blob named by its SHA-256 digest. A small
+SQLite index records which run, test and step produced which blob, so an
+identical capture from another test or another night costs one index row
+instead of another file.
+
+- put() writes a blob only if its digest is new (deduplication)
+- find() and runs() query the index
+- Blobs are read-only once written: many runs may share one, so an
+  in-place write through any path to it would corrupt all of them
+- export() materializes a run as named files, hard-linked where possible
+  (the links are read-only too; copy a file before editing it)
+- gc() applies retention (keep the newest N runs and/or drop runs older than
+  N days) and deletes blobs no longer referenced
+
+Layout:
+    artifacts/index.sqlite
+    artifacts/blobs/3f/3fa2...e1
+
+Usage:
+    store = ArtifactStore("artifacts")
+    store.put(png_bytes, test="test_login", step="after_login.png")
+    store.gc(keep_runs=10)
+
+Command line:
+    python artifact_store.py stats
+    python artifact_store.py export RUN_ID screenshots/
+    python artifact_store.py gc --keep-runs 10 --max-age-days 30
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+DEFAULT_ROOT = os.environ.get("ARTIFACT_STORE", "artifacts")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    test TEXT,
+    step TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_run ON artifacts(run_id);
+CREATE INDEX IF NOT EXISTS artifacts_digest ON artifacts(digest);
+"""
+
+
+def new_run_id():
+    """SELENIUM_RUN_ID if set, else a sortable timestamp plus the process id"""
+    return os.environ.get("SELENIUM_RUN_ID") or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class ArtifactStore:
+    """Deduplicating blob store with a SQLite index of runs, tests and steps"""
+
+    def __init__(self, root=DEFAULT_ROOT, run_id=None):
+        self.root = root
+        self.run_id = run_id or new_run_id()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(root, "index.sqlite"), check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self.written = 0
+        self.deduplicated = 0
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def put(self, data, step, test=None, run_id=None):
+        """Store bytes for a step of a test; returns the blob path"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        now = time.time()
+        with self._lock:
+            known = self._db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if known and os.path.exists(path):
+                self.deduplicated += 1
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.chmod(tmp_path, 0o444)
+                os.replace(tmp_path, path)
+                self._db.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)", (digest, len(data), now))
+                self.written += 1
+            self._db.execute(
+                "INSERT INTO artifacts (run_id, test, step, digest, created) VALUES (?, ?, ?, ?, ?)",
+                (run_id or self.run_id, test, step, digest, now),
+            )
+            self._db.commit()
+        return path
+
+    def get(self, digest):
+        with open(self.blob_path(digest), "rb") as f:
+            return f.read()
+
+    def find(self, run_id=None, test=None, step=None):
+        """Index rows as dicts (run_id, test, step, digest, path, created), oldest first"""
+        clauses, params = [], []
+        for column, value in (("run_id", run_id), ("test", test), ("step", step)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT run_id, test, step, digest, created FROM artifacts {where} ORDER BY id", params
+            ).fetchall()
+        return [
+            {"run_id": r[0], "test": r[1], "step": r[2], "digest": r[3], "path": self.blob_path(r[3]), "created": r[4]}
+            for r in rows
+        ]
+
+    def runs(self):
+        """[(run_id, artifacts, first_created)] oldest first"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT run_id, COUNT(*), MIN(created) FROM artifacts GROUP BY run_id ORDER BY MIN(created)"
+            ).fetchall()
+
+    def export(self, run_id, directory):
+        """Write a run's artifacts as <directory>/<step> (hard links when possible)"""
+        exported = []
+        for row in self.find(run_id=run_id):
+            target = os.path.join(directory, row["step"])
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            if os.path.lexists(target):
+                os.remove(target)
+            try:
+                os.link(row["path"], target)
+            except OSError:
+                shutil.copyfile(row["path"], target)
+            exported.append(target)
+        return exported
+
+    def gc(self, keep_runs=None, max_age_days=None):
+        """Drop runs outside the retention policy, then delete unreferenced blobs"""
+        expired = set()
+        runs = self.runs()
+        if keep_runs is not None:
+            expired.update(run_id for run_id, _, _ in runs[:max(len(runs) - keep_runs, 0)])
+        if max_age_days is not None:
+            cutoff = time.time() - max_age_days * 86400
+            expired.update(run_id for run_id, _, created in runs if created < cutoff)
+
+        with self._lock:
+            for run_id in expired:
+                self._db.execute("DELETE FROM artifacts WHERE run_id = ?", (run_id,))
+            orphans = self._db.execute(
+                "SELECT digest, size FROM blobs WHERE digest NOT IN (SELECT digest FROM artifacts)"
+            ).fetchall()
+            for digest, _ in orphans:
+                try:
+                    os.chmod(self.blob_path(digest), 0o644)  # read-only files cannot be removed on Windows
+                    os.remove(self.blob_path(digest))
+                except FileNotFoundError:
+                    pass
+                self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self._db.commit()
+        return {"runs": len(expired), "blobs": len(orphans), "bytes": sum(size for _, size in orphans)}
+
+    def stats(self):
+        """Artifact and blob counts; logical vs stored bytes shows what deduplication saved"""
+        with self._lock:
+            artifacts, logical = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0) FROM artifacts a JOIN blobs b USING (digest)"
+            ).fetchone()
+            blobs, stored = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return {"artifacts": artifacts, "blobs": blobs, "logical_bytes": logical, "stored_bytes": stored,
+                "dedup_ratio": logical / stored if stored else 1.0}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and prune the artifact store")
+    parser.add_argument("--root", default=DEFAULT_ROOT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="artifact, blob and byte counts")
+    commands.add_parser("runs", help="list runs")
+    export = commands.add_parser("export", help="write a run's artifacts as named files")
+    export.add_argument("run_id")
+    export.add_argument("directory")
+    gc = commands.add_parser("gc", help="apply retention and delete unreferenced blobs")
+    gc.add_argument("--keep-runs", type=int)
+    gc.add_argument("--max-age-days", type=float)
+    args = parser.parse_args()
+
+    with ArtifactStore(args.root) as store:
+        if args.command == "stats":
+            stats = store.stats()
+            print(f"Artifacts: {stats['artifacts']}  Blobs: {stats['blobs']}")
+            print(f"Logical: {stats['logical_bytes']:,} bytes  Stored: {stats['stored_bytes']:,} bytes  "
+                  f"Dedup: {stats['dedup_ratio']:.2f}x")
+        elif args.command == "runs":
+            for run_id, count, created in store.runs():
+                print(f"{run_id:<32}{count:>6}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(created))}")
+        elif args.command == "export":
+            for path in store.export(args.run_id, args.directory):
+                print(path)
+        elif args.command == "gc":
+            removed = store.gc(args.keep_runs, args.max_age_days)
+            print(f"Removed {removed['runs']} runs, {removed['blobs']} blobs, {removed['bytes']:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
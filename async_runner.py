@@ -0,0 +1,170 @@
+"""
+Selenium Helpers: Async Scenario Runner
+Runs independent browser scenarios concurrently from one asyncio event loop.
+
+Selenium's client is blocking: every command waits for the browser to answer.
+The runner gives each scenario its own browser session and its own worker
+thread, so the event loop never blocks and the network and render waits of
+different scenarios overlap. A suite of I/O-bound flows finishes in about the
+time of its longest flow instead of the sum of all of them.
+
+Scenarios are callables keyed by name:
+
+- a plain function `scenario(driver)` runs on the session's thread
+- a coroutine function `async def scenario(session)` gets an AsyncDriver and
+  awaits each command (`await session.get(url)`, `await session.call(el.click)`)
+
+A scenario passes unless it raises or returns False. Each scenario has a
+timeout. When it expires, or the run is cancelled, the browser is quit from
+another thread, which also aborts a command that is still waiting.
+
+Usage:
+    results = run_scenarios({"login": login, "logout": logout}, timeout=60)
+    print_summary(results)
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from driver_factory import create_driver
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass  # the session is gone already
+
+
+class AsyncDriver:
+    """Awaitable view of a driver; every call runs on the session's own thread"""
+
+    def __init__(self, driver, executor):
+        self.driver = driver
+        self._executor = executor
+
+    async def call(self, fn, *args, **kwargs):
+        """Run any blocking callable (e.g. element.click) on the session thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def read(self, name):
+        """Read a driver property that sends a command (title, current_url, ...)"""
+        return await self.call(getattr, self.driver, name)
+
+    def __getattr__(self, name):
+        method = getattr(self.driver, name)
+        if not callable(method):
+            raise AttributeError(f"{name!r} is not a method; use `await session.read({name!r})`")
+
+        async def command(*args, **kwargs):
+            return await self.call(method, *args, **kwargs)
+        return command
+
+
+class AsyncRunner:
+    """Runs scenarios in concurrent browser sessions"""
+
+    def __init__(self, driver_factory=create_driver, max_sessions=None, timeout=60, fail_fast=False):
+        self.driver_factory = driver_factory
+        self.max_sessions = max_sessions
+        self.timeout = timeout
+        self.fail_fast = fail_fast
+
+    async def _session(self, fn):
+        """Launch a browser, run the scenario in it, and always quit it"""
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session")
+        launch = executor.submit(self.driver_factory)
+        driver = None
+        try:
+            driver = await asyncio.wrap_future(launch)
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(AsyncDriver(driver, executor))
+            return await loop.run_in_executor(executor, fn, driver)
+        finally:
+            if driver is not None:
+                # Quit from another thread: the session thread may be stuck in a command
+                await loop.run_in_executor(None, _quit, driver)
+            elif not launch.cancel():
+                # Cancelled while the browser was starting; quit it once it is up
+                launch.add_done_callback(lambda f: f.exception() is None and _quit(f.result()))
+            executor.shutdown(wait=False)
+
+    async def _run_scenario(self, result, fn, timeout, slots):
+        try:
+            # Waiting for a free session is not part of the scenario's time or timeout
+            async with slots:
+                result["status"] = "passed"
+                start = time.perf_counter()
+                try:
+                    if await asyncio.wait_for(self._session(fn), timeout) is False:
+                        result["status"] = "failed"
+                except asyncio.TimeoutError:
+                    result["status"] = "timeout"
+                    result["error"] = f"exceeded {timeout}s"
+                except Exception as e:
+                    result["status"] = "failed"
+                    result["error"] = f"{type(e).__name__}: {e}"
+                finally:
+                    result["duration"] = time.perf_counter() - start
+        except asyncio.CancelledError:
+            result["status"] = "cancelled"
+            raise
+        return result
+
+    async def run(self, scenarios, timeouts=None):
+        """
+        Run {name: scenario} concurrently and return the results in input order.
+        `timeouts` optionally overrides the timeout per scenario name.
+        """
+        timeouts = timeouts or {}
+        slots = asyncio.Semaphore(self.max_sessions or len(scenarios) or 1)
+        # "cancelled" until the scenario gets a session; tasks fill these in even when cancelled
+        results = {name: {"name": name, "status": "cancelled", "duration": 0.0, "error": None} for name in scenarios}
+        tasks = {
+            asyncio.create_task(self._run_scenario(results[name], fn, timeouts.get(name, self.timeout), slots)): name
+            for name, fn in scenarios.items()
+        }
+        start = time.perf_counter()
+        pending = set(tasks)
+        try:
+            while pending:
+                # Cancelled tasks stay pending until they have quit their browsers
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if self.fail_fast and any(results[tasks[task]]["status"] != "passed" for task in done):
+                    for task in pending:
+                        task.cancel()
+        finally:
+            for task in tasks:
+                task.cancel()
+        return {"results": list(results.values()), "wall_time": time.perf_counter() - start}
+
+
+def run_scenarios(scenarios, timeouts=None, **kwargs):
+    """Blocking entry point: run the scenarios on a fresh event loop"""
+    return asyncio.run(AsyncRunner(**kwargs).run(scenarios, timeouts))
+
+
+def print_summary(run):
+    """Print per-scenario results and how much the sessions overlapped"""
+    results = run["results"]
+    wall_time = run["wall_time"]
+    serial_time = sum(r["duration"] for r in results)
+    longest = max((r["duration"] for r in results), default=0.0)
+
+    print("\n" + "=" * 50)
+    print("ASYNC SCENARIO SUMMARY")
+    print("=" * 50)
+    for r in results:
+        mark = "✓" if r["status"] == "passed" else "✗"
+        line = f"{mark} {r['name']:<28}{r['status']:<10}{r['duration']:>7.2f}s"
+        print(f"{line}  {r['error']}" if r["error"] else line)
+    passed = sum(r["status"] == "passed" for r in results)
+    print(f"Passed: {passed}/{len(results)}")
+    print(f"Wall time: {wall_time:.2f}s  Longest scenario: {longest:.2f}s")
+    if wall_time:
+        print(f"Summed scenario time: {serial_time:.2f}s  Overlap: {serial_time / wall_time:.2f}x")
+    return passed == len(results)
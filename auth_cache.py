@@ -0,0 +1,194 @@
+"""
+Selenium Helpers: Auth State Cache
+Logs in through the UI once, then restores the session into other browsers.
+
+Filling and submitting the login form is the most repeated sequence in the
+suite. The cache logs in once, snapshots the authenticated state (cookies,
+plus local and session storage) and restores that snapshot into fresh or
+pooled browsers:
+
+- Cookies are set through CDP (Network.setCookies) without loading a page
+  first; other browsers fall back to opening the site and add_cookie()
+- Restored state is verified on the secure page; if the server no longer
+  accepts it (expired, server restarted), the cache falls back to a real UI
+  login and takes a new snapshot
+- Snapshots expire after `ttl` seconds, or earlier if a cookie expires
+- With `path`, the snapshot is shared between processes as a JSON file,
+  readable only by the current user (it holds live session cookies);
+  STATE_PATH is the default location, outside the driver cache
+
+Logging out ends the cached session on the server; call invalidate() after a
+logout so the next login does not have to discover that first.
+
+Usage:
+    auth = AuthCache(base_url, "tomsmith", "SuperSecretPassword!")
+    auth.login(driver)      # "login" the first time, "restored" afterwards
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from page_objects import LoginPage
+from waits import wait_for_url_contains
+
+# Kept apart from driver_cache.CACHE_DIR, which reset_cache() deletes
+STATE_PATH = os.environ.get(
+    "SELENIUM_AUTH_STATE",
+    os.path.join(os.path.expanduser("~"), ".cache", "seleniumtesting", "auth", "auth_state.json"),
+)
+
+SNAPSHOT_STORAGE_JS = """
+function dump(storage) {
+    var out = {};
+    for (var i = 0; i < storage.length; i++) { var k = storage.key(i); out[k] = storage.getItem(k); }
+    return out;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_JS = """
+var state = arguments[0];
+Object.keys(state.local).forEach(function (k) { window.localStorage.setItem(k, state.local[k]); });
+Object.keys(state.session).forEach(function (k) { window.sessionStorage.setItem(k, state.session[k]); });
+"""
+
+
+class AuthCache:
+    """Snapshot of one user's authenticated state on one site"""
+
+    def __init__(self, base_url, username, password, ttl=900, path=None,
+                 login_path="/login", secure_path="/secure"):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.ttl = ttl
+        self.path = path
+        self.login_path = login_path
+        self.secure_path = secure_path
+        self.snapshot = None
+        self.logins = 0
+        self.restores = 0
+        self.fallbacks = 0
+        self._lock = threading.Lock()
+
+    # --- snapshots -------------------------------------------------------
+
+    def _key(self):
+        return f"{self.username}@{self.base_url}"
+
+    def _load(self):
+        if self.snapshot is None and self.path:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.snapshot = json.load(f).get(self._key())
+            except (OSError, ValueError):
+                pass
+        return self.snapshot
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshots = json.load(f)
+        except (OSError, ValueError):
+            snapshots = {}
+        snapshots[self._key()] = self.snapshot
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+            json.dump(snapshots, f)
+        os.replace(tmp_path, self.path)
+
+    def is_fresh(self):
+        """True while a snapshot exists and has not expired"""
+        snapshot = self._load()
+        return bool(snapshot) and time.time() < snapshot["expires"]
+
+    def capture(self, driver):
+        """Snapshot the state of a browser that is logged in (on the site's origin)"""
+        cookies = driver.get_cookies()
+        storage = driver.execute_script(SNAPSHOT_STORAGE_JS)
+        created = time.time()
+        expires = created + self.ttl
+        for cookie in cookies:
+            if "expiry" in cookie:
+                expires = min(expires, cookie["expiry"])
+        with self._lock:
+            self.snapshot = {"cookies": cookies, "storage": storage, "created": created, "expires": expires}
+            self._save()
+        return self.snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self.snapshot = None
+            self._save()
+
+    # --- restoring -------------------------------------------------------
+
+    def _set_cookies(self, driver, cookies):
+        """Set cookies via CDP without a page load; fall back to add_cookie on the origin"""
+        cdp_cookies = []
+        for cookie in cookies:
+            entry = {"name": cookie["name"], "value": cookie["value"], "url": self.base_url,
+                     "path": cookie.get("path", "/"), "secure": cookie.get("secure", False),
+                     "httpOnly": cookie.get("httpOnly", False)}
+            if cookie.get("domain", "").startswith("."):
+                entry["domain"] = cookie["domain"]
+            if "expiry" in cookie:
+                entry["expires"] = cookie["expiry"]
+            if cookie.get("sameSite"):
+                entry["sameSite"] = cookie["sameSite"]
+            cdp_cookies.append(entry)
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        except (AttributeError, WebDriverException):
+            if urlsplit(driver.current_url).netloc != urlsplit(self.base_url).netloc:
+                driver.get(f"{self.base_url}{self.login_path}")
+            for cookie in cookies:
+                driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite"})
+
+    def is_valid(self, driver):
+        """Open the secure page; the server redirects to the login page if the session is not accepted"""
+        driver.get(f"{self.base_url}{self.secure_path}")
+        return urlsplit(driver.current_url).path.startswith(self.secure_path)
+
+    def restore(self, driver):
+        """Apply the snapshot and verify it; returns False if the server rejected it"""
+        snapshot = self._load()
+        self._set_cookies(driver, snapshot["cookies"])
+        if not self.is_valid(driver):
+            return False
+        storage = snapshot["storage"]
+        if storage["local"] or storage["session"]:
+            driver.execute_script(RESTORE_STORAGE_JS, storage)
+        return True
+
+    def login_with_ui(self, driver):
+        """A real login through the form; snapshots the resulting state"""
+        driver.get(f"{self.base_url}{self.login_path}")
+        LoginPage(driver).login(self.username, self.password)
+        wait_for_url_contains(driver, self.secure_path)
+        self.logins += 1
+        self.capture(driver)
+
+    def login(self, driver):
+        """
+        Leave `driver` logged in on the secure page. Returns "restored" when
+        the cached state was reused, "login" after a real UI login.
+        """
+        if self.is_fresh():
+            if self.restore(driver):
+                self.restores += 1
+                return "restored"
+            self.fallbacks += 1
+            self.invalidate()
+        self.login_with_ui(driver)
+        return "login"
+
+    def stats(self):
+        return {"logins": self.logins, "restores": self.restores, "fallbacks": self.fallbacks}
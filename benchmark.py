@@ -0,0 +1,336 @@
+"""
+Selenium Helpers: Benchmark Suite
+Times every example scenario against the local fixture server.
+
+Each scenario (basic setup, find elements, waits, forms, frames, actions,
+JavaScript, screenshots, login flows) runs N times in a fresh browser. Every
+run is split into phases:
+
+- launch:     starting the browser
+- navigation: get/back/forward/refresh
+- command:    everything else the scenario does
+- teardown:   quitting the browser
+
+Results are written as JSON with percentile statistics and can be compared
+against a stored baseline; the run fails when a phase regresses by more than
+the configured threshold.
+
+Usage:
+    python benchmark.py -n 5 --save-baseline baseline.json
+    python benchmark.py -n 5 --baseline baseline.json --threshold 0.15
+    python benchmark.py --only login forms --profile fast-headless
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from driver_factory import PROFILES, create_driver, current_profile
+from fixture_server import FixtureServer
+from page_objects import LoginPage
+from waits import wait_for_element, wait_for_text, wait_for_url_contains
+
+PHASES = ("launch", "navigation", "command", "teardown", "total")
+NAVIGATION_METHODS = ("get", "back", "forward", "refresh")
+
+
+class PhaseTimer:
+    """Accumulates time spent in the driver's navigation methods"""
+
+    def __init__(self, driver):
+        self.navigation = 0.0
+        for name in NAVIGATION_METHODS:
+            setattr(driver, name, self._timed(getattr(driver, name)))
+
+    def _timed(self, method):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.navigation += time.perf_counter() - start
+        return wrapper
+
+
+# --- Scenarios: each mirrors one of the example scripts ---------------------
+
+def scenario_basic_setup(driver, base_url):
+    driver.get(base_url + "/")
+    assert driver.title
+    assert driver.current_url.startswith(base_url)
+
+
+def scenario_find_elements(driver, base_url):
+    driver.get(base_url + "/login")
+    driver.find_element(By.ID, "username")
+    driver.find_element(By.NAME, "password")
+    driver.find_element(By.CLASS_NAME, "radius")
+    driver.find_elements(By.TAG_NAME, "input")
+    driver.find_element(By.LINK_TEXT, "Elemental Selenium")
+    driver.find_element(By.PARTIAL_LINK_TEXT, "Elemental")
+    driver.find_element(By.CSS_SELECTOR, "button.radius")
+    driver.find_element(By.XPATH, "//button[@class='radius']")
+    links = driver.find_elements(By.TAG_NAME, "a")
+    [link.text for link in links[:5]]
+
+
+def scenario_waits(driver, base_url):
+    driver.get(base_url + "/dynamic_loading/2")
+    driver.find_element(By.CSS_SELECTOR, "#start button").click()
+    wait_for_text(driver, (By.ID, "finish"), "Hello World!")
+
+
+def scenario_forms(driver, base_url):
+    driver.get(base_url + "/checkboxes")
+    checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+    if not checkboxes[0].is_selected():
+        checkboxes[0].click()
+    driver.get(base_url + "/dropdown")
+    dropdown = Select(driver.find_element(By.ID, "dropdown"))
+    dropdown.select_by_visible_text("Option 2")
+    dropdown.select_by_value("1")
+    driver.get(base_url + "/radio_buttons")
+    driver.find_elements(By.NAME, "radio")[1].click()
+
+
+def scenario_frames(driver, base_url):
+    driver.get(base_url + "/iframe")
+    driver.switch_to.frame(driver.find_element(By.ID, "mce_0_ifr"))
+    editor = driver.find_element(By.ID, "tinymce")
+    editor.clear()
+    editor.send_keys("Hello from the benchmark")
+    driver.switch_to.default_content()
+
+    driver.get(base_url + "/windows")
+    main_window = driver.current_window_handle
+    driver.find_element(By.LINK_TEXT, "Click Here").click()
+    WebDriverWait(driver, 10).until(EC.number_of_windows_to_be(2))
+    new_window = [handle for handle in driver.window_handles if handle != main_window][0]
+    driver.switch_to.window(new_window)
+    driver.find_element(By.TAG_NAME, "h3")
+    driver.close()
+    driver.switch_to.window(main_window)
+
+
+def scenario_actions(driver, base_url):
+    actions = ActionChains(driver)
+    driver.get(base_url + "/hovers")
+    actions.move_to_element(driver.find_elements(By.CSS_SELECTOR, ".figure")[0]).perform()
+    wait_for_element(driver, (By.CSS_SELECTOR, ".figcaption h5"), visible=True)
+
+    driver.get(base_url + "/drag_and_drop")
+    box_a = driver.find_element(By.ID, "column-a")
+    box_b = driver.find_element(By.ID, "column-b")
+    actions.drag_and_drop(box_a, box_b).perform()
+
+    driver.get(base_url + "/context_menu")
+    actions.context_click(driver.find_element(By.ID, "hot-spot")).perform()
+    WebDriverWait(driver, 10).until(EC.alert_is_present()).accept()
+
+
+def scenario_javascript(driver, base_url):
+    driver.get(base_url + "/large")
+    table = driver.find_element(By.ID, "large-table")
+    driver.execute_script("arguments[0].scrollIntoView(true);", table)
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    driver.execute_script("window.scrollTo(0, 0);")
+    driver.execute_script(
+        "return {title: document.title, url: window.location.href,"
+        " width: window.innerWidth, height: window.innerHeight};"
+    )
+
+
+def scenario_screenshots(driver, base_url):
+    driver.get(base_url + "/login")
+    with tempfile.TemporaryDirectory() as directory:
+        driver.save_screenshot(os.path.join(directory, "full_page.png"))
+        driver.find_element(By.CSS_SELECTOR, "form").screenshot(os.path.join(directory, "form.png"))
+
+
+def scenario_login(driver, base_url):
+    page = LoginPage(driver)
+    page.open(base_url).login("tomsmith", "SuperSecretPassword!")
+    wait_for_url_contains(driver, "/secure")
+    page.open(base_url).login("wrong_user", "wrong_password")
+    wait_for_text(driver, (By.ID, "flash"), "Your username is invalid!")
+
+
+SCENARIOS = {
+    "basic_setup": scenario_basic_setup,
+    "find_elements": scenario_find_elements,
+    "waits": scenario_waits,
+    "forms": scenario_forms,
+    "frames": scenario_frames,
+    "actions": scenario_actions,
+    "javascript": scenario_javascript,
+    "screenshots": scenario_screenshots,
+    "login": scenario_login,
+}
+
+
+# --- Running and statistics --------------------------------------------------
+
+def run_once(scenario, base_url, driver_factory):
+    """Run a scenario in a fresh browser and return its phase timings"""
+    start = time.perf_counter()
+    driver = driver_factory()
+    launched = time.perf_counter()
+    timer = PhaseTimer(driver)
+    try:
+        scenario(driver, base_url)
+        finished = time.perf_counter()
+    finally:
+        driver.quit()
+    ended = time.perf_counter()
+
+    return {
+        "launch": launched - start,
+        "navigation": timer.navigation,
+        "command": (finished - launched) - timer.navigation,
+        "teardown": ended - finished,
+        "total": ended - start,
+    }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(runs):
+    stats = {}
+    for phase in PHASES:
+        values = [run[phase] for run in runs]
+        stats[phase] = {
+            "mean": sum(values) / len(values),
+            "min": min(values),
+            "max": max(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+        }
+    return stats
+
+
+def run_benchmarks(names, iterations, driver_factory, latency=0.0, jitter=0.0, profile=None):
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "iterations": iterations,
+            "profile": profile,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": latency * 1000,
+            "jitter_ms": jitter * 1000,
+        },
+        "scenarios": {},
+    }
+    # Short spinner so the waits scenario measures waiting, not the demo delay
+    with FixtureServer(latency=latency, jitter=jitter, dynamic_delay=0.5) as server:
+        for name in names:
+            print(f"Running {name} x{iterations}...")
+            runs = [run_once(SCENARIOS[name], server.url, driver_factory) for _ in range(iterations)]
+            results["scenarios"][name] = {"runs": runs, "stats": summarize(runs)}
+    return results
+
+
+def compare(results, baseline, threshold, statistic="p50"):
+    """
+    Compare each scenario/phase statistic with the baseline.
+    Returns a list of (scenario, phase, baseline, current, change) regressions.
+    """
+    regressions = []
+    print("\n" + "=" * 72)
+    print(f"COMPARISON WITH BASELINE ({statistic}, threshold {threshold:.0%})")
+    print("=" * 72)
+    print(f"{'scenario':<16}{'phase':<12}{'baseline':>12}{'current':>12}{'change':>12}")
+    for name, data in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            print(f"{name:<16}(no baseline)")
+            continue
+        for phase in PHASES:
+            old = base["stats"][phase][statistic]
+            new = data["stats"][phase][statistic]
+            change = (new - old) / old if old else 0.0
+            flag = " REGRESSION" if change > threshold else ""
+            print(f"{name:<16}{phase:<12}{old:>11.3f}s{new:>11.3f}s{change:>+11.1%}{flag}")
+            if change > threshold:
+                regressions.append((name, phase, old, new, change))
+    return regressions
+
+
+def print_summary(results):
+    print("\n" + "=" * 72)
+    print("BENCHMARK RESULTS (p50 / p95 seconds)")
+    print("=" * 72)
+    print(f"{'scenario':<16}" + "".join(f"{phase:>11}" for phase in PHASES))
+    for name, data in results["scenarios"].items():
+        stats = data["stats"]
+        print(f"{name:<16}" + "".join(f"{stats[phase]['p50']:>11.3f}" for phase in PHASES))
+        print(f"{'':<16}" + "".join(f"{stats[phase]['p95']:>11.3f}" for phase in PHASES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the example scenarios")
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), help="scenarios to run")
+    parser.add_argument("--output", default="benchmark-results.json", help="results JSON path")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", metavar="PATH", help="also store results as a baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative slowdown before failing (default 0.10)")
+    parser.add_argument("--statistic", default="p50", choices=["mean", "p50", "p90", "p95"])
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=current_profile(),
+                        help="driver_factory browser profile (default: SELENIUM_PROFILE or visual)")
+    args = parser.parse_args()
+
+    names = args.only or list(SCENARIOS)
+    results = run_benchmarks(
+        names,
+        args.iterations,
+        lambda: create_driver(args.profile),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        profile=args.profile,
+    )
+    print_summary(results)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        baseline_profile = baseline.get("meta", {}).get("profile")
+        if baseline_profile and baseline_profile != args.profile:
+            print(f"\nNote: baseline was recorded with profile {baseline_profile!r}, this run used {args.profile!r}")
+        regressions = compare(results, baseline, args.threshold, args.statistic)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+
+if __name__ == "__main__":
+    main()
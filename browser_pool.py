@@ -0,0 +1,153 @@
+"""
+Selenium Helpers: Browser Pool
+Keeps warm browsers alive and hands them out after a cheap state reset.
+
+Launching Chrome is the biggest fixed cost of a test. Instead of starting and
+quitting a browser per test, the pool:
+
+- Starts browsers lazily, up to a configurable size
+- Checks each browser's health before handing it out
+- Resets state when a browser comes back: closes extra windows, clears
+  cookies, local and session storage, and navigates to about:blank
+- Replaces browsers that crashed or failed to reset
+"""
+
+import queue
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from driver_factory import create_driver
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+def default_driver_factory():
+    """Create a browser with the selected profile (SELENIUM_PROFILE)"""
+    return create_driver()
+
+
+class BrowserPool:
+    """Thread-safe pool of reusable WebDriver sessions"""
+
+    def __init__(self, size=1, factory=default_driver_factory, acquire_timeout=300):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.factory = factory
+        self.acquire_timeout = acquire_timeout
+        self._idle = queue.LifoQueue()  # LIFO keeps the most recently used browser warm
+        self._lock = threading.Lock()
+        self._created = 0
+        self._all = set()
+        self.stats = {"launched": 0, "reused": 0, "discarded": 0}
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._all.add(driver)
+            self.stats["launched"] += 1
+        return driver
+
+    def _discard(self, driver):
+        """Quit a broken browser and free its slot"""
+        with self._lock:
+            self._all.discard(driver)
+            self._created -= 1
+            self.stats["discarded"] += 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def is_healthy(driver):
+        """A browser is healthy if it still answers a trivial command"""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def reset(driver):
+        """
+        Return a browser to a clean state:
+        1. Close every window except the first one
+        2. Clear local and session storage of the current page
+        3. Delete all cookies
+        4. Navigate to about:blank
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so clear it before leaving the page
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+
+        try:
+            # Clears cookies for every domain, not just the current one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    def acquire(self):
+        """Get a healthy browser, launching one if the pool is not full yet"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_launch = self._created < self.size
+                    if can_launch:
+                        self._created += 1
+                if can_launch:
+                    try:
+                        return self._launch()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                try:
+                    driver = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise TimeoutError("No browser became available in the pool")
+
+            if self.is_healthy(driver):
+                self.stats["reused"] += 1
+                return driver
+            self._discard(driver)
+
+    def release(self, driver):
+        """Reset a browser and put it back into the pool"""
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+            self._created = 0
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
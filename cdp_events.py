@@ -0,0 +1,182 @@
+"""
+Selenium Helpers: CDP Events
+A browser-level DevTools connection that pushes events to Python callbacks.
+
+WebDriver can only ask: anything that happens in the browser (a tab opens,
+a dialog appears) is found by polling, one round trip per poll. Chromium
+also speaks the DevTools protocol over a WebSocket, which reports those
+things as events. CdpEvents keeps one such connection open on a background
+thread for the lifetime of the driver:
+
+- on(event, callback) calls callback(event) for every matching event, e.g.
+  "target.TargetCreated"; callbacks run on the connection thread, so they
+  should only record what happened
+- execute(command) sends a command and returns its result; with target_id
+  it goes to that page instead of the browser
+- coroutine callbacks use send() and subscribe() instead, since they
+  already run on the connection thread
+- cdp_events(driver) shares one connection between all helpers of a driver
+  and closes it when the driver quits
+
+Commands are built with the protocol module of the connected browser, e.g.
+events.devtools.target.get_targets().
+
+Usage:
+    events = cdp_events(driver)
+    events.on("target.TargetCreated", lambda event: print(event.target_info.url))
+    events.execute(events.devtools.target.set_discover_targets(discover=True))
+"""
+
+import inspect
+import threading
+
+import trio
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.bidi import cdp
+
+
+class CdpEvents:
+    """One DevTools connection, serviced by a background thread running trio"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.devtools = None
+        self._handlers = []  # (event name, callback, target_id)
+        self._sessions = {}  # target_id -> CdpSession
+        self._conn = None
+        self._nursery = None
+        self._token = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+        self._counts = {"events": 0, "commands": 0, "callback_errors": 0}
+
+    # --- connection thread --------------------------------------------------
+
+    def start(self, timeout=10):
+        """Connect to the browser's DevTools endpoint (once)"""
+        if self._thread is not None:
+            return self
+        version, ws_url = self.driver._get_cdp_details()
+        if not ws_url:
+            raise WebDriverException("The session has no DevTools endpoint (Chromium browsers only)")
+        self.devtools = cdp.import_devtools(version)
+        self._thread = threading.Thread(target=trio.run, args=(self._main, ws_url),
+                                        name="cdp-events", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutException(f"No DevTools connection after {timeout}s")
+        if self._error is not None:
+            raise WebDriverException(f"DevTools connection failed: {self._error}")
+        for handler in self._handlers:
+            self._spawn(*handler)
+        return self
+
+    async def _main(self, ws_url):
+        try:
+            async with cdp.open_cdp(ws_url) as conn:
+                async with trio.open_nursery() as nursery:
+                    self._conn = conn
+                    self._nursery = nursery
+                    self._token = trio.lowlevel.current_trio_token()
+                    self._ready.set()
+                    await trio.sleep_forever()
+        except Exception as error:
+            self._error = error
+            self._ready.set()
+
+    def stop(self):
+        """Close the connection and end its thread"""
+        if self._token is None:
+            return
+        try:
+            trio.from_thread.run_sync(self._nursery.cancel_scope.cancel, trio_token=self._token)
+        except trio.RunFinishedError:
+            pass  # the connection ended by itself (browser gone)
+        self._thread.join(5)
+        self._token = None
+
+    # --- events -------------------------------------------------------------
+
+    def event_type(self, name):
+        """Protocol class for a "domain.EventName" string"""
+        domain, event = name.split(".")
+        return getattr(getattr(self.devtools, domain), event)
+
+    async def _session(self, target_id):
+        if target_id is None:
+            return self._conn
+        if target_id not in self._sessions:
+            self._sessions[target_id] = await self._conn.connect_session(self.devtools.target.TargetID(target_id))
+        return self._sessions[target_id]
+
+    async def _pump(self, name, callback, target_id, task_status=trio.TASK_STATUS_IGNORED):
+        session = await self._session(target_id)
+        events = session.listen(self.event_type(name), buffer_size=256)
+        task_status.started()  # listening: on() may return
+        async for event in events:
+            self._counts["events"] += 1
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                # A broken callback must not stop the events for everyone else
+                self._counts["callback_errors"] += 1
+                print(f"CDP callback for {name} failed: {error!r}")
+
+    def _spawn(self, name, callback, target_id):
+        trio.from_thread.run(self._nursery.start, self._pump, name, callback, target_id,
+                             trio_token=self._token)
+
+    def on(self, name, callback, target_id=None):
+        """Call callback(event) for every `name` event, browser-wide or from one target"""
+        handler = (name, callback, target_id)
+        self._handlers.append(handler)
+        if self._token is not None:
+            self._spawn(*handler)
+
+    async def subscribe(self, name, callback, target_id=None):
+        """on() for coroutine callbacks (runs on the connection thread)"""
+        self._handlers.append((name, callback, target_id))
+        await self._nursery.start(self._pump, name, callback, target_id)
+
+    # --- commands -----------------------------------------------------------
+
+    async def send(self, command, target_id=None):
+        """Send a command from a coroutine callback (runs on the connection thread)"""
+        self._counts["commands"] += 1
+        session = await self._session(target_id)
+        return await session.execute(command)
+
+    def execute(self, command, target_id=None, timeout=10):
+        """Send a command and wait for its result"""
+        async def run():
+            with trio.fail_after(timeout):
+                return await self.send(command, target_id)
+        try:
+            return trio.from_thread.run(run, trio_token=self._token)
+        except trio.TooSlowError:
+            raise TimeoutException(f"No DevTools answer after {timeout}s") from None
+
+    def run(self, async_fn, *args):
+        """Run a coroutine function on the connection thread and return its result"""
+        return trio.from_thread.run(async_fn, *args, trio_token=self._token)
+
+    def stats(self):
+        return dict(self._counts, handlers=len(self._handlers), sessions=len(self._sessions))
+
+
+def cdp_events(driver):
+    """The driver's shared CdpEvents connection, started on first use"""
+    events = getattr(driver, "cdp_events", None)
+    if events is None:
+        events = CdpEvents(driver).start()
+        driver.cdp_events = events
+        quit_driver = driver.quit
+
+        def quit():
+            events.stop()
+            quit_driver()
+        driver.quit = quit
+    return events
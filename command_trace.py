@@ -0,0 +1,173 @@
+"""
+Selenium Helpers: Command Tracing
+Records every WebDriver command a driver sends and where the time goes.
+
+Every Selenium call (find_element, send_keys, get, execute_script,
+screenshot, ...) ends up in driver.execute(). The tracer wraps that single
+method on a driver instance and records, per command:
+
+- name and a short digest of its parameters
+- start and end time (perf_counter_ns)
+- size of the response value
+
+Records can be grouped into sections (one per test) and exported as an
+aggregated table or as a Chrome trace JSON file that chrome://tracing,
+Perfetto or speedscope render as a flame view.
+
+Usage:
+    tracer = CommandTracer()
+    tracer.attach(driver)
+    with tracer.section("test_successful_login"):
+        ...
+    print(tracer.table())
+    tracer.write_chrome_trace("trace.json")
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+from contextlib import contextmanager
+
+ALL = object()  # aggregate()/table() over every section; None means outside any section
+
+
+def _digest(params):
+    """Cheap, stable-enough fingerprint of a command's parameters"""
+    if not params:
+        return ""
+    return format(zlib.crc32(repr(sorted(params.items())).encode("utf-8", "replace")), "08x")
+
+
+def _size(value):
+    """Approximate response size in characters (exact for strings)"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value)
+    return len(repr(value))
+
+
+class CommandTracer:
+    """Collects WebDriver command timings from one or more drivers"""
+
+    def __init__(self):
+        self.records = []  # (section, command, digest, start_ns, end_ns, size, ok, thread)
+        self.sections = []  # (name, start_ns, end_ns, thread)
+        self._local = threading.local()
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def current_section(self):
+        return getattr(self._local, "section", None)
+
+    def attach(self, driver):
+        """Wrap driver.execute so every command is recorded"""
+        if getattr(driver, "_command_tracer", None) is self:
+            return driver
+        execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter_ns()
+            ok = False
+            response = None
+            try:
+                response = execute(driver_command, params)
+                ok = True
+                return response
+            finally:
+                end = time.perf_counter_ns()
+                value = response.get("value") if isinstance(response, dict) else None
+                tracer.records.append((
+                    tracer.current_section, driver_command, _digest(params),
+                    start, end, _size(value), ok, threading.get_ident(),
+                ))
+
+        driver.execute = traced_execute
+        driver._command_tracer = self
+        return driver
+
+    @contextmanager
+    def section(self, name):
+        """Attribute the commands sent inside the block to `name` (e.g. a test)"""
+        previous = self.current_section
+        self._local.section = name
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.sections.append((name, start, time.perf_counter_ns(), threading.get_ident()))
+            self._local.section = previous
+
+    def reset(self):
+        self.records.clear()
+        self.sections.clear()
+
+    def aggregate(self, section=ALL):
+        """
+        Per-command totals for one section (None: commands sent outside any
+        section; ALL: every record), slowest first:
+        {command: {"count", "total_ms", "mean_ms", "max_ms", "bytes", "errors"}}
+        """
+        totals = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "bytes": 0, "errors": 0})
+        for record_section, command, _, start, end, size, ok, _ in self.records:
+            if section is not ALL and record_section != section:
+                continue
+            duration_ms = (end - start) / 1e6
+            entry = totals[command]
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["bytes"] += size
+            entry["errors"] += 0 if ok else 1
+        for entry in totals.values():
+            entry["mean_ms"] = entry["total_ms"] / entry["count"]
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def profile_by_section(self):
+        """{section: aggregate} for every section that sent commands"""
+        names = []
+        for record in self.records:
+            if record[0] not in names:
+                names.append(record[0])
+        return {name: self.aggregate(name) for name in names}
+
+    def table(self, section=ALL):
+        """Aggregated table as text"""
+        rows = self.aggregate(section)
+        total_ms = sum(row["total_ms"] for row in rows.values()) or 1.0
+        lines = [
+            f"{'command':<28}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}{'bytes':>11}{'share':>8}",
+            "-" * 85,
+        ]
+        for command, row in rows.items():
+            lines.append(
+                f"{command:<28}{row['count']:>7}{row['total_ms']:>11.1f}{row['mean_ms']:>10.2f}"
+                f"{row['max_ms']:>10.2f}{row['bytes']:>11}{row['total_ms'] / total_ms:>8.1%}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Trace events in the Chrome trace format (complete 'X' events)"""
+        pid = os.getpid()
+        events = []
+        for name, start, end, thread in self.sections:
+            events.append({
+                "name": name, "cat": "test", "ph": "X", "pid": pid, "tid": thread,
+                "ts": (start - self._origin_ns) / 1000, "dur": (end - start) / 1000,
+            })
+        for section, command, digest, start, end, size, ok, thread in self.records:
+            events.append({
+                "name": command, "cat": "webdriver", "ph": "X", "pid": pid, "tid": thread,
+                "ts": (start - self._origin_ns) / 1000, "dur": (end - start) / 1000,
+                "args": {"section": section, "params": digest, "bytes": size, "ok": ok},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
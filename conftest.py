@@ -0,0 +1,147 @@
+"""
+Shared pytest fixtures for the Selenium examples.
+
+- browser_pool: session-wide pool of warm browsers (size: --pool-size)
+- pooled_driver: a clean browser from the pool for one test
+- fixture_server: local copy of the-internet pages (latency: --latency-ms/--jitter-ms)
+- base_url: where tests navigate; the local server unless --site-url is given
+- auth_cache / authenticated_driver: log in through the UI once per session,
+  then restore the saved session into each test's browser
+- --browser-profile: driver_factory profile for pooled browsers (fast-headless, debug, visual)
+- --sleep-audit: report the wall time spent in fixed time.sleep() calls
+- --trace-commands DIR: per-test WebDriver command profile + Chrome trace JSON
+"""
+
+import os
+
+import pytest
+
+from auth_cache import AuthCache
+from browser_pool import BrowserPool
+from command_trace import CommandTracer
+from driver_factory import PROFILES, create_driver, current_profile
+from fixture_server import FixtureServer
+from waits import SleepAudit
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--pool-size",
+        type=int,
+        default=int(os.environ.get("SELENIUM_POOL_SIZE", "1")),
+        help="number of warm browsers kept alive for the session",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=sorted(PROFILES),
+        default=current_profile(),
+        help="driver_factory profile for the pooled browsers (default: SELENIUM_PROFILE or visual)",
+    )
+    parser.addoption(
+        "--site-url",
+        default=os.environ.get("THE_INTERNET_URL"),
+        help="run against this site instead of the local fixture server",
+    )
+    parser.addoption("--latency-ms", type=float, default=None,
+                     help="latency injected by the local fixture server")
+    parser.addoption("--jitter-ms", type=float, default=None,
+                     help="jitter injected by the local fixture server")
+    parser.addoption("--sleep-audit", action="store_true",
+                     help="report how much wall time fixed sleeps cost per file")
+    parser.addoption("--trace-commands", metavar="DIR", default=None,
+                     help="record every WebDriver command and write a profile to DIR")
+
+
+def pytest_configure(config):
+    if config.getoption("--sleep-audit"):
+        config._sleep_audit = SleepAudit().__enter__()
+    config._command_tracer = CommandTracer() if config.getoption("--trace-commands") else None
+
+
+def pytest_unconfigure(config):
+    audit = getattr(config, "_sleep_audit", None)
+    if audit:
+        audit.__exit__(None, None, None)
+        audit.report()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """Warm browsers shared by every test in the session"""
+    profile = request.config.getoption("--browser-profile")
+    pool = BrowserPool(
+        size=request.config.getoption("--pool-size"),
+        factory=lambda: create_driver(profile),
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_driver(request, browser_pool):
+    """A healthy, freshly reset browser that goes back to the pool afterwards"""
+    driver = browser_pool.acquire()
+    tracer = request.config._command_tracer
+    if tracer is None:
+        yield driver
+        browser_pool.release(driver)
+    else:
+        tracer.attach(driver)
+        with tracer.section(request.node.nodeid):
+            yield driver
+        # The reset commands belong to no test, but should not count as "outside tests"
+        with tracer.section("pool reset"):
+            browser_pool.release(driver)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    tracer = getattr(config, "_command_tracer", None)
+    if not tracer or not tracer.records:
+        return
+    directory = config.getoption("--trace-commands")
+    os.makedirs(directory, exist_ok=True)
+    for section in tracer.profile_by_section():
+        terminalreporter.write_sep("-", f"WebDriver commands: {section or 'outside tests'}")
+        terminalreporter.write_line(tracer.table(section))
+    terminalreporter.write_sep("-", "WebDriver commands: whole session")
+    terminalreporter.write_line(tracer.table())
+    # parallel_runner.py workers share DIR: one trace file per worker
+    worker = os.environ.get("SELENIUM_WORKER_ID")
+    name = f"webdriver-trace-worker{worker}.json" if worker else "webdriver-trace.json"
+    path = tracer.write_chrome_trace(os.path.join(directory, name))
+    terminalreporter.write_line(f"Chrome trace written to {path}")
+
+
+@pytest.fixture(scope="session")
+def fixture_server(request):
+    """Local HTTP server with copies of the the-internet pages"""
+    latency = request.config.getoption("--latency-ms")
+    jitter = request.config.getoption("--jitter-ms")
+    server = FixtureServer(
+        latency=None if latency is None else latency / 1000,
+        jitter=None if jitter is None else jitter / 1000,
+    )
+    with server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    """Base URL of the pages under test"""
+    site_url = request.config.getoption("--site-url")
+    if site_url:
+        return site_url.rstrip("/")
+    return request.getfixturevalue("fixture_server").url
+
+
+@pytest.fixture(scope="session")
+def auth_cache(base_url):
+    """tomsmith's authenticated state, captured by the first test that needs it"""
+    return AuthCache(base_url, "tomsmith", "SuperSecretPassword!")
+
+
+@pytest.fixture
+def authenticated_driver(pooled_driver, auth_cache):
+    """A pooled browser already logged in and on the secure page"""
+    auth_cache.login(pooled_driver)
+    return pooled_driver
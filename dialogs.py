@@ -0,0 +1,185 @@
+"""
+Selenium Helpers: Dialog Policy
+Answers alert/confirm/prompt dialogs as they open, from rules declared up front.
+
+The usual pattern, WebDriverWait(driver, 10).until(EC.alert_is_present())
+and then switch_to.alert, polls for every dialog and needs more commands to
+read and answer it. A DialogPolicy is told beforehand which dialogs to
+expect and how to answer them, and answers each one the moment the browser
+opens it (DevTools Page.javascriptDialogOpening, see cdp_events.py):
+
+- expect(match, action) queues an expectation: "accept", "dismiss", or
+  text="..." to type into a prompt and accept it; match is a substring or
+  compiled regex of the dialog message (None: any dialog)
+- dialogs nobody expected get the default action and are marked unexpected
+- log lists every dialog with its type, message and the answer given,
+  for assertions afterwards
+- wait_handled() waits (no polling) until the expected dialogs are answered
+
+Without DevTools (non-Chromium browsers) wait_handled() falls back to
+switch_to.alert. For dialogs that slip past, create the driver with
+create_driver(prompt_behavior=...) set to the policy's default ("dismiss" or
+"accept") so the driver answers them the same way instead of failing the
+next command.
+
+Usage:
+    dialogs = DialogPolicy(driver)
+    dialogs.expect("I am a JS prompt", text="Hello")
+    driver.find_element(By.CSS_SELECTOR, "button[onclick='jsPrompt()']").click()
+    entry = dialogs.wait_handled()
+    assert entry["message"] == "I am a JS prompt"
+    dialogs.verify()
+"""
+
+import functools
+import threading
+import time
+
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from cdp_events import cdp_events
+
+ACTIONS = ("accept", "dismiss")
+
+
+class DialogPolicy:
+    """Expected dialogs and their answers, applied as the dialogs open"""
+
+    def __init__(self, driver, default="dismiss", events=None):
+        if default not in ACTIONS:
+            raise ValueError(f"default must be one of {ACTIONS}")
+        self.driver = driver
+        self.default = default
+        self.expected = []
+        self.log = []
+        self._attached = set()
+        self._answering = 0  # dialogs taken from the queue but not answered yet
+        self._changed = threading.Condition()
+        try:
+            self.events = events or cdp_events(driver)
+        except WebDriverException:
+            self.events = None  # no DevTools: wait_handled() reads switch_to.alert
+            return
+        devtools = self.events.devtools
+        self.events.on("target.TargetCreated", self._target_created)
+        self.events.execute(devtools.target.set_discover_targets(discover=True))
+        for info in self.events.execute(devtools.target.get_targets()):
+            if info.type_ == "page":
+                self.events.run(self._attach, str(info.target_id))
+
+    # --- declaring ----------------------------------------------------------
+
+    def expect(self, match=None, action="accept", text=None, dialog_type=None):
+        """Queue an expected dialog; text=... answers a prompt (and accepts it)"""
+        if text is not None:
+            action = "accept"
+        if action not in ACTIONS:
+            raise ValueError(f"action must be one of {ACTIONS}")
+        with self._changed:
+            self.expected.append({"match": match, "action": action, "text": text, "type": dialog_type})
+        return self
+
+    def _matches(self, expectation, dialog_type, message):
+        if expectation["type"] and dialog_type and expectation["type"] != dialog_type:
+            return False
+        match = expectation["match"]
+        if match is None:
+            return True
+        if isinstance(match, str):
+            return match in message
+        return match.search(message) is not None
+
+    def _answer(self, dialog_type, message):
+        """Take the first matching expectation (or the default) for a dialog"""
+        with self._changed:
+            self._answering += 1
+            for index, expectation in enumerate(self.expected):
+                if self._matches(expectation, dialog_type, message):
+                    del self.expected[index]
+                    return expectation["action"], expectation["text"], True
+        return self.default, None, False
+
+    def _record(self, dialog_type, message, url, action, text, expected, error=None):
+        with self._changed:
+            self._answering -= 1
+            self.log.append({"type": dialog_type, "message": message, "url": url, "action": action,
+                             "text": text, "expected": expected, "error": error, "time": time.time()})
+            self._changed.notify_all()
+
+    # --- DevTools events (connection thread) --------------------------------
+
+    async def _attach(self, target_id):
+        if target_id in self._attached:
+            return
+        self._attached.add(target_id)
+        await self.events.subscribe("page.JavascriptDialogOpening",
+                                    functools.partial(self._dialog_opening, target_id), target_id)
+        await self.events.send(self.events.devtools.page.enable(), target_id)
+
+    async def _target_created(self, event):
+        if event.target_info.type_ == "page":
+            await self._attach(str(event.target_info.target_id))
+
+    async def _dialog_opening(self, target_id, event):
+        dialog_type = event.type_.value
+        action, text, expected = self._answer(dialog_type, event.message)
+        command = self.events.devtools.page.handle_java_script_dialog(action == "accept", text)
+        error = None
+        try:
+            await self.events.send(command, target_id)
+        except Exception as failure:
+            error = str(failure)  # e.g. the driver answered it first
+        self._record(dialog_type, event.message, event.url, action, text, expected, error)
+
+    # --- waiting and checking -----------------------------------------------
+
+    def _handle_with_webdriver(self, timeout):
+        """Fallback without DevTools: wait for the alert and answer it by command"""
+        try:
+            alert = WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        except TimeoutException:
+            raise TimeoutException(f"No dialog opened within {timeout}s") from None
+        message = alert.text
+        action, text, expected = self._answer(None, message)
+        try:
+            if text is not None:
+                alert.send_keys(text)
+            if action == "accept":
+                alert.accept()
+            else:
+                alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        self._record(None, message, None, action, text, expected)
+
+    def wait_handled(self, timeout=10):
+        """Wait until every expected dialog has been answered; returns the latest log entry"""
+        if self.events is None:
+            while self.expected:
+                self._handle_with_webdriver(timeout)
+            return self.log[-1] if self.log else None
+        with self._changed:
+            if not self._changed.wait_for(lambda: not self.expected and not self._answering, timeout):
+                raise TimeoutException(f"Dialogs still expected after {timeout}s: "
+                                       f"{[e['match'] for e in self.expected]}")
+            return self.log[-1] if self.log else None
+
+    def unexpected(self):
+        return [entry for entry in self.log if not entry["expected"]]
+
+    def verify(self):
+        """Fail if an expected dialog never opened or an unexpected one did"""
+        problems = []
+        if self.expected:
+            problems.append(f"expected dialogs that never opened: {[e['match'] for e in self.expected]}")
+        for entry in self.unexpected():
+            problems.append(f"unexpected {entry['type'] or 'dialog'}: {entry['message']!r} ({entry['action']}ed)")
+        if problems:
+            raise AssertionError("; ".join(problems))
+
+    def stats(self):
+        counts = {"dialogs": len(self.log), "unexpected": len(self.unexpected()),
+                  "pending": len(self.expected), "pages": len(self._attached)}
+        counts["errors"] = sum(1 for entry in self.log if entry["error"])
+        return counts
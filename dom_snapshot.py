@@ -0,0 +1,278 @@
+"""
+Selenium Helpers: DOM Snapshots
+Records the DOM after every step without pulling page_source each time.
+
+driver.page_source serializes and transfers the whole document on every
+call, which is megabytes per step on pages like /large. The snapshotter
+instead:
+
+- Sends the full DOM once per document, as a compact JSON tree in which
+  every node has an id
+- Installs a MutationObserver in the page that turns every change into a
+  small diff operation (add, remove, attr, text) as it happens
+- On later snapshots of the same document, fetches only the collected diffs
+- Streams every snapshot as one line of gzip-compressed JSONL
+
+A new document (navigation, reload) has no observer, so its first snapshot
+is full again. replay() rebuilds the DOM at any step from the file. Frames
+are separate documents and are not followed.
+
+Usage:
+    with DomSnapshotter(driver, "steps.jsonl.gz") as dom:
+        driver.get(url)
+        dom.snapshot("opened")        # full
+        button.click()
+        dom.snapshot("clicked")       # diff only
+    for record, tree in replay("steps.jsonl.gz"):
+        print(record["label"], len(tree.html()))
+
+Command line:
+    python dom_snapshot.py steps.jsonl.gz                   # list the steps
+    python dom_snapshot.py steps.jsonl.gz --html-dir out    # rebuild HTML per step
+"""
+
+import argparse
+import gzip
+import html
+import json
+import os
+import time
+
+# Installs the in-page recorder on first use in a document, then returns
+# either the full tree or the diff operations collected since the last call.
+# arguments[0]: the document token the caller already has a full snapshot of
+# arguments[1]: maximum buffered operations before falling back to a full snapshot
+SNAPSHOT_JS = """
+var known = arguments[0], maxOps = arguments[1];
+var R = window.__domRecorder;
+if (!R) {
+  R = window.__domRecorder = {
+    doc: Date.now().toString(36) + Math.random().toString(36).slice(2),
+    ids: new WeakMap(), next: 1, ops: [], overflow: false
+  };
+  R.id = function (node) {
+    if (!node) { return null; }
+    var id = R.ids.get(node);
+    if (!id) { id = R.next++; R.ids.set(node, id); }
+    return id;
+  };
+  R.serialize = function (node, fresh) {
+    if (fresh) { fresh.add(node); }
+    var id = R.id(node);
+    if (node.nodeType === 3) { return [id, '#text', node.data]; }
+    if (node.nodeType === 8) { return [id, '#comment', node.data]; }
+    if (node.nodeType !== 1) { return null; }
+    var attrs = {};
+    for (var i = 0; i < node.attributes.length; i++) { attrs[node.attributes[i].name] = node.attributes[i].value; }
+    var children = [];
+    for (var c = node.firstChild; c; c = c.nextSibling) {
+      var s = R.serialize(c, fresh);
+      if (s) { children.push(s); }
+    }
+    return [id, node.tagName.toLowerCase(), attrs, children];
+  };
+  R.handle = function (records) {
+    if (R.overflow) { return; }
+    var fresh = new Set();
+    records.forEach(function (m) {
+      if (m.type === 'childList') {
+        Array.prototype.forEach.call(m.removedNodes, function (n) {
+          if (R.ids.has(n)) { R.ops.push(['remove', R.id(n)]); }
+          // A node moved again later in the batch must be serialized again where it lands
+          fresh.forEach(function (f) { if (f === n || n.contains(f)) { fresh.delete(f); } });
+        });
+        Array.prototype.forEach.call(m.addedNodes, function (n) {
+          if (fresh.has(n)) { return; }  // already inside a subtree serialized in this batch
+          var s = R.serialize(n, fresh);
+          if (s) { R.ops.push(['add', R.id(m.target), m.nextSibling ? R.id(m.nextSibling) : null, s]); }
+        });
+      } else if (m.type === 'attributes') {
+        R.ops.push(['attr', R.id(m.target), m.attributeName, m.target.getAttribute(m.attributeName)]);
+      } else if (m.type === 'characterData') {
+        R.ops.push(['text', R.id(m.target), m.target.data]);
+      }
+    });
+    if (R.ops.length > maxOps) { R.ops = []; R.overflow = true; }
+  };
+  R.observer = new MutationObserver(R.handle);
+  R.observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  R.fresh = true;
+}
+R.handle(R.observer.takeRecords());
+if (R.fresh || R.overflow || R.doc !== known) {
+  R.fresh = false;
+  R.overflow = false;
+  R.ops = [];
+  return {type: 'full', doc: R.doc, url: location.href, tree: R.serialize(document.documentElement)};
+}
+var ops = R.ops;
+R.ops = [];
+return {type: 'diff', doc: R.doc, url: location.href, ops: ops};
+"""
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+RAW_TEXT_TAGS = {"script", "style"}
+
+
+def document_length(driver):
+    """Length of the serialized document, measured in the page (no page_source transfer)"""
+    return driver.execute_script("return document.documentElement.outerHTML.length")
+
+
+class DomSnapshotter:
+    """Streams full-then-diff DOM snapshots of one driver to a gzip JSONL file"""
+
+    def __init__(self, driver, path, max_ops=50000):
+        self.driver = driver
+        self.path = path
+        self.max_ops = max_ops
+        self._doc = None
+        self._seq = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self.full = 0
+        self.diffs = 0
+        self.transferred = 0
+
+    def snapshot(self, label=None):
+        """Record the current DOM; returns the record's type, size and operation count"""
+        result = self.driver.execute_script(SNAPSHOT_JS, self._doc, self.max_ops)
+        self._doc = result["doc"]
+        record = {"seq": self._seq, "time": time.time(), "label": label, **result}
+        line = json.dumps(record, separators=(",", ":"))
+        self._file.write(line + "\n")
+        self._seq += 1
+        self.transferred += len(line)
+        if result["type"] == "full":
+            self.full += 1
+        else:
+            self.diffs += 1
+        return {"type": result["type"], "chars": len(line), "ops": len(result.get("ops", ()))}
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self):
+        return {"full": self.full, "diffs": self.diffs, "transferred_chars": self.transferred}
+
+
+class DomTree:
+    """DOM rebuilt from a full snapshot and diff operations"""
+
+    def __init__(self, tree):
+        self.nodes = {}
+        self.root = self._build(tree, None)
+
+    def _build(self, data, parent):
+        if data[1] in ("#text", "#comment"):
+            node = {"id": data[0], "tag": data[1], "text": data[2], "parent": parent}
+        else:
+            node = {"id": data[0], "tag": data[1], "attrs": dict(data[2]), "children": [], "parent": parent}
+            node["children"] = [self._build(child, node) for child in data[3]]
+        self.nodes[node["id"]] = node
+        return node
+
+    def _forget(self, node):
+        self.nodes.pop(node["id"], None)
+        for child in node.get("children", ()):
+            self._forget(child)
+
+    def _detach(self, node):
+        parent = node["parent"]
+        if parent is not None and node in parent["children"]:
+            parent["children"].remove(node)
+        node["parent"] = None
+
+    def apply(self, op):
+        kind = op[0]
+        if kind == "remove":
+            node = self.nodes.get(op[1])
+            if node is not None:
+                self._detach(node)
+                self._forget(node)
+        elif kind == "add":
+            parent = self.nodes.get(op[1])
+            if parent is None or "children" not in parent:
+                return
+            existing = self.nodes.get(op[3][0])
+            if existing is not None:  # a node moved without a remove record
+                self._detach(existing)
+                self._forget(existing)
+            node = self._build(op[3], parent)
+            before = self.nodes.get(op[2]) if op[2] is not None else None
+            siblings = parent["children"]
+            if before is not None and before in siblings:
+                siblings.insert(siblings.index(before), node)
+            else:
+                siblings.append(node)
+        elif kind == "attr":
+            node = self.nodes.get(op[1])
+            if node is not None and "attrs" in node:
+                if op[3] is None:
+                    node["attrs"].pop(op[2], None)
+                else:
+                    node["attrs"][op[2]] = op[3]
+        elif kind == "text":
+            node = self.nodes.get(op[1])
+            if node is not None and "text" in node:
+                node["text"] = op[2]
+
+    def html(self, node=None):
+        node = node or self.root
+        if node["tag"] == "#text":
+            parent = node["parent"]
+            raw = parent is not None and parent["tag"] in RAW_TEXT_TAGS
+            return node["text"] if raw else html.escape(node["text"], quote=False)
+        if node["tag"] == "#comment":
+            return f"<!--{node['text']}-->"
+        attrs = "".join(f' {name}="{html.escape(value)}"' for name, value in node["attrs"].items())
+        if node["tag"] in VOID_TAGS:
+            return f"<{node['tag']}{attrs}>"
+        inner = "".join(self.html(child) for child in node["children"])
+        return f"<{node['tag']}{attrs}>{inner}</{node['tag']}>"
+
+
+def read_snapshots(path):
+    """Yield the records of a snapshot file, one at a time"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def replay(path):
+    """Yield (record, DomTree) with the DOM as it was at every step"""
+    tree = None
+    for record in read_snapshots(path):
+        if record["type"] == "full":
+            tree = DomTree(record["tree"])
+        elif tree is not None:
+            for op in record["ops"]:
+                tree.apply(op)
+        yield record, tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or rebuild a DOM snapshot file")
+    parser.add_argument("path")
+    parser.add_argument("--html-dir", help="write the rebuilt HTML of every step here")
+    args = parser.parse_args()
+
+    if args.html_dir:
+        os.makedirs(args.html_dir, exist_ok=True)
+    for record, tree in replay(args.path):
+        size = len(json.dumps(record, separators=(",", ":")))
+        detail = f"{len(record['ops'])} ops" if record["type"] == "diff" else "full"
+        print(f"{record['seq']:>4}  {record['label'] or '-':<24}{detail:<12}{size:>10} chars  {record['url']}")
+        if args.html_dir and tree is not None:
+            with open(os.path.join(args.html_dir, f"{record['seq']:04d}.html"), "w", encoding="utf-8") as f:
+                f.write(tree.html())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Selenium Helpers: Driver Cache
+Resolves the chromedriver binary once per machine and reuses it everywhere.
+
+Calling ChromeDriverManager().install() for every new browser resolves the
+driver version and touches network/disk metadata each time. This module keeps
+a local, checksum-pinned copy of the driver instead:
+
+- The first lookup on a machine seeds the cache from a local chromedriver
+  (CHROMEDRIVER_PATH, PATH or webdriver-manager's ~/.wdm cache)
+- The binary is copied into the cache and its SHA-256 is pinned in a manifest
+- Every later lookup, from any process, verifies the hash and reuses the copy
+- Nothing is downloaded unless SELENIUM_DRIVER_DOWNLOAD=1 is set explicitly
+
+Usage:
+    from driver_cache import get_driver_path
+    driver = webdriver.Chrome(service=Service(get_driver_path()))
+
+Command line:
+    python driver_cache.py                 # show cache status
+    python driver_cache.py --seed PATH     # pin a specific chromedriver
+    python driver_cache.py --reset         # forget the pinned driver
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import time
+
+DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+CACHE_DIR = os.environ.get(
+    "SELENIUM_DRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "seleniumtesting", "drivers"),
+)
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
+LOCK_STALE_AFTER = 60  # seconds
+
+# Per-process memo so repeated browser launches skip even the hash check
+_resolved_path = None
+
+
+class DriverCacheError(RuntimeError):
+    """Raised when no trusted chromedriver can be resolved from the cache"""
+
+
+class _FileLock:
+    """Minimal cross-process lock based on exclusive file creation"""
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                # Break locks left behind by crashed processes
+                try:
+                    if time.time() - os.path.getmtime(self.path) > LOCK_STALE_AFTER:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise DriverCacheError(f"Timed out waiting for lock {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _sha256(path):
+    """Return the hex SHA-256 digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _manifest_path():
+    return os.path.join(CACHE_DIR, MANIFEST_NAME)
+
+
+def _read_manifest():
+    try:
+        with open(_manifest_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest):
+    # Write atomically so concurrent readers never see a partial file
+    tmp_path = _manifest_path() + f".{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, _manifest_path())
+
+
+def _driver_version(path):
+    """Ask the binary itself for its version (local process, no network)"""
+    try:
+        output = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+        return output.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _find_local_driver():
+    """
+    Look for an existing chromedriver on this machine:
+    1. CHROMEDRIVER_PATH environment variable
+    2. chromedriver on PATH
+    3. Newest driver in webdriver-manager's local cache (~/.wdm)
+    """
+    env_path = os.environ.get("CHROMEDRIVER_PATH")
+    if env_path:
+        if not os.path.isfile(env_path):
+            raise DriverCacheError(f"CHROMEDRIVER_PATH does not exist: {env_path}")
+        return env_path, "CHROMEDRIVER_PATH"
+
+    on_path = shutil.which(DRIVER_NAME)
+    if on_path:
+        return on_path, "PATH"
+
+    wdm_pattern = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver", "**", DRIVER_NAME)
+    candidates = [p for p in glob.glob(wdm_pattern, recursive=True) if os.path.isfile(p)]
+    if candidates:
+        return max(candidates, key=os.path.getmtime), "webdriver-manager cache"
+
+    return None, None
+
+
+def _download_driver():
+    """Fall back to webdriver-manager; only used when explicitly allowed"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install(), "webdriver-manager download"
+
+
+def _pin(source_path, source):
+    """Copy a driver binary into the cache and record its checksum"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    checksum = _sha256(source_path)
+    target_dir = os.path.join(CACHE_DIR, checksum[:16])
+    os.makedirs(target_dir, exist_ok=True)
+    target_path = os.path.join(target_dir, DRIVER_NAME)
+
+    if not os.path.exists(target_path) or _sha256(target_path) != checksum:
+        shutil.copy2(source_path, target_path)
+    os.chmod(target_path, os.stat(target_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    manifest = {
+        "path": target_path,
+        "sha256": checksum,
+        "source": source,
+        "source_path": os.path.abspath(source_path),
+        "version": _driver_version(target_path),
+        "pinned_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    _write_manifest(manifest)
+    return manifest
+
+
+def _verified(manifest):
+    """Return the pinned path if the cached binary still matches its checksum"""
+    path = manifest.get("path")
+    if not path or not os.path.isfile(path):
+        return None
+    if _sha256(path) != manifest.get("sha256"):
+        raise DriverCacheError(
+            f"Checksum mismatch for cached driver {path}. "
+            "Run 'python driver_cache.py --reset' and seed it again."
+        )
+    return path
+
+
+def get_driver_path(allow_download=None):
+    """
+    Return the path of a verified chromedriver binary.
+
+    The result is memoized for the rest of the process, so launching many
+    browsers costs a single lookup. allow_download defaults to the
+    SELENIUM_DRIVER_DOWNLOAD environment variable and is off otherwise.
+    """
+    global _resolved_path
+    if _resolved_path:
+        return _resolved_path
+
+    if allow_download is None:
+        allow_download = os.environ.get("SELENIUM_DRIVER_DOWNLOAD") == "1"
+
+    manifest = _read_manifest()
+    path = _verified(manifest) if manifest else None
+
+    if path is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with _FileLock(os.path.join(CACHE_DIR, LOCK_NAME)):
+            # Another process may have seeded the cache while we waited
+            manifest = _read_manifest()
+            path = _verified(manifest) if manifest else None
+            if path is None:
+                source_path, source = _find_local_driver()
+                if source_path is None:
+                    if not allow_download:
+                        raise DriverCacheError(
+                            "No local chromedriver found. Put one on PATH, set "
+                            "CHROMEDRIVER_PATH, or set SELENIUM_DRIVER_DOWNLOAD=1 "
+                            "to let webdriver-manager fetch it once."
+                        )
+                    source_path, source = _download_driver()
+                path = _pin(source_path, source)["path"]
+
+    _resolved_path = path
+    return path
+
+
+def reset_cache():
+    """Forget the pinned driver (cached binaries are removed as well)"""
+    global _resolved_path
+    _resolved_path = None
+    if os.path.isdir(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local chromedriver cache")
+    parser.add_argument("--seed", metavar="PATH", help="pin this chromedriver binary")
+    parser.add_argument("--reset", action="store_true", help="remove the pinned driver")
+    args = parser.parse_args()
+
+    if args.reset:
+        reset_cache()
+        print(f"Cache cleared: {CACHE_DIR}")
+    if args.seed:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with _FileLock(os.path.join(CACHE_DIR, LOCK_NAME)):
+            manifest = _pin(args.seed, "manual seed")
+        print(f"Pinned {manifest['path']} ({manifest['sha256'][:12]}...)")
+        return
+
+    manifest = _read_manifest()
+    if not manifest:
+        print(f"No driver pinned yet in {CACHE_DIR}")
+        return
+    print(f"Driver:  {manifest['path']}")
+    print(f"Version: {manifest.get('version')}")
+    print(f"SHA-256: {manifest['sha256']}")
+    print(f"Source:  {manifest['source']} ({manifest.get('source_path')})")
+    print(f"Pinned:  {manifest['pinned_at']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Selenium Helpers: Driver Factory
+One place to build browsers, with named performance profiles.
+
+Profiles:
+- fast-headless: new headless mode, no GPU, no images, no extensions,
+                 background networking disabled, small window
+- debug:         visible browser with verbose chromedriver logging
+- visual:        visible, maximized browser (the default, like the examples)
+
+The profile is picked by, in order: the `profile` argument, a `--profile NAME`
+command line flag (see select_profile_from_argv), the SELENIUM_PROFILE
+environment variable, and finally "visual". Every launch records its measured
+cold-start time per profile so the profiles can be compared.
+
+Usage:
+    driver = create_driver()                  # profile from flag/env
+    driver = create_driver("fast-headless")
+
+Command line:
+    python driver_factory.py                  # measured cold-start times
+    python driver_factory.py --measure 3      # launch each profile 3 times
+    python 02_find_elements.py --profile fast-headless
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from driver_cache import CACHE_DIR, DriverCacheError, _FileLock, get_driver_path
+
+DEFAULT_PROFILE = "visual"
+TIMINGS_PATH = os.path.join(CACHE_DIR, "profile_timings.json")
+MAX_SAMPLES = 50
+
+PROFILES = {
+    "fast-headless": {
+        "arguments": [
+            "--headless=new",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--disable-dev-shm-usage",
+            "--no-first-run",
+            "--mute-audio",
+            "--blink-settings=imagesEnabled=false",
+            "--window-size=800,600",
+        ],
+        "prefs": {"profile.managed_default_content_settings.images": 2},
+        "maximize": False,
+        "verbose_log": False,
+    },
+    "debug": {
+        "arguments": ["--enable-logging", "--v=1"],
+        "prefs": {},
+        "maximize": True,
+        "verbose_log": True,
+    },
+    "visual": {
+        "arguments": [],
+        "prefs": {},
+        "maximize": True,
+        "verbose_log": False,
+    },
+}
+
+
+def select_profile_from_argv(argv=None):
+    """
+    Pick up a `--profile NAME` flag from the command line of an example script.
+    The choice is stored in SELENIUM_PROFILE so every driver created afterwards
+    (including in child processes) uses it.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", choices=sorted(PROFILES))
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    if args.profile:
+        os.environ["SELENIUM_PROFILE"] = args.profile
+    return current_profile()
+
+
+def current_profile():
+    return os.environ.get("SELENIUM_PROFILE", DEFAULT_PROFILE)
+
+
+def build_options(profile):
+    """Chrome options for a profile"""
+    settings = PROFILES[profile]
+    options = Options()
+    for argument in settings["arguments"]:
+        options.add_argument(argument)
+    if settings["prefs"]:
+        options.add_experimental_option("prefs", settings["prefs"])
+    return options
+
+
+def build_service(profile):
+    settings = PROFILES[profile]
+    if settings["verbose_log"]:
+        return Service(get_driver_path(), service_args=["--verbose"], log_output=f"chromedriver-{profile}.log")
+    return Service(get_driver_path())
+
+
+def _load_timings():
+    try:
+        with open(TIMINGS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def record_cold_start(profile, seconds):
+    """Append a cold-start measurement for a profile (kept across runs)"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Parallel workers launch at the same time: without the lock they
+        # would read the same file and drop each other's samples
+        with _FileLock(f"{TIMINGS_PATH}.lock", timeout=5):
+            timings = _load_timings()
+            samples = timings.get(profile, [])
+            samples.append(round(seconds, 4))
+            timings[profile] = samples[-MAX_SAMPLES:]
+            tmp_path = f"{TIMINGS_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(timings, f, indent=2)
+            os.replace(tmp_path, TIMINGS_PATH)
+    except (OSError, DriverCacheError):
+        pass  # timings are informational; never fail a launch over them
+
+
+def cold_start_stats():
+    """{profile: {"samples", "last", "median", "min"}} in seconds"""
+    stats = {}
+    for profile, samples in _load_timings().items():
+        if samples:
+            stats[profile] = {
+                "samples": len(samples),
+                "last": samples[-1],
+                "median": statistics.median(samples),
+                "min": min(samples),
+            }
+    return stats
+
+
+def create_driver(profile=None, prompt_behavior=None):
+    """
+    Create a Chrome driver for a profile and record its cold-start time.
+    prompt_behavior sets the unhandledPromptBehavior capability ("accept",
+    "dismiss", "ignore", ...): what the driver does with a dialog that is
+    still open when the next command arrives.
+    """
+    profile = profile or current_profile()
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile {profile!r}; choose from {', '.join(sorted(PROFILES))}")
+
+    options = build_options(profile)
+    if prompt_behavior:
+        options.unhandled_prompt_behavior = prompt_behavior
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=build_service(profile), options=options)
+    if PROFILES[profile]["maximize"]:
+        driver.maximize_window()
+    elapsed = time.perf_counter() - start
+
+    driver.profile = profile
+    driver.cold_start = elapsed
+    record_cold_start(profile, elapsed)
+    return driver
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browser profiles and their cold-start times")
+    parser.add_argument("--measure", type=int, default=0, metavar="N",
+                        help="launch each profile N times before reporting")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=sorted(PROFILES))
+    args = parser.parse_args()
+
+    for _ in range(args.measure):
+        for profile in args.profiles:
+            driver = create_driver(profile)
+            print(f"{profile:<15} cold start {driver.cold_start:.3f}s")
+            driver.quit()
+
+    stats = cold_start_stats()
+    print(f"\n{'profile':<15}{'samples':>9}{'last':>9}{'median':>9}{'min':>9}")
+    for profile in sorted(PROFILES):
+        row = stats.get(profile)
+        if row:
+            print(f"{profile:<15}{row['samples']:>9}{row['last']:>8.3f}s{row['median']:>8.3f}s{row['min']:>8.3f}s")
+        else:
+            print(f"{profile:<15}{'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
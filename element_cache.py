@@ -0,0 +1,134 @@
+"""
+Selenium Helpers: Element Cache
+Reuses element handles instead of re-finding the same locator over and over.
+
+Elements are cached per (document, locator). The cache treats every
+navigation (get/back/forward/refresh) and every window or frame switch as a
+new document and drops its entries. Navigations it cannot see, such as a
+click that submits a form, are caught lazily: a cached element that raises
+StaleElementReferenceException re-resolves its locator and retries the
+command once.
+
+Usage:
+    cache = ElementCache(driver)
+    box_a = cache.find(By.ID, "column-a")   # miss: one find command
+    box_a = cache.find(By.ID, "column-a")   # hit: no command at all
+    print(cache.stats())
+"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from page_objects import resolve_locators
+
+NAVIGATION_METHODS = ("get", "back", "forward", "refresh")
+SWITCH_METHODS = ("window", "frame", "default_content", "parent_frame", "new_window")
+
+
+class CachedElement(WebElement):
+    """
+    A WebElement that remembers its locator.
+    If the element goes stale, it is found again and the command is retried.
+    """
+
+    def __init__(self, cache, locator, element):
+        super().__init__(element.parent, element.id)
+        self._cache = cache
+        self._locator = locator
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._cache._refresh(self._locator).id
+            return super()._execute(command, params)
+
+
+class ElementCache:
+    """Caches element handles per document and locator"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+        self._document = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+        self._track_navigation()
+
+    def _invalidating(self, method):
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.invalidate()
+        return wrapper
+
+    def _track_navigation(self):
+        """Invalidate the cache whenever the driver changes document"""
+        for name in NAVIGATION_METHODS:
+            setattr(self.driver, name, self._invalidating(getattr(self.driver, name)))
+        switch_to = self.driver.switch_to
+        for name in SWITCH_METHODS:
+            setattr(switch_to, name, self._invalidating(getattr(switch_to, name)))
+
+    def invalidate(self):
+        """Forget every cached element (the document changed)"""
+        self._document += 1
+        self._elements.clear()
+        self.invalidations += 1
+
+    def _store(self, locator, element):
+        cached = CachedElement(self, locator, element)
+        self._elements[(self._document, locator)] = cached
+        return cached
+
+    def _refresh(self, locator):
+        """Re-resolve a stale element (the page changed without us noticing)"""
+        self.stale += 1
+        self.misses += 1
+        self.invalidate()
+        return self._store(locator, self.driver.find_element(*locator))
+
+    def find(self, by, value):
+        """Return the cached element for a locator, finding it on a miss"""
+        locator = (by, value)
+        cached = self._elements.get((self._document, locator))
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        return self._store(locator, self.driver.find_element(by, value))
+
+    def find_many(self, locators, timeout=0):
+        """
+        Resolve {name: (By, value)} locators; cache misses are resolved
+        together in one round trip (see page_objects.resolve_locators).
+        """
+        found = {}
+        missing = {}
+        for name, locator in locators.items():
+            cached = self._elements.get((self._document, tuple(locator)))
+            if cached is not None:
+                self.hits += 1
+                found[name] = cached
+            else:
+                missing[name] = tuple(locator)
+        if missing:
+            self.misses += len(missing)
+            resolved = resolve_locators(self.driver, missing, timeout)
+            for name, element in resolved.items():
+                found[name] = self._store(missing[name], element)
+        return found
+
+    def stats(self):
+        """Hit/miss counters; saved_commands counts finds that were never sent"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_recoveries": self.stale,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_commands": self.hits - self.stale,
+        }
@@ -0,0 +1,121 @@
+"""
+Selenium Helpers: Element Collections
+Reads a property of every element in a find_elements() result in one call.
+
+Looping over find_elements() and reading .text or get_attribute() sends one
+command per element per value. An ElementCollection fetches the value for
+all of its elements with a single execute_script call, in document order:
+
+- texts()        visible text, like element.text
+- attrs(name)    the raw attribute, like element.get_dom_attribute(name)
+- props(names)   {name: value} DOM properties per element (e.g. "href", "checked")
+- displayed()    visibility, like element.is_displayed()
+- rects()        {"x", "y", "width", "height"} in page coordinates, like element.rect
+
+If an element has gone stale, the collection finds its locator again and
+retries once. A collection built from plain elements, with no locator, reads
+the remaining elements one by one and returns None for the stale ones.
+
+Usage:
+    links = ElementCollection.find(driver, By.TAG_NAME, "a")
+    for text, link in zip(links.texts(), links.props(["href"])):
+        print(text, link["href"])  # the resolved URL; attrs("href") gives it as written
+"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+from waits import LOCATOR_JS
+
+# arguments: elements, kind, argument for the kind
+_COLLECT_JS = LOCATOR_JS + """
+var elements = arguments[0], kind = arguments[1], arg = arguments[2];
+return elements.map(function (el) {
+  if (!el || !el.isConnected) { return null; }
+  switch (kind) {
+    case 'text':
+      return __isVisible(el) ? (el.innerText || '').trim() : '';
+    case 'attr':
+      return el.getAttribute(arg);
+    case 'props':
+      var out = {};
+      arg.forEach(function (name) {
+        var value = el[name];
+        out[name] = (value === undefined || typeof value === 'function' || (value && typeof value === 'object')) ? null : value;
+      });
+      return out;
+    case 'displayed':
+      return __isVisible(el);
+    case 'rect':
+      var r = el.getBoundingClientRect();
+      return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+  }
+  throw new Error('Unknown collection query: ' + kind);
+});
+"""
+
+
+class ElementCollection:
+    """An ordered list of WebElements with batched reads"""
+
+    def __init__(self, driver, elements, locator=None):
+        self.driver = driver
+        self.elements = list(elements)
+        self.locator = locator
+        self.round_trips = 0
+
+    @classmethod
+    def find(cls, driver, by, value):
+        """find_elements() that remembers its locator for stale recovery"""
+        return cls(driver, driver.find_elements(by, value), (by, value))
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ElementCollection(self.driver, self.elements[index])
+        return self.elements[index]
+
+    def refresh(self):
+        """Find the elements again (only possible with a locator)"""
+        self.elements = self.driver.find_elements(*self.locator)
+        self.round_trips += 1
+        return self
+
+    def _query(self, kind, arg=None):
+        if not self.elements:
+            return []
+        self.round_trips += 1
+        try:
+            return self.driver.execute_script(_COLLECT_JS, self.elements, kind, arg)
+        except StaleElementReferenceException:
+            if self.locator is not None:
+                self.refresh()
+                self.round_trips += 1
+                return self.driver.execute_script(_COLLECT_JS, self.elements, kind, arg)
+        # No locator: keep what is still attached, one element at a time
+        values = []
+        for element in self.elements:
+            self.round_trips += 1
+            try:
+                values.append(self.driver.execute_script(_COLLECT_JS, [element], kind, arg)[0])
+            except StaleElementReferenceException:
+                values.append(None)
+        return values
+
+    def texts(self):
+        return self._query("text")
+
+    def attrs(self, name):
+        return self._query("attr", name)
+
+    def props(self, names):
+        return self._query("props", list(names))
+
+    def displayed(self):
+        return self._query("displayed")
+
+    def rects(self):
+        return self._query("rect")
@@ -0,0 +1,325 @@
+"""
+Selenium Helpers: Local Fixture Server
+Serves local copies of the the-internet.herokuapp.com pages used by the examples.
+
+Running the examples against the real site pays internet latency on every
+request and breaks offline. This server starts in a few milliseconds on a
+background thread and serves the pages from fixture_pages/:
+
+    /login, /authenticate, /secure, /logout, /dynamic_loading/1 and /2,
+    /iframe, /windows, /windows/new, /large, /javascript_alerts, /checkboxes,
+    /dropdown, /radio_buttons, /hovers, /drag_and_drop, /context_menu
+
+Latency and jitter can be injected per request with a seeded random
+generator, so benchmarks stay deterministic.
+
+Usage:
+    with FixtureServer(latency=0.05, jitter=0.01) as server:
+        driver.get(server.url + "/login")
+
+Command line (serve in the foreground and point the examples at it):
+    python fixture_server.py --port 8000
+    THE_INTERNET_URL=http://127.0.0.1:8000 python 11_login_test.py
+"""
+
+import argparse
+import http.cookies
+import os
+import random
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+REMOTE_URL = "https://the-internet.herokuapp.com"
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixture_pages")
+
+VALID_USERNAME = "tomsmith"
+VALID_PASSWORD = "SuperSecretPassword!"
+SESSION_COOKIE = "rack.session"
+FLASH_COOKIE = "flash"
+
+# path -> template file (without .html)
+PAGES = {
+    "/": "index",
+    "/login": "login",
+    "/secure": "secure",
+    "/dynamic_loading": "dynamic_loading",
+    "/dynamic_loading/1": "dynamic_loading_1",
+    "/dynamic_loading/2": "dynamic_loading_2",
+    "/iframe": "iframe",
+    "/windows": "windows",
+    "/windows/new": "windows_new",
+    "/large": "large",
+    "/javascript_alerts": "javascript_alerts",
+    "/checkboxes": "checkboxes",
+    "/dropdown": "dropdown",
+    "/radio_buttons": "radio_buttons",
+    "/hovers": "hovers",
+    "/drag_and_drop": "drag_and_drop",
+    "/context_menu": "context_menu",
+}
+
+# Pages that are complete documents rather than content for the layout
+STANDALONE_PAGES = {"windows_new"}
+
+
+def base_url():
+    """
+    Base URL the examples should use.
+    Defaults to the real site; set THE_INTERNET_URL to use a local server.
+    """
+    return os.environ.get("THE_INTERNET_URL", REMOTE_URL).rstrip("/")
+
+
+def _load_templates():
+    templates = {}
+    for name in os.listdir(PAGES_DIR):
+        if name.endswith(".html"):
+            with open(os.path.join(PAGES_DIR, name), "r", encoding="utf-8") as f:
+                templates[name[:-5]] = f.read()
+    return templates
+
+
+def _render(template, **values):
+    for key, value in values.items():
+        template = template.replace("{{" + key + "}}", str(value))
+    return template
+
+
+def _large_page_parts(size=50):
+    """Build the deep sibling tree and the size x size table of /large"""
+    siblings = []
+    for level in range(1, size + 1):
+        siblings.append(
+            f'<div class="parent"><div id="sibling-{level}.1">{level}.1</div>'
+            f'<div id="sibling-{level}.2">{level}.2</div>'
+            f'<div id="sibling-{level}.3">{level}.3</div>'
+        )
+    siblings.append("</div>" * size)
+
+    head = "".join(f'<th class="column-{col}">{col}</th>' for col in range(1, size + 1))
+    rows = []
+    for row in range(1, size + 1):
+        cells = "".join(
+            f'<td class="column-{col}">{row}.{col}</td>' for col in range(1, size + 1)
+        )
+        rows.append(f'<tr class="row-{row}">{cells}</tr>')
+
+    return {"siblings": "".join(siblings), "table_head": head, "table_body": "\n".join(rows)}
+
+
+class FixtureServer:
+    """Threaded local HTTP server for the example pages"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, jitter=None, seed=0,
+                 dynamic_delay=None):
+        """
+        latency/jitter are in seconds (each request waits latency +/- jitter).
+        They default to FIXTURE_LATENCY_MS / FIXTURE_JITTER_MS.
+        dynamic_delay is the /dynamic_loading spinner time, 5s like the real site
+        unless FIXTURE_DYNAMIC_DELAY_MS says otherwise.
+        """
+        if latency is None:
+            latency = float(os.environ.get("FIXTURE_LATENCY_MS", "0")) / 1000
+        if jitter is None:
+            jitter = float(os.environ.get("FIXTURE_JITTER_MS", "0")) / 1000
+        if dynamic_delay is None:
+            dynamic_delay = float(os.environ.get("FIXTURE_DYNAMIC_DELAY_MS", "5000")) / 1000
+
+        self.host = host
+        self.port = port
+        self.dynamic_delay = dynamic_delay
+        self.sessions = set()
+        self.request_count = 0
+        self._templates = _load_templates()
+        self._large_parts = _large_page_parts()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.set_latency(latency, jitter)
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def set_latency(self, latency=0.0, jitter=0.0, seed=None):
+        """Switch injected latency at runtime; pass seed to restart the sequence"""
+        with self._lock:
+            self.latency = latency
+            self.jitter = jitter
+            if seed is not None:
+                self._random.seed(seed)
+
+    def _next_delay(self):
+        with self._lock:
+            self.request_count += 1
+            if not self.latency and not self.jitter:
+                return 0.0
+            offset = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+            return max(0.0, self.latency + offset)
+
+    def render(self, path, flash=None):
+        """Render a page body; returns None for unknown paths"""
+        name = PAGES.get(path)
+        if name is None:
+            return None
+        content = self._templates[name]
+        if name == "large":
+            content = _render(content, **self._large_parts)
+        content = _render(content, dynamic_delay_ms=int(self.dynamic_delay * 1000))
+        if name in STANDALONE_PAGES:
+            return content
+
+        flash_html = ""
+        if flash:
+            kind, message = flash
+            flash_html = _render(self._templates["_flash"], kind=kind, message=message)
+        return _render(self._templates["_layout"], flash=flash_html, content=content)
+
+    def start(self):
+        server = self
+
+        class Handler(FixtureRequestHandler):
+            fixture = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the fixture pages, including the login flow"""
+
+    fixture = None  # set by FixtureServer.start()
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+    def _cookies(self):
+        cookies = http.cookies.SimpleCookie()
+        cookies.load(self.headers.get("Cookie", ""))
+        return {key: morsel.value for key, morsel in cookies.items()}
+
+    def _logged_in(self, cookies):
+        return cookies.get(SESSION_COOKIE) in self.fixture.sessions
+
+    def _redirect(self, location, flash=None, set_cookies=()):
+        self.send_response(303)
+        self.send_header("Location", location)
+        if flash:
+            self.send_header("Set-Cookie", f"{FLASH_COOKIE}={quote(flash[0] + ':' + flash[1])}; Path=/")
+        for cookie in set_cookies:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_html(self, status, body, cookies):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        if FLASH_COOKIE in cookies:
+            # Flash messages are shown once
+            self.send_header("Set-Cookie", f"{FLASH_COOKIE}=; Path=/; Max-Age=0")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _delay(self):
+        delay = self.fixture._next_delay()
+        if delay:
+            time.sleep(delay)
+
+    def do_GET(self):
+        self._delay()
+        path = urlsplit(self.path).path.rstrip("/") or "/"
+        cookies = self._cookies()
+
+        if path == "/logout":
+            self.fixture.sessions.discard(cookies.get(SESSION_COOKIE))
+            self._redirect("/login", ("success", "You logged out of the secure area!"),
+                           [f"{SESSION_COOKIE}=; Path=/; Max-Age=0"])
+            return
+        if path == "/secure" and not self._logged_in(cookies):
+            self._redirect("/login", ("error", "You must login to view the secure area!"))
+            return
+
+        flash = None
+        if cookies.get(FLASH_COOKIE):
+            kind, _, message = unquote(cookies[FLASH_COOKIE]).partition(":")
+            flash = (kind, message)
+
+        body = self.fixture.render(path, flash)
+        if body is None:
+            self._send_html(404, "<h1>Not Found</h1>", cookies)
+        else:
+            self._send_html(200, body, cookies)
+
+    def do_POST(self):
+        self._delay()
+        path = urlsplit(self.path).path
+        if path != "/authenticate":
+            self._send_html(404, "<h1>Not Found</h1>", {})
+            return
+
+        length = int(self.headers.get("Content-Length", "0"))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        username = form.get("username", [""])[0]
+        password = form.get("password", [""])[0]
+
+        if username != VALID_USERNAME:
+            self._redirect("/login", ("error", "Your username is invalid!"))
+        elif password != VALID_PASSWORD:
+            self._redirect("/login", ("error", "Your password is invalid!"))
+        else:
+            token = secrets.token_hex(16)
+            self.fixture.sessions.add(token)
+            self._redirect("/secure", ("success", "You logged into a secure area!"),
+                           [f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the example pages locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=None)
+    parser.add_argument("--jitter-ms", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FixtureServer(
+        args.host,
+        args.port,
+        latency=None if args.latency_ms is None else args.latency_ms / 1000,
+        jitter=None if args.jitter_ms is None else args.jitter_ms / 1000,
+        seed=args.seed,
+    ).start()
+    print(f"Serving example pages on {server.url}")
+    print(f"Point the examples at it with: THE_INTERNET_URL={server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
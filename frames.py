@@ -0,0 +1,174 @@
+"""
+Selenium Helpers: Frame Navigation
+Frame-scoped blocks that send as few switch commands as possible.
+
+Working inside nested frames by hand means find_element + switch_to.frame
+for every level, and switch_to.default_content afterwards, for every
+interaction. A FrameNavigator:
+
+- Remembers which frame path the driver is in, so entering the frame it is
+  already in costs nothing
+- Moves between paths through their common ancestor, with parent_frame or
+  a single default_content, whichever needs fewer commands
+- Caches frame element references per path (found again if they go stale)
+- Restores the outer context when a block ends, in one step where possible
+- Counts every switch command it sent and every one it skipped
+
+It also watches the driver's own switch and navigation methods, so switches
+made by hand keep its idea of the current frame accurate.
+
+Frames are given as an id/name string, an index, a (By, value) locator or
+a WebElement.
+
+Usage:
+    frames = FrameNavigator(driver)
+    with frames.frame("mce_0_ifr"):
+        editor = driver.find_element(By.ID, "tinymce")
+    with frames.frame("outer", (By.CSS_SELECTOR, "iframe.inner")):
+        ...
+    print(frames.stats())
+"""
+
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+NAVIGATION_METHODS = ("get", "back", "forward", "refresh")
+
+
+class FrameNavigator:
+    """Tracks the driver's frame path and switches only when needed"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.path = ()
+        self._elements = {}  # frame path -> WebElement of its last frame
+        self._counts = {"frame": 0, "parent_frame": 0, "default_content": 0,
+                        "skipped": 0, "lookups": 0, "cache_hits": 0}
+        self._internal = False
+        self._switch = {}
+        self._track_driver()
+
+    # --- keeping track of switches made outside the navigator --------------
+
+    def _tracked(self, method, update):
+        def wrapper(*args, **kwargs):
+            result = method(*args, **kwargs)
+            if not self._internal:
+                update(*args, **kwargs)
+            return result
+        return wrapper
+
+    def _entered(self, *args, **kwargs):
+        ref = args[0] if args else kwargs["frame_reference"]
+        self.path = self.path + (ref,)
+
+    def _reset(self, *args, **kwargs):
+        self.path = ()
+        self._elements.clear()
+
+    def _track_driver(self):
+        switch_to = self.driver.switch_to
+        for name in ("frame", "parent_frame", "default_content", "window", "new_window"):
+            self._switch[name] = getattr(switch_to, name)
+        switch_to.frame = self._tracked(self._switch["frame"], self._entered)
+        switch_to.parent_frame = self._tracked(self._switch["parent_frame"], lambda: setattr(self, "path", self.path[:-1]))
+        switch_to.default_content = self._tracked(self._switch["default_content"], lambda: setattr(self, "path", ()))
+        switch_to.window = self._tracked(self._switch["window"], self._reset)
+        switch_to.new_window = self._tracked(self._switch["new_window"], self._reset)
+        for name in NAVIGATION_METHODS:
+            setattr(self.driver, name, self._tracked(getattr(self.driver, name), self._reset))
+
+    # --- switching ----------------------------------------------------------
+
+    def _send(self, name, *args):
+        self._counts[name] += 1
+        self._internal = True
+        try:
+            self._switch[name](*args)
+        finally:
+            self._internal = False
+
+    def _frame_element(self, path):
+        """WebElement for the last frame of `path`, with the driver in its parent"""
+        cached = self._elements.get(path)
+        if cached is not None:
+            self._counts["cache_hits"] += 1
+            return cached
+        ref = path[-1]
+        self._counts["lookups"] += 1
+        if isinstance(ref, str):
+            try:
+                element = self.driver.find_element(By.ID, ref)
+            except NoSuchElementException:
+                element = self.driver.find_element(By.NAME, ref)
+        elif isinstance(ref, tuple):
+            element = self.driver.find_element(*ref)
+        else:
+            element = ref
+        self._elements[path] = element
+        return element
+
+    def _enter(self, path):
+        """Switch from the parent of `path` into its last frame"""
+        if isinstance(path[-1], int):
+            self._send("frame", path[-1])  # an index needs no lookup
+        else:
+            try:
+                self._send("frame", self._frame_element(path))
+            except StaleElementReferenceException:
+                # The frame was re-rendered: forget it and everything cached below it
+                for cached in [p for p in self._elements if p[:len(path)] == path]:
+                    del self._elements[cached]
+                self._send("frame", self._frame_element(path))
+        self.path = path
+
+    def switch(self, *path):
+        """Move to an absolute frame path (no arguments: the top document)"""
+        target = tuple(path)
+        if target == self.path:
+            self._counts["skipped"] += 1
+            return
+        common = 0
+        while common < min(len(target), len(self.path)) and target[common] == self.path[common]:
+            common += 1
+        up = len(self.path) - common
+        if up:
+            # Climb with parent_frame, or jump to the top and come back down,
+            # whichever sends fewer commands
+            if up <= 1 + common:
+                for _ in range(up):
+                    self._send("parent_frame")
+                    self.path = self.path[:-1]
+            else:
+                self._send("default_content")
+                self.path = ()
+        for depth in range(len(self.path) + 1, len(target) + 1):
+            self._enter(target[:depth])
+
+    @contextmanager
+    def frame(self, *path):
+        """Work inside a frame path relative to the current frame; the outer frame is restored afterwards"""
+        outer = self.path
+        self.switch(*outer, *path)
+        try:
+            yield self.driver
+        finally:
+            self.switch(*outer)
+
+    @contextmanager
+    def at(self, *path):
+        """Like frame(), but the path starts at the top document"""
+        outer = self.path
+        self.switch(*path)
+        try:
+            yield self.driver
+        finally:
+            self.switch(*outer)
+
+    def stats(self):
+        """Switch commands sent per kind, switches skipped, and frame lookups vs cache hits"""
+        counts = dict(self._counts)
+        counts["switch_commands"] = counts["frame"] + counts["parent_frame"] + counts["default_content"]
+        return counts
@@ -0,0 +1,248 @@
+"""
+Selenium Helpers: Page Objects
+Declare a page's locators once and resolve them together in one round trip.
+
+Every driver.find_element() call is a separate HTTP command to chromedriver.
+A PageObject resolves a whole group of locators (ID, CSS, XPath, ... mixed)
+with a single execute_script call that returns WebElement references. Any
+locator the batch cannot resolve falls back to a regular find_element, so
+error messages and waiting behaviour stay the same.
+
+Forms can be filled the same way: fill_form() sets every field, fires the
+input/change events a user would trigger and optionally submits, all in one
+script call. faithful=True types with native key events instead, for apps
+that listen to keydown/keyup.
+
+Usage:
+    page = LoginPage(driver)
+    page.open(BASE_URL)
+    form = page.resolve()
+    form.username.send_keys("tomsmith")
+
+    page.login("tomsmith", "SuperSecretPassword!")
+"""
+
+from types import SimpleNamespace
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from waits import LOCATOR_JS
+
+_RESOLVE_JS = LOCATOR_JS + """
+return arguments[0].map(function (locator) {
+  try { return __findBy(locator[0], locator[1]); } catch (e) { return null; }
+});
+"""
+
+
+def resolve_locators(driver, locators, timeout=0):
+    """
+    Resolve {name: (By, value)} locators in one execute_script call.
+
+    Returns {name: WebElement}. Locators the batch could not resolve are
+    looked up one by one with find_element (waiting up to timeout seconds),
+    which raises the usual NoSuchElementException/TimeoutException.
+    """
+    names = list(locators)
+    try:
+        found = driver.execute_script(_RESOLVE_JS, [list(locators[name]) for name in names])
+    except JavascriptException:
+        found = [None] * len(names)
+
+    elements = {}
+    for name, element in zip(names, found):
+        if element is None:
+            element = _find_single(driver, locators[name], timeout)
+        elements[name] = element
+    return elements
+
+
+_FILL_JS = LOCATOR_JS + """
+var fields = arguments[0], submit = arguments[1];
+function resolve(target) {
+  return Array.isArray(target) ? __findBy(target[0], target[1]) : target;
+}
+
+// Resolve everything first so a missing field leaves the form untouched
+var elements = fields.map(function (field) { return resolve(field[0]); });
+var submitElement = submit === null ? null : resolve(submit);
+var missing = [];
+elements.forEach(function (el, i) { if (!el) { missing.push(i); } });
+if (submit !== null && !submitElement) { missing.push(-1); }
+if (missing.length) { return {missing: missing, unmatched: []}; }
+
+function optionFor(select, value) {
+  var options = Array.prototype.slice.call(select.options);
+  return options.filter(function (o) { return o.value === value; })[0] ||
+         options.filter(function (o) { return o.text.trim() === value; })[0] || null;
+}
+
+// Selects need an option with that value or text, like Select.select_by_*()
+var unmatched = [];
+elements.forEach(function (el, i) {
+  if (el.tagName.toLowerCase() === 'select' && !optionFor(el, fields[i][1])) { unmatched.push(i); }
+});
+if (unmatched.length) { return {missing: [], unmatched: unmatched}; }
+
+function setValue(el, value) {
+  var tag = el.tagName.toLowerCase(), type = (el.type || '').toLowerCase();
+  if (type === 'checkbox' || type === 'radio') {
+    if (el.checked !== !!value) { el.click(); }  // click fires input/change itself
+    return;
+  }
+  if (el.focus) { el.focus(); }
+  if (tag === 'select') {
+    optionFor(el, value).selected = true;
+  } else if (el.isContentEditable) {
+    el.textContent = value;
+  } else {
+    // Use the native setter so frameworks tracking the value notice the change
+    var proto = tag === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+  }
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  if (el.blur) { el.blur(); }
+}
+
+elements.forEach(function (el, i) { setValue(el, fields[i][1]); });
+if (submitElement) { submitElement.click(); }
+return {missing: [], unmatched: []};
+"""
+
+
+def _as_target(target):
+    """Locators travel as [by, value] arrays, elements as references"""
+    return target if isinstance(target, WebElement) else list(target)
+
+
+def fill_form(driver, fields, submit=None, faithful=False, timeout=0):
+    """
+    Fill a form from {locator or WebElement: value} and optionally submit it.
+
+    Text inputs, textareas and contenteditables take strings, checkboxes and
+    radios take booleans, selects take an option value or visible text (no
+    match raises NoSuchElementException and leaves the form untouched).
+    submit is a locator or element to click afterwards.
+
+    The default mode needs a single execute_script call. faithful=True uses
+    clear()/send_keys()/click() so the page receives native key events.
+    """
+    if faithful:
+        return _fill_form_natively(driver, fields, submit, timeout)
+
+    targets = list(fields)
+    payload = [[_as_target(target), fields[target]] for target in targets]
+    submit_target = None if submit is None else _as_target(submit)
+    result = driver.execute_script(_FILL_JS, payload, submit_target)
+
+    if result["missing"]:
+        # Let the native lookup wait for (or report) the missing elements
+        elements = _resolve_targets(driver, targets + ([submit] if submit is not None else []), timeout)
+        payload = [[element, fields[target]] for element, target in zip(elements, targets)]
+        submit_target = elements[-1] if submit is not None else None
+        result = driver.execute_script(_FILL_JS, payload, submit_target)
+
+    if result["unmatched"]:
+        value = fields[targets[result["unmatched"][0]]]
+        raise NoSuchElementException(f"Could not locate option with value or visible text: {value}")
+
+
+def _resolve_targets(driver, targets, timeout):
+    """Turn a list of locators/elements into elements in one round trip"""
+    locators = {
+        index: tuple(target)
+        for index, target in enumerate(targets)
+        if not isinstance(target, WebElement)
+    }
+    found = resolve_locators(driver, locators, timeout) if locators else {}
+    return [found.get(index, target) for index, target in enumerate(targets)]
+
+
+def _fill_form_natively(driver, fields, submit, timeout):
+    targets = list(fields)
+    elements = _resolve_targets(driver, targets + ([submit] if submit is not None else []), timeout)
+
+    for element, target in zip(elements, targets):
+        value = fields[target]
+        if isinstance(value, bool):
+            if element.is_selected() != value:
+                element.click()
+        elif element.tag_name.lower() == "select":
+            select = Select(element)
+            try:
+                select.select_by_value(value)
+            except NoSuchElementException:
+                select.select_by_visible_text(value)
+        else:
+            element.clear()
+            element.send_keys(value)
+
+    if submit is not None:
+        elements[-1].click()
+
+
+def _find_single(driver, locator, timeout):
+    """Per-locator fallback using the native WebDriver lookup"""
+    if timeout:
+        return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+    return driver.find_element(*locator)
+
+
+class PageObject:
+    """
+    Base class for page objects.
+    Subclasses declare `path` and a `locators` dict of name -> (By, value).
+    """
+
+    path = "/"
+    locators = {}
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self, base_url):
+        """Navigate to this page"""
+        self.driver.get(base_url.rstrip("/") + self.path)
+        return self
+
+    def resolve(self, *names, timeout=0):
+        """
+        Resolve the named locators (all of them by default) in one round trip.
+        Returns a namespace with one WebElement attribute per locator.
+        """
+        names = names or tuple(self.locators)
+        try:
+            locators = {name: self.locators[name] for name in names}
+        except KeyError as e:
+            raise ValueError(f"{type(self).__name__} has no locator {e}") from None
+        return SimpleNamespace(**resolve_locators(self.driver, locators, timeout))
+
+    def fill_form(self, values, submit=None, faithful=False, timeout=0):
+        """Fill fields by locator name, optionally clicking the `submit` locator"""
+        fields = {self.locators[name]: value for name, value in values.items()}
+        submit = self.locators[submit] if submit else None
+        fill_form(self.driver, fields, submit, faithful, timeout)
+
+
+class LoginPage(PageObject):
+    """The /login page of the-internet"""
+
+    path = "/login"
+    locators = {
+        "username": (By.ID, "username"),
+        "password": (By.ID, "password"),
+        "login_button": (By.CSS_SELECTOR, "button.radius"),
+    }
+
+    def login(self, username, password, faithful=False, timeout=10):
+        """Enter credentials and submit the form"""
+        self.fill_form(
+            {"username": username, "password": password},
+            submit="login_button",
+            faithful=faithful,
+            timeout=timeout,
+        )
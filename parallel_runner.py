@@ -0,0 +1,182 @@
+"""
+Selenium Helpers: Parallel Test Runner
+Spreads pytest tests (including parametrized cases) across worker processes.
+
+Each worker is a separate pytest process with its own browser pool, so no
+browser is ever shared between processes. Worker results are merged into a
+single JUnit XML report and the speedup over a serial run is reported.
+
+Usage:
+    python parallel_runner.py                         # 12_pytest_example.py on all cores
+    python parallel_runner.py -n 4 12_pytest_example.py
+    python parallel_runner.py --compare-serial        # also time a real serial run
+    python parallel_runner.py -- --pool-size 1 -x     # extra arguments for each worker
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+DEFAULT_TARGETS = ["12_pytest_example.py"]
+
+
+def collect_tests(targets, pytest_args=()):
+    """Return the node ids pytest would run for the given targets"""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args, *targets],
+        capture_output=True,
+        text=True,
+    )
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    if result.returncode not in (0, 5) or not node_ids:
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+    return node_ids
+
+
+def partition(node_ids, workers):
+    """Deal tests round-robin so parametrized cases spread across workers"""
+    buckets = [[] for _ in range(workers)]
+    for i, node_id in enumerate(node_ids):
+        buckets[i % workers].append(node_id)
+    return [bucket for bucket in buckets if bucket]
+
+
+def start_worker(worker_id, node_ids, report_path, log, pytest_args):
+    """
+    Launch one pytest worker process for a slice of the tests.
+    Its output goes to the open file `log`, not a pipe: a pipe nobody reads
+    yet would stall a chatty worker until the workers before it finished.
+    """
+    env = dict(os.environ, SELENIUM_WORKER_ID=str(worker_id))
+    command = [
+        sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+        f"--junitxml={report_path}", *pytest_args, *node_ids,
+    ]
+    return subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+
+def merge_reports(report_paths, output_path):
+    """
+    Merge worker JUnit XML files into one report.
+    Returns the merged totals and the summed per-test time.
+    """
+    merged = ET.Element("testsuite", name="parallel")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    test_time = 0.0
+
+    for path in report_paths:
+        if not os.path.exists(path):
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            for case in suite.findall("testcase"):
+                test_time += float(case.get("time", 0))
+                merged.append(case)
+
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{test_time:.3f}")
+    ET.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return totals, test_time
+
+
+def run_serial(targets, pytest_args):
+    """Time a plain serial pytest run for comparison"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *pytest_args, *targets],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def run_parallel(targets=None, workers=None, pytest_args=(), report_path="parallel-report.xml",
+                 compare_serial=False):
+    """
+    Run the tests across worker processes and print a merged summary.
+    Returns the process exit code (0 when every test passed).
+    """
+    targets = list(targets or DEFAULT_TARGETS)
+    workers = workers or os.cpu_count() or 1
+
+    node_ids = collect_tests(targets, pytest_args)
+    if not node_ids:
+        print("No tests collected")
+        return 5
+
+    buckets = partition(node_ids, min(workers, len(node_ids)))
+    print(f"Running {len(node_ids)} tests on {len(buckets)} workers...")
+
+    report_dir = tempfile.mkdtemp(prefix="parallel-")
+    reports = [os.path.join(report_dir, f"worker-{i}.xml") for i in range(len(buckets))]
+    logs = [open(os.path.join(report_dir, f"worker-{i}.log"), "w+b") for i in range(len(buckets))]
+
+    start = time.perf_counter()
+    processes = [
+        start_worker(i, bucket, reports[i], logs[i], pytest_args) for i, bucket in enumerate(buckets)
+    ]
+    for process in processes:
+        process.wait()
+    wall_time = time.perf_counter() - start
+
+    outputs = []
+    for log in logs:
+        log.seek(0)
+        outputs.append(log.read().decode("utf-8", "replace"))
+        log.close()
+    totals, test_time = merge_reports(reports, report_path)
+    shutil.rmtree(report_dir, ignore_errors=True)
+
+    for i, (process, output) in enumerate(zip(processes, outputs)):
+        if process.returncode not in (0, 5):
+            print(f"\n--- worker {i} output ---")
+            print(output)
+
+    # Summary
+    print("\n" + "=" * 50)
+    print("PARALLEL TEST SUMMARY")
+    print("=" * 50)
+    failed = totals["failures"] + totals["errors"]
+    passed = totals["tests"] - failed - totals["skipped"]
+    print(f"Passed: {passed}/{totals['tests']}  Failed: {failed}  Skipped: {totals['skipped']}")
+    print(f"Workers: {len(buckets)}  Wall time: {wall_time:.2f}s")
+    print(f"Summed test time: {test_time:.2f}s  Speedup: {test_time / wall_time:.2f}x")
+    if compare_serial:
+        serial_time = run_serial(targets, pytest_args)
+        print(f"Serial wall time: {serial_time:.2f}s  Speedup: {serial_time / wall_time:.2f}x")
+    print(f"Merged report: {report_path}")
+
+    return 0 if all(p.returncode in (0, 5) for p in processes) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run pytest tests across worker processes")
+    parser.add_argument("targets", nargs="*", help="test files or node ids")
+    parser.add_argument("-n", "--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--report", default="parallel-report.xml", help="merged JUnit XML path")
+    parser.add_argument("--compare-serial", action="store_true",
+                        help="also run the suite serially and report the real speedup")
+    argv = sys.argv[1:]
+    pytest_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    sys.exit(run_parallel(args.targets, args.workers, pytest_args, args.report,
+                          args.compare_serial))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Selenium Helpers: Example Runner
+Runs the standalone example scripts as a parallel smoke suite.
+
+Every `*_example()` function in 01_basic_setup.py ... 10_screenshots_alerts.py
+is discovered without importing the scripts, then executed in a process pool.
+Each example opens its own browser, so the pool size bounds how many browsers
+run at once. Exit status, timing and captured output are collected into one
+summary.
+
+Usage:
+    python run_examples.py                      # all examples, one browser per core
+    python run_examples.py -n 3 --local         # 3 browsers, local fixture server
+    python run_examples.py 02 05 forms          # filter by file prefix or name
+    python run_examples.py --profile fast-headless --json examples.json
+"""
+
+import argparse
+import ast
+import contextlib
+import glob
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from driver_factory import PROFILES
+from fixture_server import FixtureServer
+
+EXAMPLE_GLOB = "[0-9][0-9]_*.py"
+LAST_EXAMPLE = "10"
+
+
+def discover_examples(directory=None, filters=()):
+    """
+    Return [(path, function_name)] for every top-level *_example() function
+    in scripts 01-10, in file order. Scripts are parsed, not imported.
+    """
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    examples = []
+    for path in sorted(glob.glob(os.path.join(directory, EXAMPLE_GLOB))):
+        filename = os.path.basename(path)
+        if filename[:2] > LAST_EXAMPLE:
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=filename)
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name.endswith("_example") and not node.args.args:
+                if not filters or any(filename.startswith(p) or p in node.name for p in filters):
+                    examples.append((path, node.name))
+    return examples
+
+
+def run_example(path, function_name):
+    """Worker: import one script and call its example function, capturing output"""
+    output = io.StringIO()
+    result = {"script": os.path.basename(path), "example": function_name, "status": "passed", "error": None}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            sys.path.insert(0, os.path.dirname(path))
+            spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            getattr(module, function_name)()
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        output.write(traceback.format_exc())
+    result["duration"] = time.perf_counter() - start
+    result["output"] = output.getvalue()
+    return result
+
+
+def run_examples(examples, browsers=None):
+    """Run examples in a process pool of at most `browsers` workers"""
+    browsers = max(1, min(browsers or os.cpu_count() or 1, len(examples) or 1))
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=browsers) as pool:
+        futures = {pool.submit(run_example, path, name): (path, name) for path, name in examples}
+        for future in as_completed(futures):
+            path, name = futures[future]
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                result = {"script": os.path.basename(path), "example": name, "status": "crashed",
+                          "error": str(e), "duration": 0.0, "output": ""}
+            mark = "✓" if result["status"] == "passed" else "✗"
+            print(f"{mark} {result['script']:<28}{result['duration']:>7.2f}s")
+            results[(path, name)] = result
+    return {
+        "browsers": browsers,
+        "wall_time": time.perf_counter() - start,
+        "results": [results[example] for example in examples],
+    }
+
+
+def print_summary(run, show_output=False):
+    results = run["results"]
+    for r in results:
+        if show_output or r["status"] != "passed":
+            print(f"\n--- {r['script']} :: {r['example']} ({r['status']}) ---")
+            print(r["output"].rstrip() or "(no output)")
+
+    passed = sum(r["status"] == "passed" for r in results)
+    summed = sum(r["duration"] for r in results)
+    print("\n" + "=" * 50)
+    print("EXAMPLE RUN SUMMARY")
+    print("=" * 50)
+    for r in results:
+        line = f"{r['script']:<28}{r['status']:<9}{r['duration']:>7.2f}s"
+        print(f"{line}  {r['error']}" if r["error"] else line)
+    print(f"Passed: {passed}/{len(results)}  Browsers: {run['browsers']}")
+    if run["wall_time"]:
+        print(f"Wall time: {run['wall_time']:.2f}s  Summed time: {summed:.2f}s  "
+              f"Speedup: {summed / run['wall_time']:.2f}x")
+    return passed == len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the example scripts in parallel")
+    parser.add_argument("filters", nargs="*", help="file prefixes (e.g. 02) or example names to run")
+    parser.add_argument("-n", "--browsers", type=int, default=None,
+                        help="maximum concurrent browsers (default: number of cores)")
+    parser.add_argument("--local", action="store_true", help="serve the pages from a local fixture server")
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="driver_factory browser profile")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the output of passing examples too")
+    args = parser.parse_args()
+
+    # Workers inherit the environment, so the scripts pick these up at import
+    if args.profile:
+        os.environ["SELENIUM_PROFILE"] = args.profile
+    examples = discover_examples(filters=args.filters)
+    if not examples:
+        print("No examples found")
+        sys.exit(1)
+
+    with contextlib.ExitStack() as stack:
+        if args.local:
+            server = stack.enter_context(FixtureServer())
+            os.environ["THE_INTERNET_URL"] = server.url
+            print(f"Serving fixture pages at {server.url}")
+        print(f"Running {len(examples)} examples...")
+        run = run_examples(examples, args.browsers)
+
+    ok = print_summary(run, args.verbose)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"Results written to {args.json}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
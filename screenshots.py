@@ -0,0 +1,213 @@
+"""
+Selenium Helpers: Screenshot Service
+Takes screenshots without making the test wait for decoding and disk writes.
+
+driver.save_screenshot() fetches a base64 payload, decodes it and writes the
+PNG, all on the test thread. The service only fetches the payload on the
+calling thread. Worker threads decode it, optionally recompress it, and
+write it to disk.
+
+- Bounded queue: when the workers fall behind, capture() blocks (backpressure)
+  instead of buffering an unbounded number of images in memory
+- PNG output is written as received, or re-deflated at another zlib level
+  (stdlib only)
+- WebP output is encoded with Pillow, if it is installed
+- flush() waits for every queued capture, so call it (or close()) at teardown
+- With an ArtifactStore, images go into the content-addressed store
+  (deduplicated across tests and runs) instead of a flat directory
+
+Usage:
+    with ScreenshotService("screenshots", png_level=9) as shots:
+        shots.capture(driver, "full_page.png")
+        shots.capture(element, "login_form.png")
+    # everything is on disk here
+
+    shots = ScreenshotService(store=ArtifactStore("artifacts"), test="test_login")
+"""
+
+import base64
+import io
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+
+try:
+    from PIL import Image
+except ImportError:  # WebP output needs Pillow; PNG works with the stdlib alone
+    Image = None
+
+FORMATS = ("png", "webp")
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def recompress_png(data, level=9):
+    """Re-deflate the image data (IDAT chunks) of a PNG at another zlib level"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("Not a PNG payload")
+    chunks = []
+    idat = []
+    pos = len(PNG_SIGNATURE)
+    while pos < len(data):
+        length, chunk_type = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if chunk_type == b"IDAT":
+            if not idat:
+                chunks.append((chunk_type, None))  # placeholder for the merged stream
+            idat.append(body)
+        else:
+            chunks.append((chunk_type, body))
+
+    pixels = zlib.compress(zlib.decompress(b"".join(idat)), level)
+    out = [PNG_SIGNATURE]
+    for chunk_type, body in chunks:
+        body = pixels if body is None else body
+        crc = zlib.crc32(chunk_type + body) & 0xFFFFFFFF
+        out.append(struct.pack(">I4s", len(body), chunk_type) + body + struct.pack(">I", crc))
+    return b"".join(out)
+
+
+def encode_webp(data, quality=80):
+    """Convert PNG bytes to WebP (requires Pillow)"""
+    if Image is None:
+        raise RuntimeError("WebP output needs Pillow: pip install Pillow")
+    with Image.open(io.BytesIO(data)) as image:
+        buffer = io.BytesIO()
+        image.save(buffer, "WEBP", quality=quality)
+    return buffer.getvalue()
+
+
+class ScreenshotService:
+    """Captures screenshots on the caller's thread, writes them on worker threads"""
+
+    def __init__(self, directory=".", workers=2, max_pending=8, format="png", png_level=None, webp_quality=80,
+                 store=None, test=None):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}; choose from {', '.join(FORMATS)}")
+        if format == "webp" and Image is None:
+            raise RuntimeError("WebP output needs Pillow: pip install Pillow")
+        self.directory = directory
+        self.format = format
+        self.png_level = png_level
+        self.webp_quality = webp_quality
+        self.store = store
+        self.test = test
+        self.errors = []  # (name, exception)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"captured": 0, "written": 0, "failed": 0, "bytes_decoded": 0, "bytes_written": 0,
+                       "capture_s": 0.0, "blocked_s": 0.0, "encode_s": 0.0}
+        self._threads = [
+            threading.Thread(target=self._work, name=f"screenshot-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _name(self, name):
+        root, _ = os.path.splitext(name)
+        return f"{root}.{self.format}"
+
+    def capture(self, source, name):
+        """
+        Screenshot a driver (viewport) or a WebElement. Returns a Future that
+        resolves to the written path (the blob path when using a store).
+        """
+        start = time.perf_counter()
+        if hasattr(source, "get_screenshot_as_base64"):
+            payload = source.get_screenshot_as_base64()
+        else:
+            payload = source.screenshot_as_base64
+        with self._lock:
+            self._stats["capture_s"] += time.perf_counter() - start
+        return self.submit(payload, name)
+
+    def submit(self, payload, name):
+        """Queue an already captured base64 PNG payload"""
+        if self._closed:
+            raise RuntimeError("ScreenshotService is closed")
+        future = Future()
+        start = time.perf_counter()
+        self._queue.put((payload, self._name(name), future))  # blocks while the queue is full
+        with self._lock:
+            self._stats["blocked_s"] += time.perf_counter() - start
+            self._stats["captured"] += 1
+        return future
+
+    def _encode(self, payload):
+        data = base64.b64decode(payload)
+        decoded = len(data)
+        if self.format == "webp":
+            data = encode_webp(data, self.webp_quality)
+        elif self.png_level is not None:
+            data = recompress_png(data, self.png_level)
+        return data, decoded
+
+    def _write(self, payload, name):
+        start = time.perf_counter()
+        data, decoded = self._encode(payload)
+        if self.store is not None:
+            path = self.store.put(data, step=name, test=self.test)
+        else:
+            path = os.path.join(self.directory, name)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        with self._lock:
+            self._stats["written"] += 1
+            self._stats["bytes_decoded"] += decoded
+            self._stats["bytes_written"] += len(data)
+            self._stats["encode_s"] += time.perf_counter() - start
+        return path
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                payload, name, future = item
+                try:
+                    future.set_result(self._write(payload, name))
+                except Exception as e:
+                    with self._lock:
+                        self._stats["failed"] += 1
+                        self.errors.append((name, e))
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until every queued screenshot is written; returns the failures"""
+        self._queue.join()
+        return list(self.errors)
+
+    def close(self):
+        """Flush and stop the workers"""
+        if self._closed:
+            return list(self.errors)
+        errors = self.flush()
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        return errors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self):
+        """Counters; capture_s is time on the caller's thread, encode_s on the workers"""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,131 @@
+"""
+Selenium Helpers: Script Registry
+Installs JavaScript helpers in the page once and calls them by name.
+
+execute_script() sends the full source of a snippet with every call, and
+the page parses it again each time. A ScriptRegistry installs its helper
+functions into every document once, with Chromium's
+Page.addScriptToEvaluateOnNewDocument, and each call then sends only a short
+stub with the helper's name and arguments:
+
+- register(name, source) adds a helper; source is a JavaScript function
+  expression, e.g. "function (el) { el.click(); }"
+- call(name, *args) runs it and returns its result (elements, lists and
+  dicts come back like from execute_script)
+- documents that missed the install (opened before it, other windows,
+  non-Chromium browsers) get the helpers on first use, then the call is retried
+- stats() reports calls and time per helper, reinstalls, and the script
+  characters sent (stubs and every install of the library) compared with
+  sending each helper's source inline
+
+HELPERS holds the everyday helpers (scrolling, highlighting, setting
+values, JS clicks, text and page info); they are registered by default.
+
+Usage:
+    scripts = ScriptRegistry(driver)
+    scripts.call("scrollIntoView", element)
+    info = scripts.call("pageInfo")
+    scripts.register("rowCount", "function (table) { return table.rows.length; }")
+    print(scripts.stats())
+"""
+
+import hashlib
+import json
+import time
+
+HELPERS = {
+    "scrollIntoView": "function (el) { el.scrollIntoView(true); }",
+    "scrollToBottom": "function () { window.scrollTo(0, document.body.scrollHeight); }",
+    "scrollToTop": "function () { window.scrollTo(0, 0); }",
+    "highlight": "function (el, color) { el.style.backgroundColor = color === undefined ? 'yellow' : color; }",
+    "setValue": "function (el, value) { el.value = value; }",
+    "click": "function (el) { el.click(); }",
+    "text": "function (el) { return el.textContent; }",
+    "pageInfo": """function () {
+  return {
+    title: document.title,
+    url: window.location.href,
+    width: window.innerWidth,
+    height: window.innerHeight
+  };
+}""",
+}
+
+# Installed with the helpers: __sh(arguments) checks the library version,
+# then runs the named helper. [0] means "not installed (or outdated) here".
+# arguments: library version, helper name, helper arguments...
+_LIBRARY_JS = """window.__sh = function (args) {
+  if (args[0] !== %(version)s || !(args[1] in __sh.fns)) { return [0]; }
+  return [1, __sh.fns[args[1]].apply(null, Array.prototype.slice.call(args, 2))];
+};
+__sh.fns = {
+%(fns)s
+};"""
+
+# Sent with every call: only this, the helper's name and its arguments
+_CALL_JS = "return window.__sh?__sh(arguments):[0]"
+
+
+class ScriptRegistry:
+    """Named JavaScript helpers, installed once per document"""
+
+    def __init__(self, driver, helpers=HELPERS):
+        self.driver = driver
+        self.helpers = dict(helpers)
+        self.version = None
+        self._bundle = None
+        self._script_id = None
+        self._timings = {}  # name -> [calls, total seconds, max seconds]
+        self._counts = {"installs": 0, "reinstalls": 0, "chars_sent": 0, "chars_inline": 0}
+        self.install()
+
+    def register(self, name, source):
+        """Add or replace a helper; the library is installed again with it"""
+        self.helpers[name] = source
+        self.install()
+
+    def _build(self):
+        fns = ",\n".join(f"{json.dumps(name)}: ({source})" for name, source in sorted(self.helpers.items()))
+        self.version = hashlib.sha1(fns.encode("utf-8")).hexdigest()[:12]
+        self._bundle = _LIBRARY_JS % {"version": json.dumps(self.version), "fns": fns}
+
+    def install(self):
+        """Install the helpers for every new document and into the current one"""
+        self._build()
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            if self._script_id is not None:
+                self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                            {"identifier": self._script_id})
+            result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self._bundle})
+            self._script_id = result["identifier"]
+            self._counts["chars_sent"] += len(self._bundle)
+        self.driver.execute_script(self._bundle)
+        self._counts["installs"] += 1
+        self._counts["chars_sent"] += len(self._bundle)
+
+    def call(self, name, *args):
+        """Run a helper by name and return its result"""
+        if name not in self.helpers:
+            raise KeyError(f"No script helper named {name!r}")
+        start = time.perf_counter()
+        result = self.driver.execute_script(_CALL_JS, self.version, name, *args)
+        if not result[0]:
+            # This document was created before the install (or in another window)
+            self.driver.execute_script(self._bundle)
+            self._counts["reinstalls"] += 1
+            self._counts["chars_sent"] += len(self._bundle) + len(_CALL_JS)
+            result = self.driver.execute_script(_CALL_JS, self.version, name, *args)
+        elapsed = time.perf_counter() - start
+        timing = self._timings.setdefault(name, [0, 0.0, 0.0])
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2] = max(timing[2], elapsed)
+        self._counts["chars_sent"] += len(_CALL_JS)
+        self._counts["chars_inline"] += len(self.helpers[name])
+        return result[1] if len(result) > 1 else None
+
+    def stats(self):
+        """Calls, total and slowest time per helper, plus install counts"""
+        helpers = {name: {"calls": calls, "total_ms": round(total * 1000, 2), "max_ms": round(slowest * 1000, 2)}
+                   for name, (calls, total, slowest) in sorted(self._timings.items())}
+        return dict(self._counts, helpers=helpers)
@@ -0,0 +1,154 @@
+"""
+Selenium Helpers: Table Extraction
+Reads whole HTML tables into column-oriented NumPy arrays.
+
+Reading a table with find_elements() and .text costs one WebDriver command
+per cell: 2,500 round trips for the 50x50 table on /large. The extractor
+serializes the table in the page instead, a chunk of rows per call, and
+returns the cells column by column:
+
+- extract_table() returns a Table of NumPy arrays, one per column
+- iter_table_chunks() streams the chunks, so very large tables can be
+  checked piece by piece without building the whole table at once
+- Cell text is textContent (trimmed), which needs no layout pass
+
+Usage:
+    table = extract_table(driver, (By.ID, "large-table"))
+    assert table["1"][0] == "1.1"
+    assert (table.column(0) == [f"{r}.1" for r in range(1, 51)]).all()
+
+    for chunk in iter_table_chunks(driver, (By.ID, "large-table"), chunk_rows=500):
+        check(chunk["start"], chunk["columns"])
+"""
+
+import numpy as np
+from waits import LOCATOR_JS
+
+# arguments: table element or [using, value] locator, first row, number of rows
+TABLE_CHUNK_JS = LOCATOR_JS + """
+var target = arguments[0], start = arguments[1], count = arguments[2];
+var table = Array.isArray(target) ? __findBy(target[0], target[1], document, false) : target;
+if (!table) { return null; }
+var headRow = null, skip = 0, total = 0;
+if (table.tHead && table.tHead.rows.length) {
+  headRow = table.tHead.rows[table.tHead.rows.length - 1];
+}
+// Rows are read in place, body by body: no copy of the whole row list per chunk
+var sections = table.tBodies.length ? table.tBodies : [table];
+for (var b = 0; b < sections.length; b++) { total += sections[b].rows.length; }
+var first = null;
+for (b = 0; b < sections.length && !first; b++) { first = sections[b].rows[0] || null; }
+if (!headRow && first && first.querySelector('th') && !first.querySelector('td')) {
+  headRow = first;
+  skip = 1;
+  total -= 1;
+}
+var headers = null;
+if (start === 0) {
+  headers = headRow ? Array.prototype.map.call(headRow.cells, function (c) { return c.textContent.trim(); }) : [];
+}
+var end = Math.min(total, start + count), columns = [];
+var i = start + skip;
+for (b = 0; b < sections.length && i >= sections[b].rows.length; b++) { i -= sections[b].rows.length; }
+for (var r = start; r < end; r++, i++) {
+  while (i >= sections[b].rows.length) { b++; i = 0; }
+  var cells = sections[b].rows[i].cells;
+  for (var c = 0; c < cells.length; c++) {
+    if (!columns[c]) { columns[c] = new Array(r - start).fill(''); }
+    columns[c].push(cells[c].textContent.trim());
+  }
+  for (c = cells.length; c < columns.length; c++) { columns[c].push(''); }
+}
+return {headers: headers, columns: columns, total: total, start: start, end: end};
+"""
+
+
+def _target(table):
+    """A WebElement passes through; a (By, value) locator is resolved in the page"""
+    if isinstance(table, (tuple, list)):
+        return list(table)
+    return table
+
+
+def iter_table_chunks(driver, table, chunk_rows=1000):
+    """
+    Yield {"start", "end", "total", "headers", "columns"} per chunk of rows;
+    columns is a list of lists of cell text. headers is set on the first chunk.
+    """
+    target = _target(table)
+    start = 0
+    while True:
+        chunk = driver.execute_script(TABLE_CHUNK_JS, target, start, chunk_rows)
+        if chunk is None:
+            raise ValueError(f"Table not found: {table}")
+        yield chunk
+        start = chunk["end"]
+        if start >= chunk["total"]:
+            return
+
+
+def _to_array(values, convert):
+    array = np.array(values, dtype=str)
+    if convert:
+        try:
+            return array.astype(float)
+        except ValueError:
+            pass
+    return array
+
+
+class Table:
+    """Column-oriented table: a NumPy array per column, addressed by header or index"""
+
+    def __init__(self, headers, columns):
+        self.headers = list(headers)
+        self.columns = list(columns)
+        self.round_trips = 0
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    @property
+    def shape(self):
+        return (len(self), len(self.columns))
+
+    def __getitem__(self, name):
+        return self.columns[self.headers.index(name)]
+
+    def column(self, index):
+        return self.columns[index]
+
+    def row(self, index):
+        return [column[index] for column in self.columns]
+
+    def to_dict(self):
+        return dict(zip(self.headers, self.columns))
+
+
+def extract_table(driver, table, chunk_rows=1000, convert=False):
+    """
+    Read a whole table into a Table. With convert=True, columns whose cells
+    all parse as numbers become float arrays; the rest stay string arrays.
+    """
+    headers = []
+    columns = []
+    rows = 0
+    round_trips = 0
+    for chunk in iter_table_chunks(driver, table, chunk_rows):
+        round_trips += 1
+        if chunk["headers"] is not None:
+            headers = chunk["headers"]
+        count = chunk["end"] - chunk["start"]
+        for index, values in enumerate(chunk["columns"]):
+            if index == len(columns):
+                columns.append([""] * rows)  # a column that only appears in later rows
+            columns[index].extend(values)
+        for column in columns[len(chunk["columns"]):]:
+            column.extend([""] * count)
+        rows += count
+    while len(columns) < len(headers):
+        columns.append([""] * rows)
+    headers = list(headers) + [f"column_{i + 1}" for i in range(len(headers), len(columns))]
+    result = Table(headers, [_to_array(column, convert) for column in columns])
+    result.round_trips = round_trips
+    return result
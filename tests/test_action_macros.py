@@ -0,0 +1,79 @@
+"""Macro payloads built against a fake driver: no browser needed"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from action_macros import ELEMENT_KEY, ActionMacros
+
+
+class FakeDriver:
+    def __init__(self):
+        self.commands = []
+        self.lookups = []
+
+    def find_element(self, by, value):
+        self.lookups.append((by, value))
+        return WebElement(self, f"found:{value}")
+
+    def execute(self, command, params=None):
+        self.commands.append((command, params))
+        return {"value": None}
+
+
+def device(payload, kind):
+    return next(d for d in payload["actions"] if d["type"] == kind)
+
+
+def origins(actions):
+    return [a["origin"][ELEMENT_KEY] for a in actions if isinstance(a.get("origin"), dict)]
+
+
+@pytest.fixture
+def macros():
+    macros = ActionMacros(FakeDriver())
+    macros.define("drag", lambda chain, p: chain.drag_and_drop(p.source, p.target))
+    macros.define("retype", lambda chain, p: chain.click(p.field).send_keys(p.text("text")))
+    return macros
+
+
+def test_element_parameters_fill_origins(macros):
+    driver = macros.driver
+    payload = macros.payload("drag", source=WebElement(driver, "a"), target=WebElement(driver, "b"))
+    assert origins(device(payload, "pointer")["actions"]) == ["a", "b"]
+
+
+def test_locators_are_looked_up(macros):
+    payload = macros.payload("drag", source=(By.ID, "column-a"), target=WebElement(macros.driver, "b"))
+    assert macros.driver.lookups == [(By.ID, "column-a")]
+    assert origins(device(payload, "pointer")["actions"]) == ["found:column-a", "b"]
+
+
+def test_text_expands_with_devices_kept_in_step(macros):
+    payload = macros.payload("retype", field=WebElement(macros.driver, "f"), text="abc")
+    keys = device(payload, "key")["actions"]
+    pointer = device(payload, "pointer")["actions"]
+    typed = [(a["type"], a["value"]) for a in keys if a["type"] != "pause"]
+    assert typed == [("keyDown", "a"), ("keyUp", "a"), ("keyDown", "b"), ("keyUp", "b"),
+                     ("keyDown", "c"), ("keyUp", "c")]
+    assert len(keys) == len(pointer)
+
+
+def test_payload_does_not_change_the_macro(macros):
+    field = WebElement(macros.driver, "f")
+    first = macros.payload("retype", field=field, text="abc")
+    second = macros.payload("retype", field=field, text="x")
+    assert len(device(first, "key")["actions"]) - len(device(second, "key")["actions"]) == 4
+
+
+def test_missing_parameters(macros):
+    with pytest.raises(ValueError, match="needs parameters: field"):
+        macros.payload("retype", text="abc")
+
+
+def test_play_sends_one_command(macros):
+    driver = macros.driver
+    macros.play("drag", source=WebElement(driver, "a"), target=WebElement(driver, "b"))
+    assert [command for command, _ in driver.commands] == [Command.W3C_ACTIONS]
+    assert macros.stats()["played"] == 1
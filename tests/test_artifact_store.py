@@ -0,0 +1,66 @@
+"""ArtifactStore put/find/export/gc on a temporary directory"""
+
+import os
+import stat
+import time
+
+import pytest
+
+from artifact_store import ArtifactStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ArtifactStore(str(tmp_path / "artifacts"), run_id="run-1") as store:
+        yield store
+
+
+def test_put_deduplicates_identical_content(store):
+    first = store.put(b"png-1", step="a.png", test="t")
+    second = store.put(b"png-1", step="b.png", test="t")
+    store.put(b"png-2", step="c.png", test="t")
+    assert first == second
+    assert (store.written, store.deduplicated) == (2, 1)
+    stats = store.stats()
+    assert (stats["artifacts"], stats["blobs"]) == (3, 2)
+    assert store.get(store.find(step="c.png")[0]["digest"]) == b"png-2"
+
+
+def test_blobs_are_read_only(store):
+    path = store.put(b"data", step="a.png")
+    assert not os.stat(path).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def test_find_filters_by_run_test_and_step(store):
+    store.put(b"1", step="a.png", test="t1")
+    store.put(b"2", step="b.png", test="t2")
+    store.put(b"3", step="a.png", test="t1", run_id="run-2")
+    assert [row["step"] for row in store.find(test="t1")] == ["a.png", "a.png"]
+    assert [row["run_id"] for row in store.find(step="a.png", run_id="run-2")] == ["run-2"]
+    assert [run_id for run_id, _, _ in store.runs()] == ["run-1", "run-2"]
+
+
+def test_export_writes_named_files(store, tmp_path):
+    store.put(b"one", step="a.png")
+    store.put(b"two", step="nested/b.png")
+    exported = store.export("run-1", str(tmp_path / "out"))
+    assert len(exported) == 2
+    with open(tmp_path / "out" / "nested" / "b.png", "rb") as f:
+        assert f.read() == b"two"
+    # Exporting again replaces the files instead of failing
+    assert len(store.export("run-1", str(tmp_path / "out"))) == 2
+
+
+def test_gc_keeps_newest_runs_and_shared_blobs(store):
+    store.put(b"shared", step="a.png", run_id="old")
+    store.put(b"only-old", step="b.png", run_id="old")
+    time.sleep(0.01)
+    store.put(b"shared", step="a.png", run_id="new")
+    only_old = store.find(run_id="old", step="b.png")[0]["path"]
+
+    result = store.gc(keep_runs=1)
+
+    assert result["runs"] == 1 and result["blobs"] == 1
+    assert [run_id for run_id, _, _ in store.runs()] == ["new"]
+    assert not os.path.exists(only_old)
+    assert store.get(store.find(run_id="new")[0]["digest"]) == b"shared"
@@ -0,0 +1,44 @@
+"""Scheduling and timeouts of the async runner, with fake browser sessions"""
+
+import time
+
+from async_runner import run_scenarios
+
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+
+def sleeper(seconds, result=None):
+    def scenario(driver):
+        time.sleep(seconds)
+        return result
+    return scenario
+
+
+def test_queued_scenarios_do_not_spend_their_timeout_waiting():
+    run = run_scenarios({"a": sleeper(0.3), "b": sleeper(0.3), "c": sleeper(0.3)},
+                        driver_factory=FakeDriver, max_sessions=1, timeout=0.5)
+    assert [r["status"] for r in run["results"]] == ["passed"] * 3
+    assert all(r["duration"] < 0.45 for r in run["results"])
+    assert run["wall_time"] >= 0.9
+
+
+def test_timeout_and_failure():
+    run = run_scenarios({"slow": sleeper(0.5), "false": sleeper(0, False)},
+                        driver_factory=FakeDriver, timeout=0.1)
+    slow, false = run["results"]
+    assert slow["status"] == "timeout" and slow["error"] == "exceeded 0.1s"
+    assert false["status"] == "failed"
+
+
+def test_fail_fast_cancels_running_and_queued_scenarios():
+    def broken(driver):
+        raise RuntimeError("boom")
+
+    run = run_scenarios({"broken": broken, "running": sleeper(0.3), "queued": sleeper(0.3)},
+                        driver_factory=FakeDriver, max_sessions=2, fail_fast=True)
+    statuses = {r["name"]: r["status"] for r in run["results"]}
+    assert statuses == {"broken": "failed", "running": "cancelled", "queued": "cancelled"}
+    assert run["results"][0]["error"] == "RuntimeError: boom"
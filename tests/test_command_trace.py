@@ -0,0 +1,57 @@
+"""CommandTracer aggregation, with a fake driver (no browser needed)"""
+
+from command_trace import ALL, CommandTracer
+
+
+class FakeDriver:
+    def execute(self, command, params=None):
+        if command == "fail":
+            raise RuntimeError("boom")
+        return {"value": "x" * 10}
+
+
+def traced_driver():
+    tracer = CommandTracer()
+    driver = tracer.attach(FakeDriver())
+    driver.execute("newSession")
+    with tracer.section("test_a"):
+        driver.execute("get", {"url": "/"})
+        driver.execute("findElement")
+    with tracer.section("test_b"):
+        driver.execute("findElement")
+        try:
+            driver.execute("fail")
+        except RuntimeError:
+            pass
+    with tracer.section("pool reset"):
+        driver.execute("deleteAllCookies")
+    return tracer
+
+
+def test_outside_section_only_has_unsectioned_commands():
+    tracer = traced_driver()
+    assert list(tracer.aggregate(None)) == ["newSession"]
+
+
+def test_all_counts_every_record():
+    tracer = traced_driver()
+    totals = tracer.aggregate(ALL)
+    assert sum(row["count"] for row in totals.values()) == 6
+    assert totals["findElement"]["count"] == 2
+    assert totals == tracer.aggregate()
+
+
+def test_named_section_and_errors():
+    tracer = traced_driver()
+    totals = tracer.aggregate("test_b")
+    assert set(totals) == {"findElement", "fail"}
+    assert totals["fail"]["errors"] == 1
+    assert totals["findElement"]["bytes"] == 10
+
+
+def test_profile_by_section_keys_match_their_records():
+    tracer = traced_driver()
+    profile = tracer.profile_by_section()
+    assert list(profile) == [None, "test_a", "test_b", "pool reset"]
+    assert list(profile[None]) == ["newSession"]
+    assert list(profile["pool reset"]) == ["deleteAllCookies"]
@@ -0,0 +1,140 @@
+"""Dialog matching and answers, fed with synthetic DevTools events"""
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from dialogs import DialogPolicy
+
+
+class FakeEvents:
+    """The parts of CdpEvents a DialogPolicy uses; commands are recorded"""
+
+    def __init__(self):
+        target = SimpleNamespace(set_discover_targets=lambda discover: ("discover",),
+                                 get_targets=lambda: ("get_targets",))
+        page = SimpleNamespace(enable=lambda: ("enable",),
+                               handle_java_script_dialog=lambda accept, text=None: ("answer", accept, text))
+        self.devtools = SimpleNamespace(target=target, page=page)
+        self.sent = []
+
+    def on(self, name, callback, target_id=None):
+        pass
+
+    def execute(self, command, target_id=None):
+        return [] if command == ("get_targets",) else None
+
+    async def send(self, command, target_id=None):
+        self.sent.append(command)
+
+
+def opening(policy, dialog_type, message):
+    event = SimpleNamespace(type_=SimpleNamespace(value=dialog_type), message=message, url="http://fixture/")
+    asyncio.run(policy._dialog_opening("page-1", event))
+    return policy.log[-1]
+
+
+@pytest.fixture
+def policy():
+    return DialogPolicy(driver=None, events=FakeEvents())
+
+
+def test_prompt_text_is_typed_and_accepted(policy):
+    policy.expect("JS prompt", text="Hello")
+    entry = opening(policy, "prompt", "I am a JS prompt")
+    assert (entry["action"], entry["text"], entry["expected"]) == ("accept", "Hello", True)
+    assert policy.events.sent[-1] == ("answer", True, "Hello")
+    assert policy.wait_handled(timeout=0) is entry
+    policy.verify()
+
+
+def test_type_filter(policy):
+    policy.expect("Are you sure", dialog_type="confirm")
+    alert = opening(policy, "alert", "Are you sure?")
+    assert (alert["action"], alert["expected"]) == ("dismiss", False)
+    confirm = opening(policy, "confirm", "Are you sure?")
+    assert (confirm["action"], confirm["expected"]) == ("accept", True)
+
+
+def test_regex_match_and_order(policy):
+    policy.expect(re.compile(r"^I am a JS (alert|confirm)$"), action="dismiss")
+    policy.expect(None, action="accept")
+    assert opening(policy, "confirm", "I am a JS confirm")["action"] == "dismiss"
+    assert opening(policy, "alert", "anything")["action"] == "accept"
+    assert policy.expected == []
+
+
+def test_unexpected_dialogs_get_the_default_and_fail_verify():
+    policy = DialogPolicy(driver=None, default="accept", events=FakeEvents())
+    entry = opening(policy, "alert", "Surprise")
+    assert (entry["action"], entry["expected"]) == ("accept", False)
+    assert policy.stats()["unexpected"] == 1
+    with pytest.raises(AssertionError, match="unexpected alert: 'Surprise' \\(accepted\\)"):
+        policy.verify()
+
+
+def test_wait_handled_timeout_names_what_is_missing(policy):
+    policy.expect("never shown")
+    with pytest.raises(TimeoutException, match=r"Dialogs still expected after 0.05s: \['never shown'\]"):
+        policy.wait_handled(timeout=0.05)
+    with pytest.raises(AssertionError, match="never opened"):
+        policy.verify()
+
+
+def test_failed_answers_are_logged(policy):
+    async def refuse(command, target_id=None):
+        raise RuntimeError("No dialog is showing")
+    policy.events.send = refuse
+    entry = opening(policy, "alert", "gone")
+    assert entry["error"] == "No dialog is showing"
+    assert policy.stats()["errors"] == 1
+
+
+def test_invalid_actions(policy):
+    with pytest.raises(ValueError):
+        policy.expect("x", action="ignore")
+    with pytest.raises(ValueError):
+        DialogPolicy(driver=None, default="ignore", events=FakeEvents())
+
+
+class FakeAlert:
+    def __init__(self, driver, text):
+        self.driver = driver
+        self.text = text
+
+    def send_keys(self, text):
+        self.driver.answers.append(("send_keys", text))
+
+    def accept(self):
+        self.driver.answers.append(("accept",))
+
+    def dismiss(self):
+        self.driver.answers.append(("dismiss",))
+
+
+class FakeDriverWithoutDevTools:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.answers = []
+        self.switch_to = self
+
+    def _get_cdp_details(self):
+        return None, None
+
+    @property
+    def alert(self):
+        return FakeAlert(self, self.messages.pop(0))
+
+
+def test_without_devtools_dialogs_are_answered_by_command():
+    driver = FakeDriverWithoutDevTools(["I am a JS prompt", "I am a JS alert"])
+    policy = DialogPolicy(driver)
+    assert policy.events is None
+    policy.expect("prompt", text="Hi").expect("alert")
+    entry = policy.wait_handled(timeout=1)
+    assert entry["message"] == "I am a JS alert"
+    assert driver.answers == [("send_keys", "Hi"), ("accept",), ("accept",)]
+    policy.verify()
@@ -0,0 +1,60 @@
+"""DomTree replay of snapshot operations (pure Python, no browser)"""
+
+import gzip
+import json
+
+from dom_snapshot import DomTree, replay
+
+# <html><body><section><p id=4></p><p id=5></p></section></body></html>
+TREE = [1, "html", {}, [[2, "body", {}, [[3, "section", {}, [[4, "p", {}, []], [5, "p", {}, []]]]]]]]
+
+
+def test_add_then_move_within_one_batch():
+    tree = DomTree(TREE)
+    for op in [["add", 4, None, [6, "span", {}, []]],
+               ["remove", 6],
+               ["add", 5, None, [6, "span", {}, []]]]:
+        tree.apply(op)
+    assert tree.html() == "<html><body><section><p></p><p><span></span></p></section></body></html>"
+
+
+def test_move_without_remove_record():
+    tree = DomTree(TREE)
+    tree.apply(["add", 4, None, [6, "span", {}, [[7, "#text", "hi"]]]])
+    tree.apply(["add", 5, None, [6, "span", {}, [[7, "#text", "hi"]]]])
+    assert tree.html() == "<html><body><section><p></p><p><span>hi</span></p></section></body></html>"
+
+
+def test_insert_before_sibling_attrs_and_text():
+    tree = DomTree(TREE)
+    tree.apply(["add", 3, 5, [6, "#text", "a < b"]])
+    tree.apply(["attr", 4, "class", "x"])
+    tree.apply(["text", 6, "a & b"])
+    tree.apply(["attr", 4, "class", None])
+    tree.apply(["attr", 5, "title", '"q"'])
+    assert tree.html() == ('<html><body><section><p></p>a &amp; b<p title="&quot;q&quot;"></p>'
+                           "</section></body></html>")
+
+
+def test_remove_forgets_the_subtree():
+    tree = DomTree(TREE)
+    tree.apply(["remove", 3])
+    assert tree.html() == "<html><body></body></html>"
+    assert 4 not in tree.nodes
+    tree.apply(["add", 4, None, [6, "span", {}, []]])  # parent gone: ignored
+    assert 6 not in tree.nodes
+
+
+def test_replay_follows_full_and_diff_records(tmp_path):
+    path = tmp_path / "steps.jsonl.gz"
+    records = [
+        {"seq": 0, "type": "full", "tree": TREE},
+        {"seq": 1, "type": "diff", "ops": [["add", 4, None, [6, "#text", "one"]]]},
+        {"seq": 2, "type": "full", "tree": [1, "html", {}, []]},
+    ]
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    pages = [tree.html() for _, tree in replay(str(path))]
+    assert pages[1] == "<html><body><section><p>one</p><p></p></section></body></html>"
+    assert pages[2] == "<html></html>"
@@ -0,0 +1,63 @@
+"""Batched reads and stale-element recovery, against a fake driver"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from element_collection import ElementCollection
+
+
+class FakeElement:
+    def __init__(self, name, stale=False):
+        self.name = name
+        self.stale = stale
+
+
+class FakeDriver:
+    """execute_script answers with "<kind>:<name>" per element; stale elements raise"""
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.scripts = 0
+
+    def find_elements(self, by, value):
+        return list(self.elements)
+
+    def execute_script(self, script, elements, kind, arg):
+        self.scripts += 1
+        if any(element.stale for element in elements):
+            raise StaleElementReferenceException("stale")
+        return [f"{kind}:{element.name}" for element in elements]
+
+
+def test_one_script_call_per_read():
+    driver = FakeDriver([FakeElement("a"), FakeElement("b")])
+    links = ElementCollection.find(driver, By.TAG_NAME, "a")
+    assert links.texts() == ["text:a", "text:b"]
+    assert links.props(["href"]) == ["props:a", "props:b"]
+    assert driver.scripts == 2 and links.round_trips == 2
+
+
+def test_empty_collection_sends_nothing():
+    driver = FakeDriver([])
+    assert ElementCollection.find(driver, By.TAG_NAME, "a").texts() == []
+    assert driver.scripts == 0
+
+
+def test_stale_elements_are_found_again_with_the_locator():
+    driver = FakeDriver([FakeElement("old", stale=True)])
+    links = ElementCollection.find(driver, By.TAG_NAME, "a")
+    driver.elements = [FakeElement("new")]
+    assert links.attrs("href") == ["attr:new"]
+    assert links.round_trips == 3  # failed read, find_elements, retry
+
+
+def test_without_a_locator_stale_elements_read_as_none():
+    driver = FakeDriver([])
+    links = ElementCollection(driver, [FakeElement("a"), FakeElement("b", stale=True), FakeElement("c")])
+    assert links.displayed() == ["displayed:a", None, "displayed:c"]
+
+
+def test_slices_drop_the_locator():
+    driver = FakeDriver([FakeElement("a"), FakeElement("b")])
+    first = ElementCollection.find(driver, By.TAG_NAME, "a")[:1]
+    assert len(first) == 1 and first.locator is None
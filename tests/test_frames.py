@@ -0,0 +1,116 @@
+"""Frame path tracking and switch counting, against a fake driver"""
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from frames import FrameNavigator
+
+
+class FakeSwitchTo:
+    def __init__(self, log):
+        self.log = log
+
+    def frame(self, frame_reference):
+        if getattr(frame_reference, "stale", False):
+            frame_reference.stale = False
+            raise StaleElementReferenceException("stale")
+        self.log.append(("frame", frame_reference))
+
+    def parent_frame(self):
+        self.log.append(("parent_frame",))
+
+    def default_content(self):
+        self.log.append(("default_content",))
+
+    def window(self, window_name):
+        self.log.append(("window", window_name))
+
+    def new_window(self, type_hint=None):
+        self.log.append(("new_window",))
+
+
+class FakeElement:
+    def __init__(self, value):
+        self.value = value
+        self.stale = False
+
+    def __repr__(self):
+        return f"<{self.value}>"
+
+
+class FakeDriver:
+    def __init__(self):
+        self.log = []
+        self.switch_to = FakeSwitchTo(self.log)
+        self.found = {}
+
+    def find_element(self, by, value):
+        self.log.append(("find", by, value))
+        return self.found.setdefault((by, value), FakeElement(value))
+
+    def get(self, url):
+        self.log.append(("get", url))
+
+    back = forward = refresh = lambda self: None
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+
+def test_nested_frames_are_entered_once_and_restored(driver):
+    frames = FrameNavigator(driver)
+    with frames.frame("outer"):
+        with frames.frame(1):
+            assert frames.path == ("outer", 1)
+        with frames.frame(1):
+            pass
+    assert frames.path == ()
+    switches = [entry[0] for entry in driver.log if entry[0] != "find"]
+    assert switches == ["frame", "frame", "parent_frame", "frame", "parent_frame", "parent_frame"]
+    assert frames.stats()["cache_hits"] == 0 and frames.stats()["lookups"] == 1
+
+
+def test_at_moves_through_the_common_ancestor(driver):
+    frames = FrameNavigator(driver)
+    frames.switch("a", "b", "c")
+    driver.log.clear()
+    with frames.at("a", "x"):
+        assert frames.path == ("a", "x")
+    assert frames.path == ("a", "b", "c")
+    kinds = [entry[0] for entry in driver.log if entry[0] != "find"]
+    # a/b/c -> a/x: two levels up by parent_frame; back: up one, then down b and c again
+    assert kinds == ["parent_frame", "parent_frame", "frame", "parent_frame", "frame", "frame"]
+    assert frames.stats()["cache_hits"] == 2
+
+
+def test_same_path_is_skipped(driver):
+    frames = FrameNavigator(driver)
+    frames.switch("a")
+    frames.switch("a")
+    assert frames.stats()["skipped"] == 1 and frames.stats()["frame"] == 1
+
+
+def test_stale_frames_are_looked_up_again(driver):
+    frames = FrameNavigator(driver)
+    frames.switch("a")
+    frames.switch()
+    driver.found[(By.ID, "a")].stale = True
+    frames.switch("a")
+    assert frames.stats()["lookups"] == 2
+
+
+def test_switches_made_by_hand_are_tracked(driver):
+    frames = FrameNavigator(driver)
+    driver.switch_to.frame("a")
+    driver.switch_to.frame(frame_reference="b")
+    assert frames.path == ("a", "b")
+    driver.switch_to.parent_frame()
+    assert frames.path == ("a",)
+    driver.get("http://example.com")
+    assert frames.path == ()
+    driver.switch_to.frame(0)
+    driver.switch_to.window("main")
+    assert frames.path == ()
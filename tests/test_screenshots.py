@@ -0,0 +1,51 @@
+"""PNG recompression keeps the pixels and produces a valid file"""
+
+import io
+import struct
+import zlib
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from screenshots import PNG_SIGNATURE, recompress_png
+
+
+def png_bytes(compress_level=0):
+    pixels = np.random.default_rng(1).integers(0, 256, (60, 80, 3), dtype=np.uint8)
+    pixels[:30] = 255  # something to compress
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG", compress_level=compress_level)
+    return buffer.getvalue()
+
+
+def chunks(data):
+    pos = len(PNG_SIGNATURE)
+    while pos < len(data):
+        length, chunk_type = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length:pos + 12 + length])
+        yield chunk_type, body, crc
+        pos += 12 + length
+
+
+def test_pixels_survive_and_file_shrinks():
+    original = png_bytes()
+    smaller = recompress_png(original, level=9)
+    assert len(smaller) < len(original)
+    with Image.open(io.BytesIO(original)) as before, Image.open(io.BytesIO(smaller)) as after:
+        assert np.array_equal(np.asarray(before), np.asarray(after))
+
+
+def test_chunks_are_valid_with_one_idat():
+    data = recompress_png(png_bytes())
+    found = list(chunks(data))
+    assert [t for t, _, _ in found][0] == b"IHDR" and found[-1][0] == b"IEND"
+    assert sum(1 for t, _, _ in found if t == b"IDAT") == 1
+    for chunk_type, body, crc in found:
+        assert crc == zlib.crc32(chunk_type + body) & 0xFFFFFFFF
+
+
+def test_rejects_other_formats():
+    with pytest.raises(ValueError):
+        recompress_png(b"\xff\xd8\xff\xe0 not a png")
@@ -0,0 +1,81 @@
+"""Install, call and reinstall of script helpers, against a fake driver"""
+
+import pytest
+
+from scripts import _CALL_JS, ScriptRegistry
+
+
+class FakeDriver:
+    """Keeps the installed library version per document, like window.__sh"""
+
+    def __init__(self):
+        self.installed = None
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if script != _CALL_JS:
+            self.installed = script
+            return None
+        version, name = args[0], args[1]
+        if self.installed is None or f'"{version}"' not in self.installed:
+            return [0]
+        return [1, f"{name}{list(args[2:])}"]
+
+
+class FakeChromeDriver(FakeDriver):
+    """Also runs the DevTools preload in every new document"""
+
+    preload = None
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Page.addScriptToEvaluateOnNewDocument":
+            self.preload = params["source"]
+            return {"identifier": "1"}
+        return {}
+
+    def navigate(self):
+        self.installed = self.preload
+
+
+def test_calls_send_only_the_stub():
+    driver = FakeChromeDriver()
+    scripts = ScriptRegistry(driver)
+    assert scripts.call("text", "el") == "text['el']"
+    assert driver.scripts[-1] == _CALL_JS
+    assert scripts.stats()["helpers"]["text"]["calls"] == 1
+
+
+def test_missed_documents_get_the_library_and_the_call_is_retried():
+    driver = FakeDriver()
+    scripts = ScriptRegistry(driver)
+    installed = scripts.stats()["chars_sent"]
+    driver.installed = None  # a new document, no preload without DevTools
+    assert scripts.call("pageInfo") == "pageInfo[]"
+    stats = scripts.stats()
+    assert stats["reinstalls"] == 1
+    assert driver.scripts[-3:] == [_CALL_JS, scripts._bundle, _CALL_JS]
+    assert stats["chars_sent"] - installed == len(scripts._bundle) + 2 * len(_CALL_JS)
+
+
+def test_register_changes_the_version_and_reinstalls():
+    driver = FakeChromeDriver()
+    scripts = ScriptRegistry(driver)
+    old = scripts.version
+    scripts.register("rowCount", "function (t) { return t.rows.length; }")
+    assert scripts.version != old
+    driver.navigate()  # the preload is the new library too
+    assert scripts.call("rowCount", "table") == "rowCount['table']"
+    assert scripts.stats()["reinstalls"] == 0
+
+
+def test_chars_sent_counts_every_install():
+    driver = FakeChromeDriver()
+    scripts = ScriptRegistry(driver)
+    # DevTools preload and the install into the current document
+    assert scripts.stats()["chars_sent"] == 2 * len(scripts._bundle)
+
+
+def test_unknown_helper():
+    with pytest.raises(KeyError):
+        ScriptRegistry(FakeDriver()).call("nope")
@@ -0,0 +1,85 @@
+"""Tile diff, masks and directory comparison on synthetic images"""
+
+import numpy as np
+from PIL import Image
+
+from visual_diff import build_mask, compare, compare_directories, first_differing_tile
+
+
+def image(height=100, width=150, value=200):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_identical_images_match():
+    result = compare(image(), image())
+    assert result["match"] and result["first_tile"] is None
+
+
+def test_size_mismatch():
+    result = compare(image(100, 150), image(100, 140))
+    assert not result["match"]
+    assert result["reason"] == "size 150x100 != 140x100"
+
+
+def test_first_differing_tile_is_row_major_and_clipped():
+    actual = image(100, 150)
+    actual[30, 140] = 0     # tile (128, 0), clipped to 22 wide at the edge
+    actual[70, 10] = 0      # next row of tiles
+    assert first_differing_tile(actual, image(100, 150), tile=64) == (128, 0, 22, 64)
+
+
+def test_tolerance_ignores_small_changes():
+    actual = image()
+    actual[5, 5] = 205
+    assert compare(actual, image(), tolerance=5)["match"]
+    assert not compare(actual, image(), tolerance=4)["match"]
+
+
+def test_masks_hide_regions():
+    actual = image()
+    actual[10:20, 10:20] = 0
+    assert compare(actual, image(), masks=[(5, 5, 20, 20)])["match"]
+    assert not compare(actual, image(), masks=[(0, 0, 15, 15)])["match"]
+
+
+def test_build_mask_clips_negative_origins():
+    mask = build_mask((10, 10, 3), [(-5, -5, 8, 8)])
+    assert mask.sum() == 9 and mask[2, 2] and not mask[3, 3]
+
+
+def test_full_scan_counts_pixels_and_bbox():
+    actual = image()
+    actual[10:12, 20:25] = 0
+    result = compare(actual, image(), early_exit=False)
+    assert result["diff_pixels"] == 10
+    assert result["bbox"] == (20, 10, 5, 2)
+
+
+def test_early_exit_skips_the_full_count():
+    actual = image()
+    actual[0, 0] = 0
+    result = compare(actual, image())
+    assert not result["match"] and result["diff_pixels"] == 0
+
+
+def test_diff_image_is_written(tmp_path):
+    actual = image()
+    actual[0, 0] = 0
+    path = tmp_path / "diff" / "a.png"
+    result = compare(actual, image(), diff_path=str(path))
+    with Image.open(result["diff_path"]) as diff:
+        assert diff.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_compare_directories_adopts_missing_baselines(tmp_path):
+    actual_dir, baseline_dir = tmp_path / "actual", tmp_path / "baselines"
+    actual_dir.mkdir()
+    Image.fromarray(image()).save(actual_dir / "same.png")
+    Image.fromarray(image(value=0)).save(actual_dir / "changed.png")
+    first = dict(compare_directories(str(actual_dir), str(baseline_dir), update_missing=True))
+    assert first["same.png"]["reason"] == "new baseline"
+
+    Image.fromarray(image(value=10)).save(actual_dir / "changed.png")
+    second = dict(compare_directories(str(actual_dir), str(baseline_dir)))
+    assert second["same.png"]["match"]
+    assert not second["changed.png"]["match"]
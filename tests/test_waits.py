@@ -0,0 +1,28 @@
+"""The sleep audit counts fixed sleeps on the audited thread only"""
+
+import threading
+import time
+
+from driver_cache import _FileLock
+from waits import SleepAudit
+
+
+def test_counts_sleeps_on_its_own_thread():
+    with SleepAudit(skip_sleeps=True) as audit:
+        time.sleep(5)
+    assert [seconds for _, _, seconds in audit.calls] == [5]
+    assert audit.per_script() == {"test_waits.py": (1, 5.0)}
+
+
+def test_ignores_other_threads_and_lock_retries(tmp_path):
+    lock_path = tmp_path / "lock"
+    lock_path.touch()  # held by someone else until the timer releases it
+    release = threading.Timer(0.1, lock_path.unlink)
+    with SleepAudit(skip_sleeps=True) as audit:
+        worker = threading.Thread(target=time.sleep, args=(0.01,))
+        worker.start()
+        worker.join()
+        release.start()
+        with _FileLock(str(lock_path), timeout=5):
+            pass
+    assert audit.calls == []
@@ -0,0 +1,185 @@
+"""
+Selenium Helpers: Visual Diff
+Compares screenshots against baseline images with NumPy.
+
+- Identical images are confirmed with a single vectorized equality check
+- Otherwise the image is scanned tile by tile; with early_exit the scan stops
+  at the first tile that differs
+- Masks (x, y, width, height) hide regions that change between runs, such as
+  clocks, ads or the flash message
+- A diff image shows the differing pixels in red over a dimmed copy of the
+  screenshot, with the masked regions tinted blue
+- Directories are compared one pair of images at a time, so a run over
+  thousands of screenshots never holds more than two images in memory
+
+Usage:
+    result = compare_files("screenshots/login_form.png", "baselines/login_form.png",
+                           masks=[(0, 0, 300, 40)], diff_path="diffs/login_form.png")
+    for name, result in compare_directories("screenshots", "baselines", diff_dir="diffs"):
+        print(name, result["match"])
+
+Command line:
+    python visual_diff.py screenshots baselines --diff-dir diffs --tolerance 8
+    python visual_diff.py screenshots baselines --masks masks.json --update-missing
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+from PIL import Image
+
+IMAGE_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg")
+
+
+def load_image(path):
+    """RGB pixels as an (height, width, 3) uint8 array"""
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def build_mask(shape, masks):
+    """Boolean (height, width) array, True where pixels are ignored"""
+    ignored = np.zeros(shape[:2], dtype=bool)
+    for x, y, width, height in masks or ():
+        ignored[max(y, 0):y + height, max(x, 0):x + width] = True
+    return ignored
+
+
+def diff_pixels(actual, baseline, tolerance=0, ignored=None):
+    """Boolean (height, width) array of pixels whose channels differ by more than `tolerance`"""
+    delta = np.abs(actual.astype(np.int16) - baseline.astype(np.int16)).max(axis=2) > tolerance
+    if ignored is not None:
+        delta &= ~ignored
+    return delta
+
+
+def first_differing_tile(actual, baseline, tolerance=0, ignored=None, tile=64):
+    """(x, y, width, height) of the first tile (row-major) that differs, or None"""
+    height, width = actual.shape[:2]
+    for y in range(0, height, tile):
+        for x in range(0, width, tile):
+            block = np.s_[y:y + tile, x:x + tile]
+            block_ignored = None if ignored is None else ignored[block]
+            if diff_pixels(actual[block], baseline[block], tolerance, block_ignored).any():
+                return (x, y, min(tile, width - x), min(tile, height - y))
+    return None
+
+
+def write_diff_image(actual, differing, path, ignored=None):
+    """Dimmed screenshot with differing pixels in red and masked regions tinted blue"""
+    image = (actual.astype(np.float32) * 0.3).astype(np.uint8)
+    if ignored is not None:
+        image[ignored] = (image[ignored] * 0.5 + np.array([0, 0, 128])).astype(np.uint8)
+    image[differing] = (255, 0, 0)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    Image.fromarray(image).save(path)
+    return path
+
+
+def compare(actual, baseline, tolerance=0, masks=None, tile=64, early_exit=True, diff_path=None):
+    """
+    Compare two pixel arrays. Returns a dict with match, reason, first_tile,
+    diff_pixels, diff_ratio, bbox and diff_path. diff_pixels and bbox are only
+    counted when the whole image is scanned (early_exit=False or diff_path set).
+    """
+    result = {"match": True, "reason": None, "first_tile": None, "diff_pixels": 0,
+              "diff_ratio": 0.0, "bbox": None, "diff_path": None}
+    if actual.shape != baseline.shape:
+        result.update(match=False, reason=f"size {actual.shape[1]}x{actual.shape[0]} != "
+                                          f"{baseline.shape[1]}x{baseline.shape[0]}")
+        return result
+    if not masks and tolerance == 0 and np.array_equal(actual, baseline):
+        return result
+
+    ignored = build_mask(actual.shape, masks) if masks else None
+    result["first_tile"] = first_differing_tile(actual, baseline, tolerance, ignored, tile)
+    if result["first_tile"] is None:
+        return result
+    result.update(match=False, reason="pixels differ")
+    if early_exit and not diff_path:
+        return result
+
+    differing = diff_pixels(actual, baseline, tolerance, ignored)
+    rows, cols = np.nonzero(differing)
+    result["diff_pixels"] = int(rows.size)
+    result["diff_ratio"] = rows.size / differing.size
+    result["bbox"] = (int(cols.min()), int(rows.min()),
+                      int(cols.max() - cols.min() + 1), int(rows.max() - rows.min() + 1))
+    if diff_path:
+        result["diff_path"] = write_diff_image(actual, differing, diff_path, ignored)
+    return result
+
+
+def compare_files(actual_path, baseline_path, **kwargs):
+    """compare() for two image files"""
+    return compare(load_image(actual_path), load_image(baseline_path), **kwargs)
+
+
+def compare_directories(actual_dir, baseline_dir, diff_dir=None, masks=None, update_missing=False, **kwargs):
+    """
+    Yield (name, result) for every screenshot in actual_dir, streaming one
+    pair at a time. `masks` maps a file name (or "*" for all files) to a list
+    of (x, y, width, height) regions.
+    """
+    masks = masks or {}
+    for root, _, files in os.walk(actual_dir):
+        for filename in sorted(files):
+            if not filename.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            actual_path = os.path.join(root, filename)
+            name = os.path.relpath(actual_path, actual_dir)
+            baseline_path = os.path.join(baseline_dir, name)
+            if not os.path.exists(baseline_path):
+                if update_missing:
+                    os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+                    shutil.copyfile(actual_path, baseline_path)
+                yield name, {"match": update_missing, "reason": "new baseline" if update_missing else "no baseline"}
+                continue
+            file_masks = list(masks.get("*", ())) + list(masks.get(name, ()))
+            diff_path = os.path.join(diff_dir, os.path.splitext(name)[0] + ".png") if diff_dir else None
+            yield name, compare_files(actual_path, baseline_path, masks=file_masks, diff_path=diff_path, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare screenshots against baselines")
+    parser.add_argument("actual_dir")
+    parser.add_argument("baseline_dir")
+    parser.add_argument("--diff-dir", help="write diff images for mismatches here")
+    parser.add_argument("--tolerance", type=int, default=0, help="allowed per-channel difference (0-255)")
+    parser.add_argument("--tile", type=int, default=64, help="tile size in pixels")
+    parser.add_argument("--masks", help='JSON file: {"login_form.png": [[x, y, w, h]], "*": [...]}')
+    parser.add_argument("--update-missing", action="store_true", help="adopt screenshots without a baseline")
+    args = parser.parse_args()
+
+    masks = {}
+    if args.masks:
+        with open(args.masks, "r", encoding="utf-8") as f:
+            masks = json.load(f)
+
+    counts = {"match": 0, "mismatch": 0}
+    for name, result in compare_directories(args.actual_dir, args.baseline_dir, diff_dir=args.diff_dir,
+                                            masks=masks, update_missing=args.update_missing,
+                                            tolerance=args.tolerance, tile=args.tile):
+        if result["match"]:
+            counts["match"] += 1
+            if result["reason"]:
+                print(f"+ {name}: {result['reason']}")
+            continue
+        counts["mismatch"] += 1
+        detail = result["reason"]
+        if result.get("diff_pixels"):
+            detail += f", {result['diff_pixels']} pixels ({result['diff_ratio']:.2%}) in {result['bbox']}"
+        if result.get("diff_path"):
+            detail += f" -> {result['diff_path']}"
+        print(f"✗ {name}: {detail}")
+
+    print(f"\nMatched: {counts['match']}  Mismatched: {counts['mismatch']}")
+    sys.exit(1 if counts["mismatch"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Selenium Helpers: Event-Driven Waits
+Waits that resolve the moment a condition becomes true.
+
+WebDriverWait polls the browser every 0.5 seconds, and a fixed time.sleep()
+always pays its full duration. The waits in this module run a single
+asynchronous script instead: the condition is re-checked inside the page on
+every DOM mutation (MutationObserver), load event, transition/animation end
+and animation frame, and the script returns as soon as it holds. One
+WebDriver round trip per wait, no polling over the wire.
+
+Usage:
+    from waits import wait_for_element, wait_for_page_load
+    flash = wait_for_element(driver, (By.ID, "flash"), visible=True)
+
+Sleep audit (how much wall time fixed sleeps cost per script):
+    python waits.py audit 03_interactions.py 06_navigation.py
+    pytest 12_pytest_example.py --sleep-audit
+"""
+
+import argparse
+import os
+import runpy
+import threading
+import time
+import traceback
+import weakref
+from collections import defaultdict
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+# Shared in-page element lookup for (By, value) locators.
+# Defines __findBy(using, value, root, all) in the calling script.
+LOCATOR_JS = """
+function __findBy(using, value, root, all) {
+  root = root || document;
+  var doc = root.ownerDocument || root;
+  var found = [];
+  switch (using) {
+    case 'id':
+      found = root.querySelectorAll('[id="' + CSS.escape(value) + '"]');
+      break;
+    case 'name':
+      found = root.querySelectorAll('[name="' + CSS.escape(value) + '"]');
+      break;
+    case 'css selector':
+      found = root.querySelectorAll(value);
+      break;
+    case 'class name':
+      found = root.getElementsByClassName(value);
+      break;
+    case 'tag name':
+      found = root.getElementsByTagName(value);
+      break;
+    case 'link text':
+    case 'partial link text':
+      found = Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+        var text = (a.innerText || a.textContent || '').trim();
+        return using === 'link text' ? text === value : text.indexOf(value) !== -1;
+      });
+      break;
+    case 'xpath':
+      var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (var i = 0; i < snapshot.snapshotLength; i++) { found.push(snapshot.snapshotItem(i)); }
+      break;
+    default:
+      throw new Error('Unsupported locator strategy: ' + using);
+  }
+  found = Array.prototype.slice.call(found);
+  return all ? found : (found[0] || null);
+}
+function __isVisible(el) {
+  if (!el) { return false; }
+  var style = window.getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none' &&
+    !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+"""
+
+# Re-checks the condition on every page signal until it holds or times out
+_WAIT_JS = LOCATOR_JS + """
+var args = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var check = function () { %s };
+var finished = false, observer = null, timer = null, frame = null;
+var events = ['load', 'transitionend', 'animationend'];
+
+function finish(value, timedOut) {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  clearTimeout(timer);
+  cancelAnimationFrame(frame);
+  events.forEach(function (name) { window.removeEventListener(name, evaluate, true); });
+  done({value: value, timedOut: timedOut});
+}
+function evaluate() {
+  if (finished) { return; }
+  var value = null;
+  try { value = check.apply(null, args); } catch (e) { value = null; }
+  if (value) { finish(value, false); }
+}
+function onFrame() {
+  evaluate();
+  if (!finished) { frame = requestAnimationFrame(onFrame); }
+}
+
+evaluate();
+if (!finished) {
+  observer = new MutationObserver(evaluate);
+  observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  events.forEach(function (name) { window.addEventListener(name, evaluate, true); });
+  frame = requestAnimationFrame(onFrame);
+  timer = setTimeout(function () { finish(null, true); }, timeoutMs);
+}
+"""
+
+# Script timeout already configured per driver, so it is only set once
+_script_timeouts = weakref.WeakKeyDictionary()
+
+
+def _ensure_script_timeout(driver, timeout):
+    if _script_timeouts.get(driver, 0) < timeout + 5:
+        driver.set_script_timeout(timeout + 5)
+        _script_timeouts[driver] = timeout + 5
+
+
+def wait_until(driver, condition_js, *args, timeout=10, message=""):
+    """
+    Wait until a JavaScript condition returns a truthy value.
+
+    condition_js is a function body; its arguments are *args, and __findBy /
+    __isVisible are available to it. Returns the condition's value (DOM
+    elements come back as WebElements). Raises TimeoutException.
+    """
+    _ensure_script_timeout(driver, timeout)
+    script = _WAIT_JS % condition_js
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining = max(deadline - time.monotonic(), 0)
+        try:
+            result = driver.execute_async_script(script, list(args), int(remaining * 1000))
+        except JavascriptException as e:
+            # The page navigated away mid-wait; check again on the new document
+            if "unload" in str(e) and time.monotonic() < deadline:
+                continue
+            raise
+        if result and not result.get("timedOut"):
+            return result["value"]
+        raise TimeoutException(message or f"Condition not met within {timeout}s: {condition_js}")
+
+
+def wait_for_element(driver, locator, visible=False, timeout=10):
+    """Wait for an element located by a (By, value) tuple; optionally visible"""
+    by, value = locator
+    return wait_until(
+        driver,
+        "var el = __findBy(arguments[0], arguments[1]);"
+        "return arguments[2] ? (__isVisible(el) ? el : null) : el;",
+        by, value, visible,
+        timeout=timeout,
+        message=f"Element {locator} not {'visible' if visible else 'present'} after {timeout}s",
+    )
+
+
+def wait_for_text(driver, locator, text, timeout=10):
+    """Wait until an element's text contains the given text; returns the element"""
+    by, value = locator
+    return wait_until(
+        driver,
+        "var el = __findBy(arguments[0], arguments[1]);"
+        "return el && (el.innerText || el.textContent).indexOf(arguments[2]) !== -1 ? el : null;",
+        by, value, text,
+        timeout=timeout,
+        message=f"Text {text!r} not found in {locator} after {timeout}s",
+    )
+
+
+def wait_for_page_load(driver, timeout=30):
+    """Wait until the current document has finished loading"""
+    return wait_until(
+        driver,
+        "return document.readyState === 'complete';",
+        timeout=timeout,
+        message=f"Page did not finish loading within {timeout}s",
+    )
+
+
+def wait_for_url_contains(driver, fragment, timeout=10):
+    """Wait until the URL contains a fragment and that page has loaded"""
+    return wait_until(
+        driver,
+        "return window.location.href.indexOf(arguments[0]) !== -1 &&"
+        " document.readyState === 'complete' ? window.location.href : null;",
+        fragment,
+        timeout=timeout,
+        message=f"URL did not contain {fragment!r} within {timeout}s",
+    )
+
+
+def wait_for_animations(driver, timeout=10):
+    """Wait until no CSS animations or transitions are running"""
+    return wait_until(
+        driver,
+        "return !document.getAnimations || document.getAnimations().length === 0;",
+        timeout=timeout,
+        message=f"Animations still running after {timeout}s",
+    )
+
+
+# Helpers whose sleeps are retry loops, not fixed waits
+POLLING_FILES = ("driver_cache.py",)
+
+
+class SleepAudit:
+    """
+    Records every time.sleep() call made on the thread that started it:
+    which file and line called it, and how long it slept. Sleeps on other
+    threads (e.g. the fixture server's) and in POLLING_FILES are not counted.
+    """
+
+    def __init__(self, skip_sleeps=False):
+        self.skip_sleeps = skip_sleeps
+        self.calls = []  # (filename, lineno, seconds)
+        self._original_sleep = None
+        self._thread = None
+
+    def _sleep(self, seconds):
+        if threading.current_thread() is not self._thread:
+            return self._original_sleep(seconds)
+        frame = traceback.extract_stack(limit=2)[0]
+        if os.path.basename(frame.filename) in POLLING_FILES:
+            return self._original_sleep(seconds)
+        self.calls.append((frame.filename, frame.lineno, seconds))
+        if not self.skip_sleeps:
+            self._original_sleep(seconds)
+
+    def __enter__(self):
+        self._thread = threading.current_thread()
+        self._original_sleep = time.sleep
+        time.sleep = self._sleep
+        return self
+
+    def __exit__(self, *exc):
+        time.sleep = self._original_sleep
+
+    def per_script(self):
+        """Return {script: (number of sleeps, total seconds)}"""
+        totals = defaultdict(lambda: [0, 0.0])
+        for filename, _, seconds in self.calls:
+            totals[os.path.basename(filename)][0] += 1
+            totals[os.path.basename(filename)][1] += seconds
+        return {name: tuple(value) for name, value in totals.items()}
+
+    def report(self):
+        print("\n" + "=" * 50)
+        print("SLEEP AUDIT")
+        print("=" * 50)
+        if not self.calls:
+            print("No fixed sleeps recorded")
+            return
+        for name, (count, seconds) in sorted(self.per_script().items(), key=lambda item: -item[1][1]):
+            print(f"{name:<32} {count:>4} sleeps  {seconds:>8.2f}s")
+            for filename, lineno, duration in self.calls:
+                if os.path.basename(filename) == name:
+                    print(f"    line {lineno:<6} {duration:.2f}s")
+        total = sum(seconds for _, _, seconds in self.calls)
+        print(f"{'TOTAL':<32} {len(self.calls):>4} sleeps  {total:>8.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-driven waits utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    audit_parser = subparsers.add_parser("audit", help="report time spent in fixed sleeps")
+    audit_parser.add_argument("scripts", nargs="+")
+    audit_parser.add_argument("--skip-sleeps", action="store_true",
+                              help="record sleeps without actually sleeping")
+    args = parser.parse_args()
+
+    with SleepAudit(skip_sleeps=args.skip_sleeps) as audit:
+        for script in args.scripts:
+            try:
+                runpy.run_path(script, run_name="__main__")
+            except Exception as e:
+                print(f"{script} failed: {e}")
+    audit.report()
+
+
+if __name__ == "__main__":
+    main()
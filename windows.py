@@ -0,0 +1,153 @@
+"""
+Selenium Helpers: Window Registry
+Tracks tabs and windows from browser events instead of polling window_handles.
+
+Waiting for a new window usually means polling window_handles until the
+count changes, then comparing handle lists to find the new one, then
+switch_to.window + title + current_url to see what it is: a round trip for
+every poll and every read. A WindowRegistry listens to the browser's
+DevTools target events (see cdp_events.py) instead:
+
+- expect_new() hands back the handle of the window an action opened,
+  as soon as the browser reports it
+- titles and URLs are kept up to date from the events, so reading them
+  sends no command and needs no switch
+- open_tab() and close() open and close tabs in one DevTools command each
+
+Window handles in Chromium are DevTools target ids, so the handles the
+registry reports work with driver.switch_to.window().
+
+Usage:
+    windows = WindowRegistry(driver)
+    with windows.expect_new() as new:
+        link.click()
+    driver.switch_to.window(new.handle)
+    print(windows.title(new.handle), windows.url(new.handle))
+
+    tab = windows.open_tab("https://example.com")
+    windows.close(tab, switch_to=main)
+"""
+
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from cdp_events import cdp_events
+
+
+class NewWindow:
+    """Filled in with the new window's handle when an expect_new() block ends"""
+
+    handle = None
+
+
+class WindowRegistry:
+    """Open page targets of a browser, kept current by DevTools events"""
+
+    def __init__(self, driver, events=None):
+        self.driver = driver
+        self.events = events or cdp_events(driver)
+        self.windows = {}  # handle -> {"title", "url", "opener"}, in order of creation
+        self._opened = []  # every handle ever seen, in order of creation
+        self._changed = threading.Condition()
+        self._counts = {"opened": 0, "closed": 0, "updates": 0, "commands": 0}
+        target = self.events.devtools.target
+        self.events.on("target.TargetCreated", self._created)
+        self.events.on("target.TargetInfoChanged", self._info_changed)
+        self.events.on("target.TargetDestroyed", self._destroyed)
+        # Reports every existing target too, so the registry starts complete
+        self._send(target.set_discover_targets(discover=True))
+
+    # --- event callbacks (connection thread) --------------------------------
+
+    def _update(self, info):
+        if info.type_ != "page":
+            return False
+        handle = str(info.target_id)
+        with self._changed:
+            if handle not in self.windows:
+                if handle in self._opened:
+                    return False  # an info change arriving after the target was destroyed
+                self._opened.append(handle)
+                self._counts["opened"] += 1
+            self.windows[handle] = {"title": info.title, "url": info.url,
+                                    "opener": str(info.opener_id) if info.opener_id else None}
+            self._changed.notify_all()
+        return True
+
+    def _created(self, event):
+        self._update(event.target_info)
+
+    def _info_changed(self, event):
+        if self._update(event.target_info):
+            self._counts["updates"] += 1
+
+    def _destroyed(self, event):
+        with self._changed:
+            if self.windows.pop(str(event.target_id), None) is not None:
+                self._counts["closed"] += 1
+                self._changed.notify_all()
+
+    # --- reading ------------------------------------------------------------
+
+    def handles(self):
+        with self._changed:
+            return list(self.windows)
+
+    def title(self, handle):
+        return self.windows[handle]["title"]
+
+    def url(self, handle):
+        return self.windows[handle]["url"]
+
+    def wait_for(self, handle, condition, timeout=10):
+        """Wait until condition(info) is true for a window, e.g. lambda w: w["title"]"""
+        with self._changed:
+            if not self._changed.wait_for(lambda: handle in self.windows and condition(self.windows[handle]), timeout):
+                raise TimeoutException(f"Window {handle} did not reach the expected state in {timeout}s")
+            return dict(self.windows[handle])
+
+    @contextmanager
+    def expect_new(self, timeout=10):
+        """Block around an action that opens a window; its handle is set on exit"""
+        new = NewWindow()
+        with self._changed:
+            seen = len(self._opened)
+        yield new
+        with self._changed:
+            if not self._changed.wait_for(lambda: len(self._opened) > seen, timeout):
+                raise TimeoutException(f"No new window opened within {timeout}s")
+            new.handle = self._opened[seen]
+
+    # --- opening and closing ------------------------------------------------
+
+    def _send(self, command):
+        self._counts["commands"] += 1
+        return self.events.execute(command)
+
+    def open_tab(self, url="about:blank", switch=True, background=False):
+        """Open a tab (one command) and return its handle; switch to it unless switch=False"""
+        handle = str(self._send(self.events.devtools.target.create_target(url, background=background)))
+        with self._changed:
+            self._changed.wait_for(lambda: handle in self._opened, 5)
+        if switch:
+            self.driver.switch_to.window(handle)
+        return handle
+
+    def close(self, handle, switch_to=None, timeout=10):
+        """
+        Close a window (one command) and wait until it is gone. When it was
+        the driver's current window, pass switch_to: WebDriver needs a live
+        window before the next command.
+        """
+        self._send(self.events.devtools.target.close_target(self.events.devtools.target.TargetID(handle)))
+        with self._changed:
+            if not self._changed.wait_for(lambda: handle not in self.windows, timeout):
+                raise TimeoutException(f"Window {handle} still open after {timeout}s")
+        if switch_to is not None:
+            self.driver.switch_to.window(switch_to)
+
+    def stats(self):
+        counts = dict(self._counts)
+        counts["open"] = len(self.windows)
+        return counts